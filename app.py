@@ -1,33 +1,63 @@
 import streamlit as st
-import plotly.graph_objects as go
+import importlib
 import sys
 import os
 
+from utils.data_loader import load_all_data, watch_data_dir
+from utils.navigation import current_page, navigate
+from utils.render_timing import show_diagnostics, timed_page
+
 
 # Add the pages directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'pages'))
 
+# Page key -> module in pages/. Modules are imported on first navigation, not at
+# startup, so a session that only views the overview never loads matplotlib / scipy.
+PAGE_MODULES = {
+    'overview': 'overview',
+    'career': 'career',
+    'awards': 'awards',
+    'disciplinary': 'disciplinary_statistics',
+    'heatmap': 'heatmap',
+    'verdict': 'verdict',
+    'club': 'club',
+    'clutch': 'clutch',
+    'fame': 'fame',
+    'international': 'international',
+    'physical': 'physical',
+    'season': 'season',
+}
+_loaded_pages = {}
+
+# Navbar buttons, in display order (also the page labels of the static export)
+NAV_ITEMS = [
+    ('overview', 'Overview'),
+    ('career', 'Career Stats'),
+    ('awards', 'Awards'),
+    ('disciplinary', 'Fair Play'),
+    ('heatmap', 'Heat Maps'),
+    ('physical', 'Physical'),
+    ('clutch', 'Clutch'),
+    ('international', 'International'),
+    ('club', 'Clubs'),
+    ('fame', 'Fame'),
+    ('season', 'Seasons'),
+    ('verdict', 'Final Verdict')
+]
+
 # Import page modules with error handling
 def safe_import(module_name):
     try:
-        return __import__(module_name)
+        return importlib.import_module(module_name)
     except ImportError:
         return None
 
-# Import your page modules
-overview = safe_import('overview')
-career = safe_import('career')
-awards = safe_import('awards')
-disciplinary_statistics = safe_import('disciplinary_statistics')
-
-heatmap = safe_import('heatmap')
-verdict = safe_import('verdict')
-club = safe_import('club')
-clutch = safe_import('clutch')
-fame = safe_import('fame')
-international = safe_import('international')
-physical = safe_import('physical')
-season = safe_import('season')
+def load_page(page):
+    """Page module for a page key, imported on first use and cached (None if unavailable)"""
+    if page not in _loaded_pages:
+        module_name = PAGE_MODULES.get(page)
+        _loaded_pages[page] = safe_import(module_name) if module_name else None
+    return _loaded_pages[page]
 
 def main():
     """Main dashboard application with beautiful navbar"""
@@ -40,9 +70,12 @@ def main():
         initial_sidebar_state="collapsed"
     )
     
-    # Initialize session state - DEFAULT TO OVERVIEW
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = 'overview'
+    # Opt-in hot reload: re-ingest only the CSVs that changed since the last check
+    if os.environ.get("GOAT_WATCH_DATA") == "1":
+        watch_data_dir()
+    
+    # Selected page from ?page= (deep links) or the session - DEFAULT TO OVERVIEW
+    current_page(PAGE_MODULES)
     
     # Enhanced CSS for compact, clean styling
     st.markdown("""
@@ -361,10 +394,23 @@ def main():
     # Content area wrapper
     st.markdown('<div style="max-width: 1400px; margin: 0 auto; padding: 0 2rem;">', unsafe_allow_html=True)
     
-    # Route to the appropriate page
-    route_page()
+    # Route to the appropriate page; dataset accesses and render timings are attributed to it
+    page = st.session_state.current_page
+    with load_all_data().track(page), timed_page(page):
+        route_page()
     
     st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Which datasets have been loaded so far, and by which pages
+    with st.sidebar.expander("🗂️ Dataset cache"):
+        data = load_all_data()
+        st.dataframe(data.stats(), hide_index=True, use_container_width=True)
+        if data.last_reload is not None:
+            st.caption("Last hot reload (per dataset)")
+            st.dataframe(data.last_reload, hide_index=True, use_container_width=True)
+    
+    # Per-element render timing, only with ?diagnostics=1 (or GOAT_RENDER_TIMING=1)
+    show_diagnostics()
 
 def render_enhanced_navbar():
     """Render compact header and navbar with enhanced comparison sections"""
@@ -443,64 +489,27 @@ def render_enhanced_navbar():
     # Navigation section - clean and organized
     st.markdown("### 🧭 Explore the Debate")
     
-    # Navigation buttons
-    nav_items = [
-        ('overview', 'Overview'),
-        ('career', 'Career Stats'),
-        ('awards', 'Awards'),
-        ('disciplinary', 'Fair Play'),
-        ('heatmap', 'Heat Maps'),
-        ('physical', 'Physical'),
-        ('clutch', 'Clutch'),
-        ('international', 'International'),
-        ('club', 'Clubs'),
-        ('fame', 'Fame'),
-        ('season', 'Seasons'),
-        ('verdict', 'Final Verdict')
-    ]
-    
     # Create columns for navigation buttons
     cols = st.columns(6)
     
-    for i, (page_key, page_label) in enumerate(nav_items):
+    for i, (page_key, page_label) in enumerate(NAV_ITEMS):
         col_index = i % 6
         with cols[col_index]:
-            if st.button(page_label, key=f"nav_{page_key}", use_container_width=True):
-                st.session_state.current_page = page_key
-                st.rerun()
+            # Switch in the click callback so the click's own run renders the new page
+            st.button(page_label, key=f"nav_{page_key}", use_container_width=True,
+                      on_click=navigate, args=(page_key,))
 
 def route_page():
     """Route to the appropriate page"""
     page = st.session_state.current_page
     
     try:
-        if page == 'overview' and overview:
-            overview.show()
-        elif page == 'career' and career:
-            career.show()
-        elif page == 'awards' and awards:
-            awards.show()
-        elif page == 'disciplinary' and disciplinary_statistics:
-            disciplinary_statistics.show()
-        elif page == 'heatmap' and heatmap:
-            st.write("Loading heatmap page...")  # DEBUG
-            heatmap.show()
-        elif page == 'physical' and physical:
-            physical.show()
-        elif page == 'clutch' and clutch:
-            clutch.show()
-        elif page == 'international' and international:
-            international.show()
-        elif page == 'club' and club:
-            club.show()
-        elif page == 'fame' and fame:
-            fame.show()
-        elif page == 'season' and season:
-            season.show()
-        elif page == 'verdict' and verdict:
-            verdict.show()
+        module = load_page(page)
+        if module:
+            module.show()
         else:
             # Fallback to overview if page not found
+            overview = load_page('overview')
             if overview:
                 overview.show()
             else:
@@ -511,6 +520,7 @@ def route_page():
         st.info("Make sure the page file exists and has a 'show()' function.")
         
         # Show overview as fallback
+        overview = load_page('overview')
         if overview:
             st.info("Showing Overview page as fallback...")
             overview.show()
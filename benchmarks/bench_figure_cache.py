@@ -0,0 +1,77 @@
+"""
+Memoized Plotly figures: page render time with a cold vs warm figure cache.
+
+Runs each page with cached charts through AppTest --repeat times with the figure
+cache cleared before every run (its cached charts built, as before the cache), then
+--repeat times warm (those charts served from the cache), and reports
+  - median page run time cold / warm,
+  - figures cached, their JSON size, hits and misses,
+  - that every cached spec's JSON equals a freshly built figure's JSON.
+
+Usage:
+    python benchmarks/bench_figure_cache.py --repeat 5 --pages club fame verdict
+"""
+import argparse
+import os
+import sys
+import time
+from statistics import median
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import plotly.io as pio
+from streamlit.testing.v1 import AppTest
+
+import utils.figure_cache as figure_cache
+
+PAGES = ["club", "fame", "international", "physical", "verdict"]
+BUILDERS = {}
+_cached_figure = figure_cache.cached_figure
+
+
+def recording_cached_figure(chart_id, build, *data, **kwargs):
+    BUILDERS[chart_id] = (build, data)
+    return _cached_figure(chart_id, build, *data, **kwargs)
+
+
+def run_page(page):
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=300)
+    at.query_params["page"] = page
+    t0 = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - t0) * 1000
+    assert not at.exception, [e.value for e in at.exception]
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pages", nargs="+", default=PAGES)
+    args = parser.parse_args()
+    # Pages import cached_figure on first navigation, after this patch
+    figure_cache.cached_figure = recording_cached_figure
+
+    print(f"{'page':14s} {'cold ms':>8s} {'warm ms':>8s} {'speed-up':>8s} {'figures':>8s}")
+    for page in args.pages:
+        run_page(page)  # Page import and dataset loads out of the way
+        cold = []
+        for _ in range(args.repeat):
+            figure_cache.FIGURES.clear()
+            cold.append(run_page(page))
+        warm = [run_page(page) for _ in range(args.repeat)]
+        charts = sum(chart_id.startswith(page + ".") for chart_id in BUILDERS)
+        print(f"{page:14s} {median(cold):8.1f} {median(warm):8.1f} "
+              f"{median(cold) / median(warm):7.1f}x {charts:8d}")
+
+    mismatched = [chart_id for chart_id, (build, data) in BUILDERS.items()
+                  if pio.to_json(_cached_figure(chart_id, build, *data).to_dict(), validate=False)
+                  != pio.to_json(build(*data), validate=False)]
+    print(f"cache: {figure_cache.FIGURES.stats()}")
+    print(f"{len(BUILDERS) - len(mismatched)}/{len(BUILDERS)} cached specs match a fresh build")
+    assert not mismatched, mismatched
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Payload and latency of one widget interaction: full script rerun vs fragment rerun.
+
+For each fragment-isolated section (season explorer, awards / fair-play quizzes,
+GOAT poll) this opens the page through AppTest, changes the section's widget and
+reruns it twice:
+  - full:     the whole app.py, as every interaction did before the fragments,
+  - fragment: only the section's fragment, as the browser requests it now,
+recording wall time and the bytes of every ForwardMsg the run sends.
+AppTest always reruns the whole script, so the fragment run queues the fragment's
+id on the rerun the same way the frontend does.
+
+Usage:
+    python benchmarks/bench_fragments.py --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+from statistics import median
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import streamlit.testing.v1.local_script_runner as local_script_runner
+from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+from streamlit.testing.v1 import AppTest
+
+# page key, widget type, widget key or label, values to alternate between
+INTERACTIONS = [
+    ("season", "selectbox", "Select a season for detailed analysis:", ["2014-15", "2011-12"]),
+    ("awards", "radio", "awards_quiz", ["🇵🇹 Ronaldo with 5 awards", "🇦🇷 Messi with 8 awards"]),
+    ("disciplinary", "radio", "disciplinary_quiz",
+     ["🤝 Both have their moments", "🇦🇷 Messi - Model professional"]),
+    ("overview", "radio", "goat_poll", ["🇵🇹 Ronaldo", "🇦🇷 Messi"]),
+]
+
+SENT = [0]
+FRAGMENT_QUEUE = []
+_enqueue = ScriptRunContext.enqueue
+_RerunData = local_script_runner.RerunData
+
+
+def counting_enqueue(self, msg):
+    SENT[0] += msg.ByteSize()
+    return _enqueue(self, msg)
+
+
+def rerun_data(**kwargs):
+    """RerunData for AppTest's next run, scoped to FRAGMENT_QUEUE when set."""
+    return _RerunData(fragment_id_queue=list(FRAGMENT_QUEUE), **kwargs)
+
+
+def widget(at, kind, ref):
+    widgets = getattr(at, kind)
+    matches = [w for w in widgets if w.key == ref or w.label == ref]
+    return matches[0]
+
+
+def measure(at, kind, ref, value, fragment_ids):
+    widget(at, kind, ref).set_value(value)
+    FRAGMENT_QUEUE[:] = fragment_ids
+    SENT[0], t0 = 0, time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - t0
+    FRAGMENT_QUEUE.clear()
+    assert not at.exception, [e.value for e in at.exception]
+    return SENT[0], elapsed * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    ScriptRunContext.enqueue = counting_enqueue
+    local_script_runner.RerunData = rerun_data
+
+    print(f"{'section':14s} {'full KiB':>9s} {'frag KiB':>9s} {'full ms':>8s} {'frag ms':>8s} "
+          f"{'bytes saved':>11s} {'speed-up':>8s}")
+    for page, kind, ref, values in INTERACTIONS:
+        at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=300)
+        at.query_params["page"] = page
+        at.run()
+        fragment_ids = list(at._fragment_storage._fragments)
+        assert len(fragment_ids) == 1, f"{page}: expected one fragment, found {len(fragment_ids)}"
+
+        runs = {"full": [], "fragment": []}
+        for i in range(args.repeat):
+            value = values[i % len(values)]
+            runs["full"].append(measure(at, kind, ref, value, []))
+            value = values[(i + 1) % len(values)]
+            runs["fragment"].append(measure(at, kind, ref, value, fragment_ids))
+        full_b, full_ms = (median(r[k] for r in runs["full"]) for k in (0, 1))
+        frag_b, frag_ms = (median(r[k] for r in runs["fragment"]) for k in (0, 1))
+        print(f"{page:14s} {full_b / 1024:9.1f} {frag_b / 1024:9.1f} {full_ms:8.1f} {frag_ms:8.1f} "
+              f"{1 - frag_b / full_b:10.1%} {full_ms / frag_ms:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Minute / scoreline parsing at event-log scale.
+
+Compares a per-row Python parser with the vectorised stage used by GoalEventStore
+(Arrow regex kernels on plain strings, or one parse per category on categoricals)
+on synthetic columns like data/data.csv's Minute and Result ("90+5", "3:00", "1:2 AET").
+
+Usage:
+    python benchmarks/bench_goal_event_parsing.py --rows 1000000 10000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.goal_events import parse_minutes, parse_scorelines
+
+# Per-row baseline is only run up to this size, then extrapolated
+PYTHON_ROWS_CAP = 1_000_000
+
+
+def synthetic_columns(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    minute = rng.integers(1, 91, n).astype(str).astype(object)
+    extra = rng.random(n) < 0.08
+    minute[extra] = [f"{b}+{s}" for b, s in zip(np.where(rng.random(extra.sum()) < 0.5, 45, 90),
+                                                 rng.integers(1, 8, extra.sum()))]
+    home, away = rng.integers(0, 6, n), rng.integers(0, 6, n)
+    result = np.char.add(np.char.add(home.astype(str), ":0"), away.astype(str)).astype(object)
+    aet = rng.random(n) < 0.01
+    result[aet] = [f"{h}:{a} AET" for h, a in zip(home[aet], away[aet])]
+    return pd.Series(minute, dtype="string[pyarrow]"), pd.Series(result, dtype="string[pyarrow]")
+
+
+def python_parse(minutes, results):
+    """The obvious row-by-row version."""
+    out_min, out_stop, out_h, out_a = [], [], [], []
+    for m, r in zip(minutes, results):
+        base, _, stop = m.partition("+")
+        out_min.append(int(base))
+        out_stop.append(int(stop) if stop else 0)
+        h, a = r.split(" ")[0].split(":")
+        out_h.append(int(h))
+        out_a.append(int(a))
+    return out_min, out_stop, out_h, out_a
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>12s} {'python/row':>12s} {'arrow regex':>12s} {'categorical':>12s}")
+    for n in args.rows:
+        minutes, results = synthetic_columns(n)
+
+        cap = min(n, PYTHON_ROWS_CAP)
+        py_s = timed(lambda: python_parse(minutes[:cap], results[:cap])) * n / cap
+
+        vec_s = timed(lambda: (parse_minutes(minutes), parse_scorelines(results)))
+
+        # Categorical path, including the one-off category encoding
+        cat_s = timed(lambda: (parse_minutes(minutes.astype("category")),
+                               parse_scorelines(results.astype("category"))))
+
+        m, s = parse_minutes(minutes)
+        assert m[:cap].tolist() == python_parse(minutes[:cap], results[:cap])[0]
+        suffix = "*" if cap < n else " "
+        print(f"{n:12,d} {py_s:11.2f}s{suffix} {vec_s:11.2f}s {cat_s:11.2f}s")
+    print("* extrapolated from the first 1M rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Indexed goal-event queries vs boolean masks over the whole frame.
+
+Builds a synthetic event log shaped like data/data.csv (many players, full careers),
+then times a mix of filters through GoalEventStore.rows() and through the
+equivalent pandas masks.
+
+Usage:
+    python benchmarks/bench_goal_events.py --players 500 --goals 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.goal_events import GoalEventStore
+
+
+def synthetic_events(players: int, goals: int, seed: int = 0) -> pd.DataFrame:
+    """``players`` x ``goals`` rows with data.csv's raw column names."""
+    rng = np.random.default_rng(seed)
+    n = players * goals
+    comps = np.array(["LaLiga", "Premier League", "Serie A", "UEFA Champions League", "Copa del Rey"])
+    types = np.array(["Header", "Penalty", "Left-footed shot", "Right-footed shot", "Tap-in"])
+    opponents = np.array([f"Club {i}" for i in range(300)])
+    dates = pd.Timestamp("2002-08-01") + pd.to_timedelta(rng.integers(0, 20 * 365, n), unit="D")
+    years = dates.year - (dates.month < 8)
+    minutes = rng.integers(1, 91, n).astype(str)
+    return pd.DataFrame({
+        "Player": np.repeat([f"Player {i:04d}" for i in range(players)], goals),
+        "Season": [f"{y % 100:02d}/{(y + 1) % 100:02d}" for y in years],
+        "Competition": comps[rng.integers(0, len(comps), n)],
+        "Matchday": "1",
+        "Date": dates.strftime("%Y-%m-%d"),
+        "Venue": np.where(rng.random(n) < 0.5, "H", "A"),
+        "Club": "Club X",
+        "Opponent": opponents[rng.integers(0, len(opponents), n)],
+        "Result": "2:01",
+        "Playing_Position": "CF",
+        "Minute": minutes,
+        "At_score": "1:00",
+        "Type": types[rng.integers(0, len(types), n)],
+        "Goal_assist": "",
+    })
+
+
+def best_of(fn, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--goals", type=int, default=2000, help="goals per player")
+    args = parser.parse_args()
+
+    raw = synthetic_events(args.players, args.goals)
+    t0 = time.perf_counter()
+    store = GoalEventStore(raw)
+    build_ms = (time.perf_counter() - t0) * 1000
+    f = store.frame
+    print(f"{len(store):,} events, {args.players} players, store built in {build_ms:.0f} ms")
+
+    queries = {
+        "player": (dict(player="Player 0042"),
+                   lambda: f[f.player == "Player 0042"]),
+        "player + seasons": (dict(player="Player 0042", seasons=(2009, 2012)),
+                             lambda: f[(f.player == "Player 0042") & f.season_start.between(2009, 2012)]),
+        "competition + type": (dict(competition="LaLiga", goal_type="Header"),
+                               lambda: f[(f.competition == "LaLiga") & (f.type == "Header")]),
+        "player + opponent": (dict(player="Player 0042", opponent="Club 7"),
+                              lambda: f[(f.player == "Player 0042") & (f.opponent == "Club 7")]),
+    }
+    print(f"{'query':22s} {'indexed':>10s} {'mask':>10s}")
+    for name, (filters, mask) in queries.items():
+        assert store.count(**filters) == len(mask())
+        print(f"{name:22s} {best_of(lambda: store.rows(**filters)):8.3f}ms {best_of(mask):8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Heat Maps page time with cold vs warm rendered-image caches.
+
+Runs the real page through Streamlit's AppTest: a cold run after clearing every
+heat-map cache, then warm reruns that are served from the cached image bytes.
+The per-view rasterization cost (what st.pyplot paid on every rerun) is timed
+separately for reference.
+
+Usage:
+    python benchmarks/bench_heatmap_images.py --reruns 5
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'pages'))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from streamlit.testing.v1 import AppTest
+
+import heatmap
+
+
+def page_run(at):
+    t0 = time.perf_counter()
+    at.run()
+    assert not at.exception, [e.value for e in at.exception]
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reruns", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+
+    analyzer = heatmap.SoccerFieldHeatMap()
+    print(f"{'view':12s} {'rasterize':>10s} {'cached':>10s} {'bytes':>10s}")
+    for variant in heatmap.IMAGE_VARIANTS:
+        heatmap.clear_heatmap_cache()
+        t0 = time.perf_counter()
+        image = analyzer.render_image(variant)
+        cold_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        analyzer.render_image(variant)
+        warm_ms = (time.perf_counter() - t0) * 1000
+        print(f"{variant:12s} {cold_ms:8.1f}ms {warm_ms:8.3f}ms {len(image):10,d}")
+        plt.close('all')
+
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=120)
+    at.run()
+    at.session_state.current_page = 'heatmap'
+    heatmap.clear_heatmap_cache()
+    cold = page_run(at)
+    warm = min(page_run(at) for _ in range(args.reruns))
+    print(f"\nHeat Maps page: cold {cold:.0f} ms, warm {warm:.0f} ms (best of {args.reruns} reruns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Startup import cost, from ``python -X importtime``.
+
+Imports app.py (module level only, as ``streamlit run`` does before the first page
+renders) in a fresh interpreter, parses the importtime log and reports:
+  - total startup import time (best of --repeat runs),
+  - the heaviest top-level packages by self time,
+  - which of the known heavy packages got imported at startup,
+  - the extra import time each page costs on its first navigation.
+--json writes the same numbers to a file so they can be tracked over time.
+
+Usage:
+    python benchmarks/bench_import_time.py --repeat 3 --top 15 --json .cache/import_time.json
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+# Packages that should only load when a page actually needs them
+HEAVY = ("matplotlib", "scipy", "seaborn", "plotly.express")
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_log(statement):
+    """[(module, depth, self_us, cumulative_us)] for one fresh interpreter."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, len(indent) // 2, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def best_log(statement, repeat):
+    """The run with the smallest total, to damp disk-cache and scheduler noise."""
+    logs = [import_log(statement) for _ in range(repeat)]
+    return min(logs, key=lambda rows: sum(r[2] for r in rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    from app import PAGE_MODULES
+
+    rows = best_log("import app", args.repeat)
+    total_ms = sum(r[2] for r in rows) / 1000
+    by_package = defaultdict(int)
+    for module, _, self_us, _ in rows:
+        by_package[module.split(".")[0]] += self_us
+    imported = {r[0] for r in rows}
+    heavy = {name: any(m == name or m.startswith(name + ".") for m in imported) for name in HEAVY}
+
+    print(f"startup (import app): {total_ms:.0f} ms, {len(rows)} modules")
+    print(f"\n{'package':24s} {'self ms':>9s}")
+    for package, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"{package:24s} {us / 1000:9.1f}")
+    print("\nheavy packages at startup: " +
+          ", ".join(f"{name} {'YES' if loaded else 'no'}" for name, loaded in heavy.items()))
+
+    pages = {}
+    print(f"\n{'page':16s} {'first-navigation import ms':>28s}")
+    for page, module in PAGE_MODULES.items():
+        # Only modules not already loaded by app count towards the page's line
+        page_rows = best_log(f"import app, sys; sys.path.insert(0, 'pages'); import {module}", args.repeat)
+        entry = [r for r in page_rows if r[0] == module and r[1] == 0]
+        pages[page] = entry[-1][3] / 1000 if entry else 0.0
+        print(f"{page:16s} {pages[page]:28.1f}")
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w") as fh:
+            json.dump({"startup_ms": total_ms, "modules": len(rows),
+                       "packages_ms": {k: v / 1000 for k, v in by_package.items()},
+                       "heavy_at_startup": heavy, "pages_ms": pages}, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Pitch binning: np.histogram2d vs PitchGrid's bincount, in memory and streamed from files.
+
+Writes N positional CSV files (one per "match"), then times
+  - np.histogram2d over the full concatenated array (everything in memory),
+  - PitchGrid.add over the same array,
+  - bin_files streaming the files with 1 and --workers processes,
+  - adding one more match to a saved grid (incremental update).
+
+Usage:
+    python benchmarks/bench_pitch_grid.py --files 8 --rows 1000000 --workers 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.pitch_grid import PitchGrid, bin_files
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows per file")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files + 1):
+            xy = np.clip(rng.normal([70, 40], [25, 18], (args.rows, 2)), 0, [120, 80])
+            path = Path(tmp) / f"match_{i:03d}.csv"
+            pd.DataFrame({"x": xy[:, 0], "y": xy[:, 1]}).to_csv(path, index=False)
+            paths.append(path)
+        career, new_match = paths[:-1], paths[-1]
+
+        points = np.concatenate([pd.read_csv(p).to_numpy() for p in career])
+        edges = (np.linspace(0, 120, 50), np.linspace(0, 80, 50))
+        hist, hist_ms = timed(lambda: np.histogram2d(points[:, 0], points[:, 1], bins=edges)[0])
+        grid, grid_ms = timed(lambda: PitchGrid().add(points[:, 0], points[:, 1]))
+        assert np.array_equal(hist.T.astype(np.int64), grid.counts)
+        print(f"{len(points):,} points in memory: histogram2d {hist_ms:.0f} ms, bincount {grid_ms:.0f} ms")
+
+        for workers in (1, args.workers):
+            grids, ms = timed(lambda: bin_files(career, workers=workers))
+            assert np.array_equal(grids[()].counts, grid.counts)
+            print(f"streamed {len(career)} files, {workers} worker(s): {ms:.0f} ms")
+
+        saved = Path(tmp) / "career.npz"
+        grids[()].save(saved)
+        _, ms = timed(lambda: PitchGrid.load(saved).add_file(new_match))
+        print(f"incremental: one new match added to the saved grid in {ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
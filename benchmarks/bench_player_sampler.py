@@ -0,0 +1,65 @@
+"""
+Player-position sampling: per-center multivariate_normal loop vs the batched sampler.
+
+The loop is the original generate_player_data body (global np.random state, one
+multivariate_normal call per center, a growing Python list); the batched version is
+heatmap.sample_mixture (one preallocated array, one draw, in-place transforms).
+
+Usage:
+    python benchmarks/bench_player_sampler.py --points 1000 100000 1000000 10000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'pages'))
+
+from heatmap import PLAYER_STYLES, sample_mixture
+
+# The list-based baseline is only run up to this size, then extrapolated
+LOOP_POINTS_CAP = 1_000_000
+
+
+def loop_sampler(style, n_points):
+    np.random.seed(42)
+    all_points = []
+    for center, weight in zip(style['centers'], style['weights']):
+        points = np.random.multivariate_normal(center, style['cov'], int(n_points * weight))
+        all_points.extend(points)
+    points = np.array(all_points)
+    points[:, 0] = np.clip(points[:, 0], 0, 120)
+    points[:, 1] = np.clip(points[:, 1], 0, 80)
+    return points
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, nargs="+", default=[1_000, 100_000, 1_000_000, 10_000_000])
+    args = parser.parse_args()
+
+    style = PLAYER_STYLES['messi']
+    print(f"{'points':>12s} {'loop':>10s} {'batched':>10s}")
+    for n in args.points:
+        cap = min(n, LOOP_POINTS_CAP)
+        loop_s = timed(lambda: loop_sampler(style, cap)) * n / cap
+        rng = np.random.default_rng(42)
+        batch_s = timed(lambda: sample_mixture(style['centers'], style['weights'], style['cov'],
+                                               n, rng, (120, 80)))
+        suffix = "*" if cap < n else " "
+        print(f"{n:12,d} {loop_s * 1000:8.1f}ms{suffix} {batch_s * 1000:8.1f}ms")
+    print("* extrapolated from the first 1M points")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Worker start-up time and memory: private CSV loads vs the shared Arrow buffers.
+
+Starts N worker processes in each mode, has every worker load and touch all
+datasets, and reports per-worker load time plus Rss / Pss from
+/proc/self/smaps_rollup (Linux). Pss splits shared pages between the processes
+mapping them, so in shared mode it should fall as the worker count grows.
+
+Usage:
+    python benchmarks/bench_shared_datasets.py --workers 4 --rows 200000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+WORKER = r"""
+import os, sys, time
+sys.path.insert(0, {root!r})
+from utils.data_loader import open_datasets, LazyDatasets
+from utils.shared_datasets import shared_loaders
+t0 = time.perf_counter()  # Imports excluded: identical in both modes
+shared = shared_loaders({shared!r}) if {shared!r} else None
+data = LazyDatasets(*shared) if shared else open_datasets({data!r})
+frames = [data[k] for k in data]
+ready_ms = (time.perf_counter() - t0) * 1000
+for df in frames:  # Touch every column so the pages are really resident
+    for col in df.columns:
+        df[col].iloc[-1:] if len(df) else None
+        if df[col].dtype.kind in "if":
+            df[col].sum()
+rollup = dict(line.split(":")[:2] for line in open("/proc/self/smaps_rollup").read().splitlines()[1:])
+print(ready_ms, int(rollup["Rss"].split()[0]), int(rollup["Pss"].split()[0]))
+sys.stdout.flush()
+sys.stdin.read()  # Stay alive until every worker has measured
+"""
+
+
+def run_workers(n, data_dir, shared_dir, snapshot_dir):
+    env = dict(os.environ, GOAT_SNAPSHOT_DIR=str(snapshot_dir))
+    code = WORKER.format(root=str(ROOT), shared=str(shared_dir or ""), data=str(data_dir))
+    procs = [subprocess.Popen([sys.executable, "-c", code], stdin=subprocess.PIPE,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env, text=True)
+             for _ in range(n)]
+    results = [tuple(float(x) for x in p.stdout.readline().split()) for p in procs]
+    time.sleep(0.2)
+    # Re-read Pss now that every worker has mapped the files
+    pss = [int(dict(line.split(":")[:2] for line in
+                    open(f"/proc/{p.pid}/smaps_rollup").read().splitlines()[1:])["Pss"].split()[0])
+           for p in procs]
+    for p in procs:
+        p.stdin.close()
+        p.wait()
+    return [(ready, rss, final_pss) for (ready, rss, _), final_pss in zip(results, pss)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rows", type=int, default=100000, help="tile each CSV to this many rows")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        data_dir, shared_dir, snap_dir = tmp / "data", tmp / "shared", tmp / "snapshots"
+        data_dir.mkdir()
+        os.environ["GOAT_SNAPSHOT_DIR"] = str(snap_dir)  # Read at import time
+
+        from bench_snapshot_cache import tile_csvs
+        from utils.data_loader import open_datasets
+        from utils.shared_datasets import publish
+
+        tile_csvs(data_dir, args.rows)
+        publish(shared_dir, open_datasets(data_dir))  # Also warms the snapshot cache
+
+        for label, shared in (("private (snapshot per worker)", None), ("shared Arrow buffers", shared_dir)):
+            results = run_workers(args.workers, data_dir, shared, snap_dir)
+            ready = sum(r[0] for r in results) / len(results)
+            rss = sum(r[1] for r in results) / 1024
+            pss = sum(r[2] for r in results) / 1024
+            print(f"{label:30s} ready {ready:8.1f} ms/worker   "
+                  f"total Rss {rss:8.1f} MiB   total Pss {pss:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
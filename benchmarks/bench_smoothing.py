@@ -0,0 +1,63 @@
+"""
+Heat-map smoothing backends across grid sizes and stack depths.
+
+Times every backend in utils.smoothing on random grids, reports the max error
+against scipy's gaussian_filter, and marks the fastest exact backend per size
+(the same choice smooth(..., backend="auto") makes at runtime).
+
+Usage:
+    python benchmarks/bench_smoothing.py --sizes 49x49 120x80 480x320 --stack 1 24 --sigma 1.5 6
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.smoothing import BACKENDS, EXACT_BACKENDS, smooth_gaussian
+
+
+def best_of(fn, repeat=5):
+    fn()  # Warm kernel caches
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", default=["49x49", "120x80", "240x160", "480x320"])
+    parser.add_argument("--stack", type=int, nargs="+", default=[1, 24], help="grids smoothed per call")
+    parser.add_argument("--sigma", type=float, nargs="+", default=[1.5, 6.0])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    header = " ".join(f"{name:>10s}" for name in BACKENDS)
+    print(f"{'grid':>16s} {'sigma':>6s} {header}   fastest exact   box max err")
+    for size in args.sizes:
+        nx, ny = (int(v) for v in size.split("x"))
+        for depth in args.stack:
+            shape = (ny, nx) if depth == 1 else (depth, ny, nx)
+            grid = rng.poisson(3.0, shape).astype(np.float64)
+            for sigma in args.sigma:
+                reference = smooth_gaussian(grid, sigma)
+                times = {}
+                for name, fn in BACKENDS.items():
+                    times[name] = best_of(lambda: fn(grid, sigma))
+                    if name in EXACT_BACKENDS:
+                        assert np.allclose(fn(grid, sigma), reference, atol=1e-9), name
+                box_err = np.abs(BACKENDS["box"](grid, sigma) - reference).max()
+                fastest = min(EXACT_BACKENDS, key=times.get)
+                label = size if depth == 1 else f"{depth}x{size}"
+                cells = " ".join(f"{times[name]:8.2f}ms" for name in BACKENDS)
+                print(f"{label:>16s} {sigma:6.1f} {cells}   {fastest:>13s}   {box_err:11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Cold-start vs warm-start benchmark for the Arrow snapshot cache.
+
+Cold  = pd.read_csv + make_arrow_safe (what every new worker used to do)
+Plan  = pd.read_csv + the persisted dtype plan (a refreshed CSV with no snapshot yet)
+Warm  = memory-map the snapshot written by the first load
+
+Usage:
+    python benchmarks/bench_snapshot_cache.py              # the real ./data files
+    python benchmarks/bench_snapshot_cache.py --rows 200000  # each CSV tiled to N rows
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.data_loader import make_arrow_safe
+from utils.dtype_plan import planned
+from utils.snapshot_cache import read_csv_cached
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def tile_csvs(target: Path, rows: int):
+    """Copy every CSV into ``target``, repeating its rows until it has ``rows`` rows."""
+    for src in sorted(DATA_DIR.glob("*.csv")):
+        df = pd.read_csv(src)
+        if len(df) == 0:
+            continue
+        reps = max(1, rows // len(df))
+        pd.concat([df] * reps, ignore_index=True).to_csv(target / src.name, index=False)
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=0, help="tile each CSV to this many rows")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        src_dir = DATA_DIR
+        if args.rows:
+            src_dir = tmp / "data"
+            src_dir.mkdir()
+            tile_csvs(src_dir, args.rows)
+        cache_dir = tmp / "snapshots"
+        csvs = sorted(src_dir.glob("*.csv"))
+
+        def cold():
+            for p in csvs:
+                make_arrow_safe(pd.read_csv(p))
+
+        def plan():
+            for p in csvs:
+                planned(pd.read_csv(p), p.stem, cache_dir=cache_dir)
+
+        def warm():
+            for p in csvs:
+                read_csv_cached(p, make_arrow_safe, cache_dir=cache_dir)
+
+        warm()  # First load writes the snapshots
+        plan()  # ... and the dtype plans
+        cold_s = timed(cold, args.repeat)
+        plan_s = timed(plan, args.repeat)
+        warm_s = timed(warm, args.repeat)
+
+    print(f"files: {len(csvs)}  rows/file: {args.rows or 'as shipped'}")
+    print(f"cold (read_csv + make_arrow_safe): {cold_s * 1000:9.2f} ms")
+    print(f"plan (read_csv + persisted plan):  {plan_s * 1000:9.2f} ms")
+    print(f"warm (memory-mapped snapshot):     {warm_s * 1000:9.2f} ms")
+    print(f"speed-up: {cold_s / warm_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
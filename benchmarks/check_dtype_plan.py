@@ -0,0 +1,64 @@
+"""
+Dtype plans never change values, on first inference or when reused on a refreshed CSV.
+
+Each case infers and saves a plan from a first version of a frame, then runs
+``planned`` on a refreshed version (as a CSV refresh or hot reload does) and checks
+  - every value survives: refreshed floats are not truncated by an old int64 plan,
+  - the plan was re-inferred when the refreshed data no longer fit it,
+  - datetimes stay datetimes and whole-valued floats with gaps become Int64.
+
+Usage:
+    python benchmarks/check_dtype_plan.py
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+
+from utils.dtype_plan import load_plan, planned
+
+# name, first version, refreshed version, expected dtype of "b" after the refresh
+CASES = [
+    ("floats become fractional", pd.DataFrame({"b": [1.0, 2.0]}), pd.DataFrame({"b": [1.5, 2.7]}), "float64"),
+    ("numeric text becomes fractional", pd.DataFrame({"b": ["1", "2"]}), pd.DataFrame({"b": ["1", "2.5"]}),
+     "float64"),
+    ("floats stay whole", pd.DataFrame({"b": [1.0, 2.0]}), pd.DataFrame({"b": [3.0, 4.0]}), "int64"),
+    ("whole floats with gaps", pd.DataFrame({"b": [1.0, np.nan]}), pd.DataFrame({"b": [2.0, np.nan]}), "Int64"),
+    ("datetimes", pd.DataFrame({"b": pd.to_datetime(["2020-01-01", None])}),
+     pd.DataFrame({"b": pd.to_datetime(["2021-06-01", "2022-01-01"])}), "datetime64"),
+]
+
+
+def same_values(before: pd.Series, after: pd.Series) -> bool:
+    if pd.api.types.is_datetime64_any_dtype(before):
+        return pd.api.types.is_datetime64_any_dtype(after) and before.equals(after.astype(before.dtype))
+    return np.allclose(pd.to_numeric(before).astype(float), after.astype(float), equal_nan=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for i, (label, first, refreshed, expected) in enumerate(CASES):
+            name = f"case{i}"
+            planned(first, name, cache_dir=cache_dir)
+            out = planned(refreshed, name, cache_dir=cache_dir)
+            dtype = str(out["b"].dtype)
+            ok = same_values(refreshed["b"], out["b"]) and dtype.startswith(expected)
+            print(f"{label:32s} plan {load_plan(name, cache_dir)['b']:16s} -> {dtype:16s} {'ok' if ok else 'FAIL'}")
+            results.append(ok)
+
+    print(f"{sum(results)}/{len(results)} refreshes kept every value")
+    assert all(results), "a dtype plan changed values"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Script executions per navigation, via Streamlit's AppTest.
+
+Counts how many times app.py runs (one utils.navigation.current_page call per run) for
+  - the initial load, and a deep link (?page=<key>) straight to each page,
+  - a click on every navbar button in turn,
+and checks that each interaction is exactly one run, that the clicked page is
+the one rendered, and that the URL's ?page= follows the click.
+
+Usage:
+    python benchmarks/check_navigation_runs.py --pages overview career heatmap
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+import utils.navigation as navigation
+from app import PAGE_MODULES
+
+RUNS = [0]
+_current_page = navigation.current_page
+
+
+def counting_current_page(pages):
+    RUNS[0] += 1
+    return _current_page(pages)
+
+
+def counted(action):
+    """(script runs, seconds) for one interaction."""
+    before, t0 = RUNS[0], time.perf_counter()
+    action()
+    return RUNS[0] - before, time.perf_counter() - t0
+
+
+def check(at, page, runs, seconds, label):
+    errors = [e.value for e in at.exception]
+    ok = runs == 1 and at.session_state.current_page == page and at.query_params.get("page") == page
+    print(f"{label:28s} runs {runs}   {seconds * 1000:7.0f} ms   {'ok' if ok and not errors else 'FAIL'}")
+    assert not errors, errors
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", nargs="+", default=list(PAGE_MODULES), help="page keys to visit")
+    args = parser.parse_args()
+    # app.py re-imports current_page from the module on every run
+    navigation.current_page = counting_current_page
+
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=300)
+    results = [check(at, 'overview', *counted(at.run), "initial load")]
+    for page in args.pages:
+        runs, seconds = counted(lambda: at.button(key=f"nav_{page}").click().run())
+        results.append(check(at, page, runs, seconds, f"click {page}"))
+
+    for page in args.pages:
+        linked = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=300)
+        linked.query_params["page"] = page
+        results.append(check(linked, page, *counted(linked.run), f"deep link ?page={page}"))
+
+    print(f"{sum(results)}/{len(results)} interactions rendered the right page in one run")
+    assert all(results), "some interaction took more than one script run or showed the wrong page"
+
+
+if __name__ == "__main__":
+    main()
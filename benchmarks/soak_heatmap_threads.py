@@ -0,0 +1,104 @@
+"""
+Soak test: render the heat-map figures from many concurrent threads.
+
+Streamlit runs each session's script in its own thread of one process. This starts
+--threads workers that repeatedly build and rasterize every matplotlib heat-map
+view (bypassing the image cache, so every round really draws), then checks that
+  - every thread's PNG bytes match a single-threaded reference (no cross-session
+    interference through shared pyplot / rcParams state),
+  - pyplot's figure manager never holds a figure,
+  - resident memory stays flat from round to round (no leaked figures).
+With --page, each thread also runs the full Heat Maps page through AppTest.
+
+Usage:
+    python benchmarks/soak_heatmap_threads.py --threads 50 --rounds 5
+"""
+import argparse
+import ctypes
+import gc
+import io
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'pages'))
+
+import matplotlib.pyplot as plt
+
+import heatmap
+
+# Allowed RSS growth between the first and last measured rounds
+MAX_GROWTH_MB = 40
+
+
+def rss_mb():
+    try:  # Return freed arena memory to the OS so RSS reflects live objects (glibc)
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except OSError:
+        pass
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+def render_all(dpi):
+    """Every view drawn from scratch, encoded, and the figures dropped."""
+    analyzer = heatmap.SoccerFieldHeatMap()
+    images = {}
+    for variant in heatmap.IMAGE_VARIANTS:
+        if variant == 'stats':
+            fig, _ = analyzer.create_stats_summary()
+        else:
+            fig = getattr(analyzer, heatmap.IMAGE_VARIANTS[variant])()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi)
+        images[variant] = buffer.getvalue()
+    return images
+
+
+def render_page(_):
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=300)
+    at.session_state.current_page = 'heatmap'
+    at.run()
+    return [e.value for e in at.exception]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--dpi", type=int, default=40, help="low by default to keep rounds quick")
+    parser.add_argument("--page", action="store_true", help="also run the page via AppTest per thread")
+    args = parser.parse_args()
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+
+    reference = render_all(args.dpi)
+    samples = []
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        for round_no in range(args.rounds):
+            t0 = time.perf_counter()
+            results = list(pool.map(lambda _: render_all(args.dpi), range(args.threads)))
+            mismatched = sum(result != reference for result in results)
+            errors = list(pool.map(render_page, range(args.threads))) if args.page else []
+            del results
+            gc.collect()
+            samples.append(rss_mb())
+            print(f"round {round_no + 1}: {args.threads} threads in {time.perf_counter() - t0:5.1f} s, "
+                  f"rss {samples[-1]:7.1f} MiB, mismatched renders {mismatched}, "
+                  f"pyplot figures {len(plt.get_fignums())}")
+            assert mismatched == 0, "a thread's figure differs from the single-threaded render"
+            assert not any(errors), errors
+            assert not plt.get_fignums(), "figures were registered with pyplot"
+
+    # Round 1 pays for allocator / font-cache warm-up; compare the later rounds
+    growth = samples[-1] - samples[min(1, len(samples) - 1)]
+    print(f"rss growth after warm-up: {growth:+.1f} MiB (limit {MAX_GROWTH_MB} MiB)")
+    assert growth < MAX_GROWTH_MB, "memory keeps growing across rounds"
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,31 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 from utils.data_loader import load_all_data
+from utils.render_timing import timed
+
+@st.fragment
+def awards_quiz():
+    """Ballon d'Or quiz; reruns on its own when answered"""
+    st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🎮 Awards Knowledge Quiz</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        quiz_question = st.radio(
+            "Who has won more Ballon d'Or awards?",
+            ["🇦🇷 Messi with 8 awards", "🇵🇹 Ronaldo with 5 awards", "🤝 They're tied"],
+            key="awards_quiz"
+        )
+        
+        if quiz_question:
+            if "Messi" in quiz_question:
+                st.success("🇦🇷 Correct! Messi has a record-breaking 8 Ballon d'Or awards!")
+            elif "Ronaldo" in quiz_question:
+                st.info("🇵🇹 Ronaldo has 5, but Messi leads with 8 Ballon d'Or awards!")
+            else:
+                st.warning("🤝 Not quite! Messi clearly leads 8-5 in Ballon d'Or awards!")
 
 def show():
     """Display the visual awards analysis page"""
@@ -237,7 +259,8 @@ def show():
         height=500,
         font=dict(size=14, family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Ballon d'Or Timeline
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🥇 BALLON D\'OR TIMELINE</h2>', unsafe_allow_html=True)
@@ -372,7 +395,8 @@ def show():
         hovermode='closest',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Awards breakdown by category
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🎯 AWARDS BREAKDOWN BY CATEGORY</h2>', unsafe_allow_html=True)
@@ -413,7 +437,8 @@ def show():
             xaxis_tickangle=-45,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Awards by decade pie chart
@@ -440,7 +465,8 @@ def show():
             )],
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # League vs International awards
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🏟️ LEAGUE VS INTERNATIONAL AWARDS</h2>', unsafe_allow_html=True)
@@ -482,7 +508,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown(f"""
@@ -559,7 +586,8 @@ def show():
         hovermode='x unified',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # NEW IMPROVED FINAL AWARDS VERDICT - Using Streamlit native components
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🏁 AWARDS VERDICT</h2>', unsafe_allow_html=True)
@@ -805,25 +833,8 @@ def show():
     cement his status as the most decorated player in football history.
     """)
     
-    # Interactive awards quiz
-    st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🎮 Awards Knowledge Quiz</h3>', unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns([1, 2, 1])
-    
-    with col2:
-        quiz_question = st.radio(
-            "Who has won more Ballon d'Or awards?",
-            ["🇦🇷 Messi with 8 awards", "🇵🇹 Ronaldo with 5 awards", "🤝 They're tied"],
-            key="awards_quiz"
-        )
-        
-        if quiz_question:
-            if "Messi" in quiz_question:
-                st.success("🇦🇷 Correct! Messi has a record-breaking 8 Ballon d'Or awards!")
-            elif "Ronaldo" in quiz_question:
-                st.info("🇵🇹 Ronaldo has 5, but Messi leads with 8 Ballon d'Or awards!")
-            else:
-                st.warning("🤝 Not quite! Messi clearly leads 8-5 in Ballon d'Or awards!")
+    # Interactive awards quiz - a fragment, so answering reruns only the quiz
+    awards_quiz()
     
     # Navigation
     st.markdown("""
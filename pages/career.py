@@ -1,9 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 from utils.data_loader import load_all_data
+from utils.match_log_summary import match_log_summary
+from utils.render_timing import timed
 
 def show():
     """Display the visual career statistics page"""
@@ -239,7 +240,8 @@ def show():
             showlegend=True,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Efficiency radar chart
@@ -271,7 +273,8 @@ def show():
             height=400,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Season Goals Timeline - Enhanced
     st.markdown("### 📈 GOALS BY SEASON")
@@ -319,7 +322,8 @@ def show():
         hovermode='x unified',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Skills Comparison - Visual Grid
     col1, col2, col3 = st.columns(3)
@@ -358,7 +362,8 @@ def show():
             height=400,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Creative Stats
@@ -390,7 +395,8 @@ def show():
             height=400,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         # Efficiency Metrics
@@ -424,7 +430,8 @@ def show():
             yaxis=dict(range=[0, 100]),
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Age Performance Analysis
     st.markdown("### ⏰ PERFORMANCE BY AGE")
@@ -461,7 +468,8 @@ def show():
             yaxis_title="Goals per Season",
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Milestone Ages
@@ -494,7 +502,57 @@ def show():
             yaxis_title="Goals",
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Per-90 output from the match-by-match logs (pre-aggregated summary table)
+    st.markdown("### 🧮 PER-90 OUTPUT FROM MATCH LOGS")
+    
+    per_player = match_log_summary("player")
+    if per_player.empty:
+        st.info("No match-by-match logs available yet.")
+    else:
+        rate_cols = ['goals_per90', 'assists_per90', 'shots_per90', 'xG_per90']
+        rate_labels = ['Goals/90', 'Assists/90', 'Shots/90', 'xG/90']
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = go.Figure()
+            for _, row in per_player.iterrows():
+                is_messi = 'Messi' in row['player']
+                fig.add_trace(go.Bar(
+                    x=rate_labels,
+                    y=[row[c] for c in rate_cols],
+                    name=('🇦🇷 ' if is_messi else '🇵🇹 ') + row['player'],
+                    marker_color=MESSI_COLOR if is_messi else RONALDO_COLOR
+                ))
+            fig.update_layout(
+                title="📊 Per-90 Rates",
+                barmode='group',
+                height=400,
+                font=dict(family='Times New Roman')
+            )
+            with timed(figure=fig):
+                st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                x=per_player['player'],
+                y=per_player['xG_delta'],
+                marker_color=[MESSI_COLOR if 'Messi' in p else RONALDO_COLOR for p in per_player['player']],
+                text=[f"{v:+.2f}" for v in per_player['xG_delta']],
+                textposition='auto'
+            ))
+            fig.update_layout(
+                title="🎯 Goals minus xG (finishing over expectation)",
+                height=400,
+                yaxis_title="Goals - xG",
+                font=dict(family='Times New Roman')
+            )
+            with timed(figure=fig):
+                st.plotly_chart(fig, use_container_width=True)
     
     # Head-to-Head Visual Summary
     st.markdown("### 🏆 HEAD-TO-HEAD SUMMARY")
@@ -525,7 +583,8 @@ def show():
             yaxis=dict(title=""),
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Tied categories
@@ -549,7 +608,8 @@ def show():
             xaxis=dict(visible=False),
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         # Ronaldo wins
@@ -573,7 +633,8 @@ def show():
             xaxis=dict(visible=False),
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Final Visual Verdict
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -608,7 +669,8 @@ def show():
             height=500,
             font=dict(size=14, family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     
 if __name__ == "__main__":
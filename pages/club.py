@@ -1,9 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 from utils.data_loader import load_all_data
+from utils.figure_cache import cached_figure
+from utils.render_timing import timed
 
 def show():
     """Display the club performance analysis page"""
@@ -53,7 +54,8 @@ def show():
             textfont=dict(family='Times New Roman')
         ))
         fig.update_layout(height=400, showlegend=True, font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
         
         # Quick stats
         st.markdown("""
@@ -76,7 +78,8 @@ def show():
             textfont=dict(family='Times New Roman')
         ))
         fig.update_layout(height=400, showlegend=True, font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
         
         # Quick stats
         st.markdown("""
@@ -117,7 +120,8 @@ def show():
         template='plotly_white',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Radar Chart - Club Performance Metrics
     st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🕸️ Performance Radar</h3>', unsafe_allow_html=True)
@@ -157,7 +161,8 @@ def show():
         height=500,
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Goals Timeline with Club Changes
     st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">📈 Career Goals Timeline</h3>', unsafe_allow_html=True)
@@ -166,47 +171,51 @@ def show():
     messi_goals = [6, 8, 17, 16, 38, 47, 60, 73, 60, 41, 58, 54, 45, 51, 36, 31, 30, 35, 16, 21]
     ronaldo_goals = [6, 9, 23, 42, 33, 40, 60, 55, 51, 61, 48, 50, 44, 42, 28, 37, 31, 29, 24, 14]
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=seasons,
-        y=messi_goals,
-        mode='lines+markers',
-        name='Messi',
-        line=dict(color=MESSI_COLOR, width=4),
-        marker=dict(size=8, color=MESSI_COLOR),
-        fill='tonexty'
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=seasons,
-        y=ronaldo_goals,
-        mode='lines+markers',
-        name='Ronaldo',
-        line=dict(color=RONALDO_COLOR, width=4),
-        marker=dict(size=8, color=RONALDO_COLOR),
-        fill='tozeroy'
-    ))
-    
-    # Add transfer annotations
-    fig.add_vline(x=2009, line_dash="dash", line_color=RONALDO_COLOR, annotation_text="Ronaldo → Real", 
-                  annotation=dict(font=dict(family='Times New Roman')))
-    fig.add_vline(x=2018, line_dash="dash", line_color=RONALDO_COLOR, annotation_text="Ronaldo → Juventus",
-                  annotation=dict(font=dict(family='Times New Roman')))
-    fig.add_vline(x=2021, line_dash="dash", line_color=MESSI_COLOR, annotation_text="Messi → PSG",
-                  annotation=dict(font=dict(family='Times New Roman')))
-    fig.add_vline(x=2023, line_dash="dash", line_color=MESSI_COLOR, annotation_text="Messi → Miami",
-                  annotation=dict(font=dict(family='Times New Roman')))
-    
-    fig.update_layout(
-        title="⚽ Goals per Season with Club Changes",
-        xaxis_title="Season",
-        yaxis_title="Goals",
-        height=500,
-        template='plotly_white',
-        font=dict(family='Times New Roman')
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    def goals_per_season_figure():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=seasons,
+            y=messi_goals,
+            mode='lines+markers',
+            name='Messi',
+            line=dict(color=MESSI_COLOR, width=4),
+            marker=dict(size=8, color=MESSI_COLOR),
+            fill='tonexty'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=seasons,
+            y=ronaldo_goals,
+            mode='lines+markers',
+            name='Ronaldo',
+            line=dict(color=RONALDO_COLOR, width=4),
+            marker=dict(size=8, color=RONALDO_COLOR),
+            fill='tozeroy'
+        ))
+        
+        # Add transfer annotations
+        fig.add_vline(x=2009, line_dash="dash", line_color=RONALDO_COLOR, annotation_text="Ronaldo → Real", 
+                      annotation=dict(font=dict(family='Times New Roman')))
+        fig.add_vline(x=2018, line_dash="dash", line_color=RONALDO_COLOR, annotation_text="Ronaldo → Juventus",
+                      annotation=dict(font=dict(family='Times New Roman')))
+        fig.add_vline(x=2021, line_dash="dash", line_color=MESSI_COLOR, annotation_text="Messi → PSG",
+                      annotation=dict(font=dict(family='Times New Roman')))
+        fig.add_vline(x=2023, line_dash="dash", line_color=MESSI_COLOR, annotation_text="Messi → Miami",
+                      annotation=dict(font=dict(family='Times New Roman')))
+        
+        fig.update_layout(
+            title="⚽ Goals per Season with Club Changes",
+            xaxis_title="Season",
+            yaxis_title="Goals",
+            height=500,
+            template='plotly_white',
+            font=dict(family='Times New Roman')
+        )
+        return fig
+    fig = cached_figure("club.goals_per_season", goals_per_season_figure)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Champions League Performance
     st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🏆 Champions League Stats</h3>', unsafe_allow_html=True)
@@ -227,7 +236,8 @@ def show():
                                    'thickness': 0.75, 'value': 5}}
         ))
         fig.update_layout(height=250, title="🇵🇹 Ronaldo", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         fig = go.Figure(go.Indicator(
@@ -243,7 +253,8 @@ def show():
                                    'thickness': 0.75, 'value': 4}}
         ))
         fig.update_layout(height=250, title="🇦🇷 Messi", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         fig = go.Figure(go.Indicator(
@@ -259,7 +270,8 @@ def show():
                                    'thickness': 0.75, 'value': 140}}
         ))
         fig.update_layout(height=250, title="🇵🇹 Ronaldo", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col4:
         fig = go.Figure(go.Indicator(
@@ -275,7 +287,8 @@ def show():
                                    'thickness': 0.75, 'value': 129}}
         ))
         fig.update_layout(height=250, title="🇦🇷 Messi", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Trophies Comparison
     st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🏅 Trophy Comparison</h3>', unsafe_allow_html=True)
@@ -311,7 +324,8 @@ def show():
         template='plotly_white',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Club Performance Heatmap
     st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🔥 Performance Heatmap</h3>', unsafe_allow_html=True)
@@ -345,7 +359,8 @@ def show():
         height=400,
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Adaptation Score Visualization
     st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🔄 Adaptation vs Loyalty</h3>', unsafe_allow_html=True)
@@ -382,7 +397,8 @@ def show():
             yaxis=dict(range=[5, 11]),
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # League success comparison
@@ -412,7 +428,8 @@ def show():
             xaxis_tickangle=-45,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Final Verdict with custom design
     st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🏁 Final Verdict</h3>', unsafe_allow_html=True)
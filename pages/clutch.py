@@ -1,9 +1,9 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from utils.render_timing import timed
 
 def show():
     """Display visual clutch performance analysis"""
@@ -221,7 +221,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Clutch radar chart
@@ -255,7 +256,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Finals performance visualization
     st.markdown('## 🏆 Finals Performance')
@@ -287,7 +289,8 @@ def show():
         ), row=1, col=2)
         
         fig.update_layout(height=400, title_text="Finals Win Rate", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Goals in finals by competition
@@ -322,7 +325,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         # Finals timeline
@@ -356,7 +360,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Penalty analysis
     st.markdown('## 🎯 Penalty Performance')
@@ -400,7 +405,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Penalty shootout records
@@ -427,7 +433,8 @@ def show():
         ), row=1, col=2)
         
         fig.update_layout(height=400, title_text="Penalty Shootout Records", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Last minute and clutch timeline
     st.markdown('## ⏰ Last Minute & Career Trends')
@@ -467,7 +474,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Clutch performance timeline
@@ -501,7 +509,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Pressure situations heatmap
     st.markdown('## 🌡️ Pressure Performance Heatmap')
@@ -530,7 +539,8 @@ def show():
         template='plotly_white',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Final comparison charts
     st.markdown('## 🏆 Final Comparison')
@@ -570,7 +580,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Winner pie chart
@@ -592,7 +603,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Summary metrics with custom design
     st.markdown('## 🎯 Clutch Performance Summary')
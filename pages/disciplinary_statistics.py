@@ -1,9 +1,32 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 from utils.data_loader import load_all_data
+from utils.match_log_summary import match_log_summary
+from utils.render_timing import timed
+
+@st.fragment
+def disciplinary_quiz():
+    """Fair-play quiz; reruns on its own when answered"""
+    st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🎮 Disciplinary Knowledge Quiz</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        quiz_question = st.radio(
+            "Who has the better disciplinary record?",
+            ["🇦🇷 Messi - Model professional", "🇵🇹 Ronaldo - Passionate competitor", "🤝 Both have their moments"],
+            key="disciplinary_quiz"
+        )
+        
+        if quiz_question:
+            if "Messi" in quiz_question:
+                st.success("🇦🇷 Correct! Messi has significantly fewer cards and a better fair play record!")
+            elif "Ronaldo" in quiz_question:
+                st.info("🇵🇹 Ronaldo's passion shows, but Messi has the cleaner record statistically!")
+            else:
+                st.warning("🤝 While both are professionals, the numbers clearly favor Messi's disciplinary record!")
 
 def show():
     """Display the disciplinary records analysis page"""
@@ -125,7 +148,8 @@ def show():
         height=500,
         font=dict(size=14, family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Disciplinary timeline
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">📈 DISCIPLINARY TIMELINE BY SEASON</h2>', unsafe_allow_html=True)
@@ -170,7 +194,8 @@ def show():
     )
     
     fig.update_layout(height=600, title_text="📊 Disciplinary Record Timeline", font=dict(family='Times New Roman'))
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Card type breakdown
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🎯 CARD TYPE & REASON ANALYSIS</h2>', unsafe_allow_html=True)
@@ -211,7 +236,8 @@ def show():
             xaxis_tickangle=-45,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Red card reasons pie chart
@@ -244,7 +270,8 @@ def show():
         ), row=2, col=1)
         
         fig.update_layout(height=500, title_text="🟥 Red Card Breakdown", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Competition-wise disciplinary record
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🏆 DISCIPLINARY RECORD BY COMPETITION</h2>', unsafe_allow_html=True)
@@ -293,7 +320,8 @@ def show():
     )
     
     fig.update_layout(height=600, title_text="🏟️ Competition-wise Disciplinary Analysis", font=dict(family='Times New Roman'))
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Fair play awards and recognition
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🌟 FAIR PLAY AWARDS & RECOGNITION</h2>', unsafe_allow_html=True)
@@ -434,7 +462,34 @@ def show():
         hovermode='x unified',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Cards per 90 by competition, from the match-by-match logs
+    log_comps = match_log_summary("competition")
+    if log_comps.empty:
+        st.info("No match-by-match logs available yet.")
+    else:
+        fig = go.Figure()
+        for player, rows in log_comps.groupby('player', sort=False):
+            is_messi = 'Messi' in player
+            fig.add_trace(go.Bar(
+                x=rows['competition'] + ' ' + rows['season'],
+                y=rows['cards_per90'],
+                name=f"{'Messi' if is_messi else 'Ronaldo'} Cards/90",
+                marker_color=MESSI_COLOR if is_messi else RONALDO_COLOR,
+                text=rows['cards_per90'],
+                textposition='auto'
+            ))
+        fig.update_layout(
+            title="🟨 Cards per 90 Minutes - Match-Log Summary",
+            barmode='group',
+            height=400,
+            template='plotly_white',
+            font=dict(family='Times New Roman')
+        )
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Final disciplinary verdict
     st.markdown('<h2 class="section-header" style="font-family: Times New Roman;">🏁 DISCIPLINARY VERDICT</h2>', unsafe_allow_html=True)
@@ -467,25 +522,8 @@ def show():
     
     st.markdown("### 🏆 Fair Play Winner: 🇦🇷 MESSI - The Gentleman of Football")
     
-    # Interactive disciplinary quiz
-    st.markdown('<h3 class="section-header" style="font-family: Times New Roman;">🎮 Disciplinary Knowledge Quiz</h3>', unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns([1, 2, 1])
-    
-    with col2:
-        quiz_question = st.radio(
-            "Who has the better disciplinary record?",
-            ["🇦🇷 Messi - Model professional", "🇵🇹 Ronaldo - Passionate competitor", "🤝 Both have their moments"],
-            key="disciplinary_quiz"
-        )
-        
-        if quiz_question:
-            if "Messi" in quiz_question:
-                st.success("🇦🇷 Correct! Messi has significantly fewer cards and a better fair play record!")
-            elif "Ronaldo" in quiz_question:
-                st.info("🇵🇹 Ronaldo's passion shows, but Messi has the cleaner record statistically!")
-            else:
-                st.warning("🤝 While both are professionals, the numbers clearly favor Messi's disciplinary record!")
+    # Interactive disciplinary quiz - a fragment, so answering reruns only the quiz
+    disciplinary_quiz()
     
     # Navigation
     st.markdown("""
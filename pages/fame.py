@@ -1,9 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from utils.figure_cache import cached_figure
+from utils.render_timing import timed
 
 def show():
     """Display visual fame and global impact analysis"""
@@ -221,7 +222,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Fame radar chart
@@ -255,7 +257,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Endorsements and brand value
     st.markdown('## 💰 Brand Value & Endorsements')
@@ -287,7 +290,8 @@ def show():
         ), row=1, col=2)
         
         fig.update_layout(height=400, title_text="Annual Earnings Breakdown", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Major endorsement deals
@@ -322,7 +326,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         # Career earnings timeline
@@ -356,7 +361,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Global impact and recognition
     st.markdown('## 🌍 Global Impact & Recognition')
@@ -369,38 +375,42 @@ def show():
         messi_awards = [95, 47, 15, 8]
         ronaldo_awards = [85, 52, 12, 6]
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=award_types,
-            y=messi_awards,
-            mode='lines+markers+text',
-            name='Messi',
-            line=dict(color=MESSI_COLOR, width=4),
-            marker=dict(size=15),
-            text=messi_awards,
-            textposition='top center',
-            textfont=dict(family='Times New Roman')
-        ))
-        fig.add_trace(go.Scatter(
-            x=award_types,
-            y=ronaldo_awards,
-            mode='lines+markers+text',
-            name='Ronaldo',
-            line=dict(color=RONALDO_COLOR, width=4),
-            marker=dict(size=15),
-            text=ronaldo_awards,
-            textposition='top center',
-            textfont=dict(family='Times New Roman')
-        ))
-        
-        fig.update_layout(
-            title="Awards & Recognition Count",
-            yaxis_title="Number of Awards",
-            height=400,
-            template='plotly_white',
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def awards_recognition_count_figure():
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=award_types,
+                y=messi_awards,
+                mode='lines+markers+text',
+                name='Messi',
+                line=dict(color=MESSI_COLOR, width=4),
+                marker=dict(size=15),
+                text=messi_awards,
+                textposition='top center',
+                textfont=dict(family='Times New Roman')
+            ))
+            fig.add_trace(go.Scatter(
+                x=award_types,
+                y=ronaldo_awards,
+                mode='lines+markers+text',
+                name='Ronaldo',
+                line=dict(color=RONALDO_COLOR, width=4),
+                marker=dict(size=15),
+                text=ronaldo_awards,
+                textposition='top center',
+                textfont=dict(family='Times New Roman')
+            ))
+            
+            fig.update_layout(
+                title="Awards & Recognition Count",
+                yaxis_title="Number of Awards",
+                height=400,
+                template='plotly_white',
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("fame.awards_recognition_count", awards_recognition_count_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Media coverage and search trends
@@ -427,7 +437,8 @@ def show():
         ), row=1, col=2)
         
         fig.update_layout(height=400, title_text="Digital Presence", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Social media engagement analysis
     st.markdown('## 📱 Social Media Engagement')
@@ -440,35 +451,39 @@ def show():
         messi_engagement = [12.5, 8.2, 15.3, 25.1]
         ronaldo_engagement = [15.8, 9.1, 18.7, 28.4]
         
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Messi',
-            x=platforms,
-            y=messi_engagement,
-            marker_color=MESSI_COLOR,
-            text=[f'{x}%' for x in messi_engagement],
-            textposition='auto',
-            textfont=dict(family='Times New Roman')
-        ))
-        fig.add_trace(go.Bar(
-            name='Ronaldo',
-            x=platforms,
-            y=ronaldo_engagement,
-            marker_color=RONALDO_COLOR,
-            text=[f'{x}%' for x in ronaldo_engagement],
-            textposition='auto',
-            textfont=dict(family='Times New Roman')
-        ))
-        
-        fig.update_layout(
-            title="Engagement Rate by Platform",
-            barmode='group',
-            height=400,
-            template='plotly_white',
-            yaxis_title="Engagement Rate (%)",
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def engagement_rate_by_platform_figure():
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                name='Messi',
+                x=platforms,
+                y=messi_engagement,
+                marker_color=MESSI_COLOR,
+                text=[f'{x}%' for x in messi_engagement],
+                textposition='auto',
+                textfont=dict(family='Times New Roman')
+            ))
+            fig.add_trace(go.Bar(
+                name='Ronaldo',
+                x=platforms,
+                y=ronaldo_engagement,
+                marker_color=RONALDO_COLOR,
+                text=[f'{x}%' for x in ronaldo_engagement],
+                textposition='auto',
+                textfont=dict(family='Times New Roman')
+            ))
+            
+            fig.update_layout(
+                title="Engagement Rate by Platform",
+                barmode='group',
+                height=400,
+                template='plotly_white',
+                yaxis_title="Engagement Rate (%)",
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("fame.engagement_rate_by_platform", engagement_rate_by_platform_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Social media growth timeline
@@ -476,33 +491,37 @@ def show():
         messi_total_followers = [50, 85, 120, 160, 220, 290, 380, 450, 504]
         ronaldo_total_followers = [80, 130, 180, 240, 320, 420, 520, 580, 610]
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=messi_total_followers,
-            mode='lines+markers',
-            name='Messi',
-            line=dict(color=MESSI_COLOR, width=3),
-            marker=dict(size=8)
-        ))
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=ronaldo_total_followers,
-            mode='lines+markers',
-            name='Ronaldo',
-            line=dict(color=RONALDO_COLOR, width=3),
-            marker=dict(size=8)
-        ))
-        
-        fig.update_layout(
-            title="Social Media Growth (Instagram)",
-            xaxis_title="Year",
-            yaxis_title="Followers (Millions)",
-            height=400,
-            template='plotly_white',
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def social_media_growth_figure():
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=years,
+                y=messi_total_followers,
+                mode='lines+markers',
+                name='Messi',
+                line=dict(color=MESSI_COLOR, width=3),
+                marker=dict(size=8)
+            ))
+            fig.add_trace(go.Scatter(
+                x=years,
+                y=ronaldo_total_followers,
+                mode='lines+markers',
+                name='Ronaldo',
+                line=dict(color=RONALDO_COLOR, width=3),
+                marker=dict(size=8)
+            ))
+            
+            fig.update_layout(
+                title="Social Media Growth (Instagram)",
+                xaxis_title="Year",
+                yaxis_title="Followers (Millions)",
+                height=400,
+                template='plotly_white',
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("fame.social_media_growth", social_media_growth_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Fame influence heatmap
     st.markdown('## 🔥 Global Influence Heatmap')
@@ -531,7 +550,8 @@ def show():
         template='plotly_white',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Final comparison charts
     st.markdown('## 🏆 Fame Championship')
@@ -544,34 +564,38 @@ def show():
         messi_scores = [85, 95, 95, 90, 88, 90]
         ronaldo_scores = [98, 88, 85, 95, 92, 85]
         
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Messi',
-            x=categories,
-            y=messi_scores,
-            marker_color=MESSI_COLOR,
-            text=messi_scores,
-            textposition='auto',
-            textfont=dict(family='Times New Roman')
-        ))
-        fig.add_trace(go.Bar(
-            name='Ronaldo',
-            x=categories,
-            y=ronaldo_scores,
-            marker_color=RONALDO_COLOR,
-            text=ronaldo_scores,
-            textposition='auto',
-            textfont=dict(family='Times New Roman')
-        ))
-        
-        fig.update_layout(
-            title="Overall Fame Comparison",
-            barmode='group',
-            height=400,
-            template='plotly_white',
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def overall_fame_comparison_figure():
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                name='Messi',
+                x=categories,
+                y=messi_scores,
+                marker_color=MESSI_COLOR,
+                text=messi_scores,
+                textposition='auto',
+                textfont=dict(family='Times New Roman')
+            ))
+            fig.add_trace(go.Bar(
+                name='Ronaldo',
+                x=categories,
+                y=ronaldo_scores,
+                marker_color=RONALDO_COLOR,
+                text=ronaldo_scores,
+                textposition='auto',
+                textfont=dict(family='Times New Roman')
+            ))
+            
+            fig.update_layout(
+                title="Overall Fame Comparison",
+                barmode='group',
+                height=400,
+                template='plotly_white',
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("fame.overall_fame_comparison", overall_fame_comparison_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Winner pie chart
@@ -593,7 +617,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Summary metrics with custom design
     st.markdown('## 🌟 Fame Championship Results')
@@ -1,27 +1,389 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, Rectangle
-from scipy.ndimage import gaussian_filter
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-import seaborn as sns
 import warnings
+import hashlib
+import io
+import os
+import zlib
+from functools import lru_cache
+from utils.data_loader import derived
+from utils.goal_events import goal_event_store
+from utils.pitch_grid import GridPyramid, GridStore, PitchGrid, bin_files, zone_shares
+from utils.render_timing import timed
+from utils.smoothing import DEFAULT_BACKEND
 warnings.filterwarnings('ignore')
 
-# Set style for better plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# ===== Figure construction =====
+# Streamlit serves every session from threads of one process, so figures are built with
+# the object-oriented Figure API: nothing goes through pyplot's global figure manager
+# or rcParams. The theme and font are applied to each figure's own artists, and a figure
+# is garbage once its last reference is dropped. matplotlib itself is only imported
+# when a figure is built (the default Plotly renderer never needs it).
+PLOT_THEME = 'seaborn-v0_8'
+FONT_FAMILY = 'Times New Roman'
+
+
+def new_figure(figsize, nrows=1, ncols=1, theme=PLOT_THEME):
+    """Unmanaged Figure and axes, styled like the matplotlib ``theme`` style sheet"""
+    import matplotlib.style
+    from matplotlib.figure import Figure
+    
+    style = matplotlib.style.library[theme]
+    fig = Figure(figsize=figsize, facecolor=style.get('figure.facecolor', 'white'))
+    axes = fig.subplots(nrows, ncols)
+    for ax in np.atleast_1d(axes).ravel():
+        ax.set_facecolor(style.get('axes.facecolor', 'white'))
+        ax.set_axisbelow(style.get('axes.axisbelow', True))
+        ax.grid(style.get('axes.grid', False), color=style.get('grid.color', 'white'),
+                linewidth=style.get('grid.linewidth', 1.0))
+        for spine in ax.spines.values():
+            spine.set_linewidth(style.get('axes.linewidth', 0.8))
+        ax.tick_params(colors=style.get('xtick.color', 'black'), length=style.get('xtick.major.size', 3.5),
+                       pad=style.get('xtick.major.pad', 3.5), labelfontfamily=FONT_FAMILY)
+    return fig, axes
+
+# ===== Heat-map computation cache =====
+# Point clouds and smoothed grids depend only on (style, seed, n_points, resolution,
+# sigma), so each is computed once per process and shared by every view and rerun.
+# Cached arrays are read-only; views that rescale them work on copies.
+HEATMAP_CACHE_SIZE = 32
+PLAYER_SEEDS = {'messi': 42, 'ronaldo': 24}
+PLAYER_STYLES = {
+    # Messi - more central, slightly right-wing, creative areas
+    'messi': {
+        'centers': [
+            (75, 45),   # Right wing
+            (85, 40),   # Attacking midfield right
+            (95, 40),   # Final third right
+            (70, 35),   # Central attacking midfield
+            (80, 50),   # Right attacking areas
+            (90, 45),   # Box edge right
+            (100, 40),  # Penalty area right
+        ],
+        'weights': [0.2, 0.15, 0.15, 0.15, 0.1, 0.15, 0.1],
+        'cov': [[25, 3], [3, 15]],  # Covariance matrix for spread (one 2x2, or one per center)
+    },
+    # Ronaldo - more box-focused, left wing early career, central striker later
+    'ronaldo': {
+        'centers': [
+            (25, 35),   # Left wing (early career)
+            (95, 40),   # Box area central
+            (100, 45),  # Penalty area central
+            (105, 40),  # Goal area
+            (90, 30),   # Box edge left
+            (90, 50),   # Box edge right
+            (98, 40),   # Prime scoring area
+        ],
+        'weights': [0.1, 0.2, 0.25, 0.15, 0.1, 0.1, 0.1],
+        'cov': [[25, 3], [3, 15]],
+    },
+}
+
+
+def component_counts(weights, n_points):
+    """Split n_points across mixture components; largest remainders take the leftovers"""
+    weights = np.asarray(weights, dtype=float)
+    share = weights / weights.sum() * n_points
+    counts = np.floor(share).astype(np.int64)
+    leftover = n_points - counts.sum()
+    counts[np.argsort(share - counts)[::-1][:leftover]] += 1
+    return counts
+
+
+def sample_mixture(centers, weights, cov, n_points, rng, bounds):
+    """
+    Draw n_points from a 2D Gaussian mixture in one batch.
+
+    One preallocated (n_points, 2) array is filled by a single standard-normal draw,
+    then each component's block is scaled by its Cholesky factor and shifted to its
+    center in place. ``cov`` is one 2x2 matrix shared by every component or one per
+    center. Points are clipped to ``bounds`` = (length, width).
+    """
+    centers = np.asarray(centers, dtype=float)
+    cov = np.asarray(cov, dtype=float)
+    chol = np.linalg.cholesky(np.broadcast_to(cov, (len(centers), 2, 2)))
+    counts = component_counts(weights, n_points)
+
+    points = np.empty((n_points, 2))
+    rng.standard_normal(out=points)
+    stops = np.cumsum(counts)
+    for center, factor, start, stop in zip(centers, chol, stops - counts, stops):
+        block = points[start:stop]
+        np.matmul(block, factor.T, out=block)
+        block += center
+    np.clip(points, 0, bounds, out=points)
+    return points
+
+
+def _style_key(player_style):
+    """PLAYER_STYLES / PLAYER_SEEDS key for a style; anything but 'messi' uses the ronaldo style"""
+    return 'messi' if player_style == 'messi' else 'ronaldo'
+
+
+def _default_seed(player_style):
+    return PLAYER_SEEDS[_style_key(player_style)]
+
+
+@lru_cache(maxsize=HEATMAP_CACHE_SIZE)
+def _player_points(player_style, seed, n_points, field_length, field_width):
+    """Sampled positions for one player style, clipped to the field"""
+    style = PLAYER_STYLES[_style_key(player_style)]
+    rng = np.random.default_rng(seed)  # Local generator: no global RNG state
+    points = sample_mixture(style['centers'], style['weights'], style['cov'], n_points,
+                            rng, (field_length, field_width))
+    points.flags.writeable = False
+    return points
+
+
+def _bin_and_smooth(points, resolution, sigma, smoothing, field_length, field_width):
+    """2D histogram of the points, Gaussian-smoothed"""
+    grid = PitchGrid(resolution - 1, resolution - 1, field_length, field_width)
+    grid.add(points[:, 0], points[:, 1])
+    
+    # Smooth the heatmap
+    return grid.smoothed(sigma, smoothing), grid.x_edges, grid.y_edges
+
+
+@lru_cache(maxsize=HEATMAP_CACHE_SIZE)
+def _player_grid(player_style, seed, n_points, resolution, sigma, smoothing, field_length, field_width):
+    points = _player_points(player_style, seed, n_points, field_length, field_width)
+    grid = _bin_and_smooth(points, resolution, sigma, smoothing, field_length, field_width)
+    for array in grid:
+        array.flags.writeable = False
+    return grid
+
+
+# ===== Zoomable tile pyramid =====
+# Many more samples than the static maps, binned once into a 15x10 ... 480x320 pyramid;
+# each zoom window only ever sends a bounded, fixed-budget grid to the browser.
+PYRAMID_POINTS = 200_000
+ZOOM_WINDOWS = {
+    'Full Pitch': ((0, 120), (0, 80)),
+    'Attacking Half': ((60, 120), (0, 80)),
+    'Final Third': ((80, 120), (0, 80)),
+    'Penalty Area': ((103.5, 120), (18, 62)),
+    'Six-Yard Box': ((114.5, 120), (30, 50)),
+}
+
+
+@lru_cache(maxsize=HEATMAP_CACHE_SIZE)
+def _player_pyramid(player_style, seed, n_points, field_length, field_width):
+    points = _player_points(player_style, seed, n_points, field_length, field_width)
+    return GridPyramid.from_points(points[:, 0], points[:, 1], length=field_length, width=field_width)
+
+
+# ===== Plotly pitch renderer =====
+# Heat maps drawn in the browser: the pitch markings are layout shapes built once per
+# (panel count, field size) into a cached template, density is a go.Heatmap whose
+# colorscale fades to transparent so the pitch shows through. Nothing is rasterized
+# on the server and pan / zoom never round-trip. (Heatmapgl no longer exists in
+# Plotly 6+, and go.Heatmap already draws its cells as one canvas image.)
+HEATMAP_RENDERER = os.environ.get('GOAT_HEATMAP_RENDERER', 'plotly')  # or 'matplotlib'
+PITCH_COLOR = '#2d5a27'
+
+
+def _axis_ref(axis, panel):
+    return axis if panel == 0 else f'{axis}{panel + 1}'
+
+
+@lru_cache(maxsize=8)
+def pitch_template(panels=1, field_length=120, field_width=80):
+    """Plotly template with the field markings for ``panels`` side-by-side pitches"""
+    line = dict(color='white', width=2)
+    half_x, half_y = field_length / 2, field_width / 2
+    boxes = [(0, 0, field_length, field_width),
+             (0, (field_width - 44) / 2, 16.5, (field_width + 44) / 2),
+             (field_length - 16.5, (field_width - 44) / 2, field_length, (field_width + 44) / 2),
+             (0, (field_width - 20) / 2, 5.5, (field_width + 20) / 2),
+             (field_length - 5.5, (field_width - 20) / 2, field_length, (field_width + 20) / 2)]
+    shapes = []
+    for panel in range(panels):
+        ref = dict(xref=_axis_ref('x', panel), yref=_axis_ref('y', panel), layer='above')
+        shapes += [dict(type='rect', x0=x0, y0=y0, x1=x1, y1=y1, line=line, **ref)
+                   for x0, y0, x1, y1 in boxes]
+        shapes.append(dict(type='line', x0=half_x, y0=0, x1=half_x, y1=field_width, line=line, **ref))
+        shapes.append(dict(type='circle', x0=half_x - 9.15, y0=half_y - 9.15,
+                           x1=half_x + 9.15, y1=half_y + 9.15, line=line, **ref))
+        for spot_x in (11, half_x, field_length - 11):
+            shapes.append(dict(type='circle', x0=spot_x - 0.4, y0=half_y - 0.4, x1=spot_x + 0.4,
+                               y1=half_y + 0.4, line=line, fillcolor='white', **ref))
+        for goal_x in (0, field_length):
+            shapes.append(dict(type='line', x0=goal_x, y0=half_y - 3.66, x1=goal_x, y1=half_y + 3.66,
+                               line=dict(color='white', width=5), **ref))
+    return go.layout.Template(layout=dict(
+        shapes=shapes,
+        plot_bgcolor=PITCH_COLOR,
+        font=dict(family='Times New Roman'),
+        xaxis=dict(range=[0, field_length], showgrid=False, zeroline=False,
+                   title='Field Length (meters)'),
+        yaxis=dict(range=[0, field_width], showgrid=False, zeroline=False,
+                   title='Field Width (meters)'),
+    ))
+
+
+def _density_scale(rgb):
+    """Colorscale from transparent to the player's colour"""
+    r, g, b = rgb
+    return [[0.0, f'rgba({r},{g},{b},0)'], [0.25, f'rgba({r},{g},{b},0.45)'],
+            [1.0, f'rgba({r},{g},{b},0.95)']]
+
+
+MESSI_SCALE = _density_scale((117, 170, 219))
+RONALDO_SCALE = _density_scale((255, 45, 45))
+
+
+def _centers(edges):
+    return (edges[:-1] + edges[1:]) / 2
+
+
+def _lock_aspect(fig, panels):
+    for panel in range(panels):
+        fig.update_layout({_axis_ref('yaxis', panel): dict(scaleanchor=_axis_ref('x', panel), scaleratio=1)})
+
+
+# ===== Season / competition grid store =====
+# One count grid per (player, season, competition). With positional files under
+# GOAT_POSITION_DATA (CSV / Parquet with player, season, competition, x, y columns in
+# field meters) the grids are binned from them in one streaming pass per file. No
+# tracking data ships with the app, so otherwise each group of the goal-event log is
+# simulated from the player's style, POINTS_PER_GOAL sampled positions per goal, with
+# the first center (the early-career wing) fading over the career. Either way filters
+# sum the stored grids; nothing is re-sampled or re-binned per selection.
+POSITION_DIR = os.environ.get('GOAT_POSITION_DATA', 'data/positions')
+POSITION_SUFFIXES = ('.csv', '.parquet', '.pq')
+GROUP_COLUMNS = ['player', 'season', 'competition']
+POINTS_PER_GOAL = 200
+EVENT_PLAYERS = {'Lionel Messi': 'messi', 'Cristiano Ronaldo': 'ronaldo'}
+FIRST_SEASON, LAST_SEASON = 2003, 2022
+
+
+def position_files(position_dir=POSITION_DIR):
+    """Positional data files to bin, sorted; empty when there is no tracking data"""
+    try:
+        return sorted(str(entry.path) for entry in os.scandir(position_dir)
+                      if entry.is_file() and entry.name.lower().endswith(POSITION_SUFFIXES))
+    except FileNotFoundError:
+        return []
+
+
+@lru_cache(maxsize=4)
+def _binned_store(stamps, resolution):
+    """GridStore binned from the position files; ``stamps`` (path, size, mtime) key the cache"""
+    grids = bin_files([path for path, _, _ in stamps], workers=1, by=GROUP_COLUMNS,
+                      nx=resolution - 1, ny=resolution - 1)
+    store = GridStore.from_grids(grids, GROUP_COLUMNS)
+    keys = store.keys
+    keys['player'] = keys['player'].astype(str).map(lambda name: EVENT_PLAYERS.get(name, name.lower()))
+    # "2014-15" and 2014 both mean the season starting in 2014
+    keys['season'] = keys['season'].astype(str).str[:4].astype(int)
+    keys['competition'] = keys['competition'].astype(str)
+    return store
+
+
+def _era_weights(weights, season):
+    """Early-career center weighted x2 at the start of the career, x0.5 at the end"""
+    progress = np.clip((season - FIRST_SEASON) / (LAST_SEASON - FIRST_SEASON), 0, 1)
+    weights = np.array(weights, dtype=float)
+    weights[0] *= 2 - 1.5 * progress
+    return weights
+
+
+@derived('goal_events')
+def simulated_grid_store(resolution=50):
+    """Simulated per-(player, season, competition) grids, rebuilt only when data/data.csv reloads"""
+    events = goal_event_store().frame
+    groups = (events[events['season_start'] >= 0]
+              .groupby(['player', 'season_start', 'competition'], observed=True).size()
+              .reset_index(name='goals'))
+    groups = groups[groups['player'].isin(list(EVENT_PLAYERS))].reset_index(drop=True)
+    keys = pd.DataFrame({
+        'player': groups['player'].map(EVENT_PLAYERS).astype(str),
+        'season': groups['season_start'].astype(int),
+        'competition': groups['competition'].astype(str),
+    })
+    
+    clouds, codes = [], []
+    for code, row in keys.iterrows():
+        style = PLAYER_STYLES[row['player']]
+        rng = np.random.default_rng(zlib.crc32(f"{row['player']}|{row['season']}|{row['competition']}".encode()))
+        n_points = int(groups.at[code, 'goals']) * POINTS_PER_GOAL
+        clouds.append(sample_mixture(style['centers'], _era_weights(style['weights'], row['season']),
+                                     style['cov'], n_points, rng, (120, 80)))
+        codes.append(np.full(n_points, code))
+    points = np.concatenate(clouds) if clouds else np.empty((0, 2))
+    codes = np.concatenate(codes) if codes else np.empty(0, dtype=np.int64)
+    return GridStore.from_points(keys, codes, points[:, 0], points[:, 1], resolution - 1, resolution - 1)
+
+
+def season_grid_store(resolution=50):
+    """
+    Per-(player, season, competition) grids and whether they are simulated.
+
+    Binned from the position files when there are any (re-binned only when one of
+    them changes), otherwise the simulated store.
+    """
+    paths = position_files()
+    if not paths:
+        return simulated_grid_store(resolution), True
+    stamps = tuple((path, os.stat(path).st_size, os.stat(path).st_mtime_ns) for path in paths)
+    return _binned_store(stamps, resolution), False
+
+
+def _difference_scale(positive_rgb, negative_rgb):
+    """Diverging colorscale, transparent at zero"""
+    (r1, g1, b1), (r2, g2, b2) = positive_rgb, negative_rgb
+    return [[0.0, f'rgba({r2},{g2},{b2},0.95)'], [0.5, f'rgba({r2},{g2},{b2},0)'],
+            [0.5, f'rgba({r1},{g1},{b1},0)'], [1.0, f'rgba({r1},{g1},{b1},0.95)']]
+
+
+# ===== Rendered-image cache =====
+# Rasterizing the matplotlib views is the slowest step on the page, so the encoded
+# bytes are cached per (variant, data hash, grid resolution, dpi, format, theme) and
+# served with st.image. Figures are only built and rasterized on a miss.
+IMAGE_DPI = 200  # Same as st.pyplot's default
+IMAGE_FORMAT = 'png'
+IMAGE_VARIANTS = {
+    'comparison': 'plot_comparison',
+    'overlay': 'plot_overlay_comparison',
+    'stats': 'create_stats_summary',
+}
+
+
+@lru_cache(maxsize=HEATMAP_CACHE_SIZE)
+def _render_image(variant, data_hash, resolution, dpi, image_format, theme):
+    analyzer = SoccerFieldHeatMap(theme=theme)
+    if variant == 'stats':
+        fig, _ = analyzer.create_stats_summary()
+    else:
+        fig = getattr(analyzer, IMAGE_VARIANTS[variant])(resolution=resolution)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=image_format, dpi=dpi, bbox_inches='tight')
+    fig.clear()  # Only the encoded bytes outlive this call
+    return buffer.getvalue()
+
+
+def clear_heatmap_cache():
+    """Drop every cached point cloud, grid and rendered image"""
+    _player_points.cache_clear()
+    _player_grid.cache_clear()
+    _player_pyramid.cache_clear()
+    _render_image.cache_clear()
+
 
 class SoccerFieldHeatMap:
-    def __init__(self, figsize=(15, 10)):
+    def __init__(self, figsize=(15, 10), theme=PLOT_THEME):
         self.figsize = figsize
+        self.theme = theme
         self.field_length = 120  # meters
         self.field_width = 80   # meters
         
     def create_field_outline(self, ax):
         """Draw soccer field markings exactly like reference"""
+        from matplotlib.patches import Circle, Rectangle
+        
         # Field outline
         field = Rectangle((0, 0), self.field_length, self.field_width, 
                          linewidth=2, edgecolor='white', facecolor='none')
@@ -65,72 +427,121 @@ class SoccerFieldHeatMap:
         ax.plot([self.field_length, self.field_length], [(self.field_width-7.32)/2, (self.field_width+7.32)/2], 
                 color='white', linewidth=3)
     
-    def generate_player_data(self, player_style='messi'):
-        """Generate realistic position data based on player style - exact reference implementation"""
-        np.random.seed(42 if player_style == 'messi' else 24)
-        
-        if player_style == 'messi':
-            # Messi - more central, slightly right-wing, creative areas
-            centers = [
-                (75, 45),   # Right wing
-                (85, 40),   # Attacking midfield right
-                (95, 40),   # Final third right
-                (70, 35),   # Central attacking midfield
-                (80, 50),   # Right attacking areas
-                (90, 45),   # Box edge right
-                (100, 40),  # Penalty area right
-            ]
-            weights = [0.2, 0.15, 0.15, 0.15, 0.1, 0.15, 0.1]
-            
-        else:  # ronaldo
-            # Ronaldo - more box-focused, left wing early career, central striker later
-            centers = [
-                (25, 35),   # Left wing (early career)
-                (95, 40),   # Box area central
-                (100, 45),  # Penalty area central
-                (105, 40),  # Goal area
-                (90, 30),   # Box edge left
-                (90, 50),   # Box edge right
-                (98, 40),   # Prime scoring area
-            ]
-            weights = [0.1, 0.2, 0.25, 0.15, 0.1, 0.1, 0.1]
-        
-        # Generate data points
-        n_points = 1000
-        all_points = []
-        
-        for center, weight in zip(centers, weights):
-            n_center_points = int(n_points * weight)
-            cov = [[25, 3], [3, 15]]  # Covariance matrix for spread
-            points = np.random.multivariate_normal(center, cov, n_center_points)
-            all_points.extend(points)
-        
-        # Clip to field boundaries
-        points = np.array(all_points)
-        points[:, 0] = np.clip(points[:, 0], 0, self.field_length)
-        points[:, 1] = np.clip(points[:, 1], 0, self.field_width)
-        
-        return points
-    
-    def create_heatmap_data(self, points, resolution=50):
-        """Create 2D histogram for heatmap - exact reference implementation"""
-        x_edges = np.linspace(0, self.field_length, resolution)
-        y_edges = np.linspace(0, self.field_width, resolution)
-        
-        hist, _, _ = np.histogram2d(points[:, 0], points[:, 1], 
-                                  bins=[x_edges, y_edges])
-        
-        # Smooth the heatmap
-        hist_smooth = gaussian_filter(hist.T, sigma=1.5)
-        
-        return hist_smooth, x_edges, y_edges
-    
-    def plot_comparison(self):
+    def generate_player_data(self, player_style='messi', seed=None, n_points=1000):
+        """
+        Simulated positions for a player style, drawn from its Gaussian mixture.
+
+        Sampled with a seeded ``numpy.random.default_rng`` (no global RNG state), so
+        the points are reproducible per seed but differ from the old
+        ``np.random.seed`` / ``multivariate_normal`` sampler.
+        """
+        if seed is None:
+            seed = _default_seed(player_style)
+        return _player_points(player_style, seed, n_points, self.field_length, self.field_width)
+    
+    def create_heatmap_data(self, points, resolution=50, sigma=1.5, smoothing=None):
+        """Gaussian-smoothed 2D histogram of ``points`` on the field grid"""
+        return _bin_and_smooth(points, resolution, sigma, smoothing, self.field_length, self.field_width)
+    
+    def player_heatmap(self, player_style='messi', seed=None, n_points=1000, resolution=50, sigma=1.5,
+                       smoothing=None):
+        """Smoothed grid for one player, shared across views and reruns"""
+        if seed is None:
+            seed = _default_seed(player_style)
+        return _player_grid(player_style, seed, n_points, resolution, sigma, smoothing or DEFAULT_BACKEND,
+                            self.field_length, self.field_width)
+    
+    def player_pyramid(self, player_style='messi', seed=None, n_points=PYRAMID_POINTS):
+        """Multi-resolution count pyramid for one player, built once per process"""
+        if seed is None:
+            seed = _default_seed(player_style)
+        return _player_pyramid(player_style, seed, n_points, self.field_length, self.field_width)
+    
+    def zone_shares(self, player_style='messi', n_points=PYRAMID_POINTS):
+        """Percentage of a player's positions in each pitch zone"""
+        pyramid = self.player_pyramid(player_style, n_points=n_points)
+        return zone_shares(pyramid.levels[-1])  # 0.25 m cells: box edges fall on cell edges
+    
+    def plotly_comparison(self, resolution=50):
+        """Side-by-side Plotly heat maps on the cached pitch template"""
+        titles = ['Lionel Messi - "The Magician"', 'Cristiano Ronaldo - "The Goal Machine"']
+        fig = make_subplots(rows=1, cols=2, subplot_titles=titles, horizontal_spacing=0.08)
+        for col, (player, scale, colorbar_x) in enumerate(
+                (('messi', MESSI_SCALE, 0.46), ('ronaldo', RONALDO_SCALE, 1.0)), 1):
+            heat, x_edges, y_edges = self.player_heatmap(player, resolution=resolution)
+            fig.add_trace(go.Heatmap(
+                z=heat, x=_centers(x_edges), y=_centers(y_edges), colorscale=scale,
+                colorbar=dict(title='Activity', x=colorbar_x, len=0.8),
+                name=player.title(),
+                hovertemplate='x %{x:.1f} m<br>y %{y:.1f} m<br>%{z:.2f}<extra></extra>'
+            ), row=1, col=col)
+        fig.update_layout(
+            template=pitch_template(2, self.field_length, self.field_width),
+            title='MESSI vs RONALDO - Field Position Heat Maps',
+            height=520
+        )
+        fig.update_xaxes(range=[0, self.field_length], title='Field Length (meters)')
+        fig.update_yaxes(range=[0, self.field_width], title='Field Width (meters)')
+        _lock_aspect(fig, 2)
+        return fig
+    
+    def plotly_overlay(self, resolution=50):
+        """Both players on one pitch; overlapping zones blend to purple"""
+        fig = go.Figure()
+        for player, scale in (('messi', MESSI_SCALE), ('ronaldo', RONALDO_SCALE)):
+            heat, x_edges, y_edges = self.player_heatmap(player, resolution=resolution)
+            fig.add_trace(go.Heatmap(
+                z=heat / heat.max(), x=_centers(x_edges), y=_centers(y_edges), colorscale=scale,
+                showscale=False, name=player.title(),
+                hovertemplate=player.title() + ' %{z:.2f}<extra></extra>'
+            ))
+        fig.update_layout(
+            template=pitch_template(1, self.field_length, self.field_width),
+            title='Blue = Messi Zones | Red = Ronaldo Zones | Purple = Overlap',
+            height=600
+        )
+        _lock_aspect(fig, 1)
+        return fig
+    
+    def plotly_stats(self):
+        """Positional statistics as Plotly bars"""
+        df = self.positional_stats()
+        colors = ['#75AADB', '#FF2D2D']
+        fig = make_subplots(rows=2, cols=2, subplot_titles=(
+            'Average X Position (Attack Direction)', 'Average Y Position (Width)',
+            'Positional Variability (X)', 'Attacking Zone Presence'))
+        for (row, col), column in (((1, 1), 'Avg X Position'), ((1, 2), 'Avg Y Position'),
+                                   ((2, 1), 'X Position Std')):
+            fig.add_trace(go.Bar(x=df['Player'], y=df[column], marker_color=colors, opacity=0.7,
+                                 showlegend=False), row=row, col=col)
+        for column, color in (('Final Third %', colors[0]), ('Penalty Area %', colors[1])):
+            fig.add_trace(go.Bar(x=df['Player'], y=df[column], name=column, marker_color=color,
+                                 opacity=0.7), row=2, col=2)
+        fig.update_layout(
+            title='Positional Statistics Comparison',
+            barmode='group',
+            height=650,
+            template='plotly_white',
+            font=dict(family='Times New Roman')
+        )
+        return fig
+    
+    def data_hash(self, resolution=50):
+        """Fingerprint of every array the rendered views are drawn from"""
+        digest = hashlib.sha1()
+        for player in PLAYER_SEEDS:
+            digest.update(self.generate_player_data(player).tobytes())
+            digest.update(self.player_heatmap(player, resolution=resolution)[0].tobytes())
+        return digest.hexdigest()
+    
+    def render_image(self, variant, resolution=50, dpi=IMAGE_DPI, image_format=IMAGE_FORMAT):
+        """Encoded image bytes for one view, rasterized only on a cache miss"""
+        return _render_image(variant, self.data_hash(resolution), resolution, dpi,
+                             image_format, self.theme)
+    
+    def plot_comparison(self, resolution=50):
         """Create side-by-side comparison exactly like reference"""
-        # Set font to Times New Roman
-        plt.rcParams['font.family'] = 'Times New Roman'
-        
-        fig, axes = plt.subplots(1, 2, figsize=(20, 10))
+        fig, axes = new_figure((20, 10), 1, 2, theme=self.theme)
         fig.suptitle('MESSI vs RONALDO - Field Position Heat Maps\n' + 
                     'Career Activity Zones Comparison', 
                     fontsize=20, fontweight='bold', y=0.95, family='Times New Roman')
@@ -144,8 +555,7 @@ class SoccerFieldHeatMap:
             ax = axes[i]
             
             # Generate and plot heatmap
-            points = self.generate_player_data(player)
-            heatmap_data, x_edges, y_edges = self.create_heatmap_data(points)
+            heatmap_data, x_edges, y_edges = self.player_heatmap(player, resolution=resolution)
             
             # Create heatmap
             im = ax.imshow(heatmap_data, extent=[0, self.field_length, 0, self.field_width],
@@ -162,8 +572,9 @@ class SoccerFieldHeatMap:
             ax.set_ylabel('Field Width (meters)', fontsize=12, family='Times New Roman')
             
             # Add colorbar
-            cbar = plt.colorbar(im, ax=ax, shrink=0.8, aspect=20)
+            cbar = fig.colorbar(im, ax=ax, shrink=0.8, aspect=20)
             cbar.set_label('Activity Intensity', fontsize=10, family='Times New Roman')
+            cbar.ax.tick_params(labelfontfamily=FONT_FAMILY)
             
             # Add direction arrow
             ax.annotate('', xy=(110, 75), xytext=(10, 75),
@@ -171,25 +582,19 @@ class SoccerFieldHeatMap:
             ax.text(60, 77, 'Attack Direction', ha='center', fontsize=10, 
                    color='white', fontweight='bold', family='Times New Roman')
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
-    def plot_overlay_comparison(self):
+    def plot_overlay_comparison(self, resolution=50):
         """Create overlay comparison showing both players on same field"""
-        # Set font to Times New Roman
-        plt.rcParams['font.family'] = 'Times New Roman'
-        
-        fig, ax = plt.subplots(figsize=(15, 10))
+        fig, ax = new_figure((15, 10), theme=self.theme)
         fig.suptitle('MESSI vs RONALDO - Overlapping Heat Map Comparison\n' + 
                     'Blue = Messi Zones | Red = Ronaldo Zones | Purple = Overlap', 
                     fontsize=16, fontweight='bold', family='Times New Roman')
         
-        # Generate data for both players
-        messi_points = self.generate_player_data('messi')
-        ronaldo_points = self.generate_player_data('ronaldo')
-        
-        messi_heat, x_edges, y_edges = self.create_heatmap_data(messi_points)
-        ronaldo_heat, _, _ = self.create_heatmap_data(ronaldo_points)
+        # Smoothed grids for both players
+        messi_heat, x_edges, y_edges = self.player_heatmap('messi', resolution=resolution)
+        ronaldo_heat, _, _ = self.player_heatmap('ronaldo', resolution=resolution)
         
         # Normalize the heatmaps
         messi_heat = messi_heat / np.max(messi_heat)
@@ -227,18 +632,19 @@ class SoccerFieldHeatMap:
         ax.legend(handles=legend_elements, loc='upper left', fontsize=10, 
                  labelcolor='white', prop={'family': 'Times New Roman'})
          
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
-    def create_stats_summary(self):
-        """Create a summary statistics comparison"""
-        # Set font to Times New Roman
-        plt.rcParams['font.family'] = 'Times New Roman'
-        
+    def positional_stats(self):
+        """Summary statistics for both players' positions"""
         # Generate data
         messi_points = self.generate_player_data('messi')
         ronaldo_points = self.generate_player_data('ronaldo')
         
+        # Zone shares from the binned grid, not per-point masks
+        messi_zone_shares = self.zone_shares('messi', n_points=len(messi_points))
+        ronaldo_zone_shares = self.zone_shares('ronaldo', n_points=len(ronaldo_points))
+        
         # Calculate statistics
         stats_data = {
             'Player': ['Messi', 'Ronaldo'],
@@ -246,20 +652,18 @@ class SoccerFieldHeatMap:
             'Avg Y Position': [np.mean(messi_points[:, 1]), np.mean(ronaldo_points[:, 1])],
             'X Position Std': [np.std(messi_points[:, 0]), np.std(ronaldo_points[:, 0])],
             'Y Position Std': [np.std(messi_points[:, 1]), np.std(ronaldo_points[:, 1])],
-            'Final Third %': [(messi_points[:, 0] > 80).mean() * 100, 
-                             (ronaldo_points[:, 0] > 80).mean() * 100],
-            'Penalty Area %': [((messi_points[:, 0] > 103.5) & 
-                               (messi_points[:, 1] > 18) & 
-                               (messi_points[:, 1] < 62)).mean() * 100,
-                              ((ronaldo_points[:, 0] > 103.5) & 
-                               (ronaldo_points[:, 1] > 18) & 
-                               (ronaldo_points[:, 1] < 62)).mean() * 100]
+            'Final Third %': [messi_zone_shares['Final Third'], ronaldo_zone_shares['Final Third']],
+            'Penalty Area %': [messi_zone_shares['Penalty Area'], ronaldo_zone_shares['Penalty Area']]
         }
         
-        df = pd.DataFrame(stats_data)
+        return pd.DataFrame(stats_data)
+    
+    def create_stats_summary(self):
+        """Create a summary statistics comparison"""
+        df = self.positional_stats()
         
         # Create comparison plot with Argentina Blue and Portugal Red
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig, axes = new_figure((15, 10), 2, 2, theme=self.theme)
         fig.suptitle('Positional Statistics Comparison', fontsize=16, fontweight='bold', family='Times New Roman')
         
         # Colors: Argentina Blue and Portugal Red
@@ -295,7 +699,7 @@ class SoccerFieldHeatMap:
         ax4.set_xticklabels(['Messi', 'Ronaldo'])
         ax4.legend(prop={'family': 'Times New Roman'})
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig, df
 
 def show():
@@ -374,8 +778,43 @@ def show():
     st.markdown('## 🏟️ Professional Field Position Heat Maps')
     
     analyzer = SoccerFieldHeatMap()
-    fig1 = analyzer.plot_comparison()
-    st.pyplot(fig1, use_container_width=True)
+    if HEATMAP_RENDERER == 'plotly':
+        fig = analyzer.plotly_comparison()
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        image = analyzer.render_image('comparison')
+        with timed(figure=image):
+            st.image(image, use_container_width=True)
+    
+    # Zoomable heat map served from the tile pyramid
+    st.markdown('## 🔍 Zoomable Heat Map')
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        zoom_player = st.radio("Player", ['Messi', 'Ronaldo'], horizontal=True, key='zoom_player')
+    with col2:
+        zoom_window = st.selectbox("Zoom", list(ZOOM_WINDOWS), key='zoom_window')
+    
+    x_range, y_range = ZOOM_WINDOWS[zoom_window]
+    pyramid = analyzer.player_pyramid(zoom_player.lower())
+    z, x_centers, y_centers = pyramid.window(x_range, y_range, sigma_m=3.5)
+    
+    fig_zoom = go.Figure(go.Heatmap(
+        z=z, x=x_centers, y=y_centers,
+        colorscale=MESSI_SCALE if zoom_player == 'Messi' else RONALDO_SCALE,
+        colorbar=dict(title='Activity'),
+        hovertemplate='x %{x:.1f} m<br>y %{y:.1f} m<br>%{z:.1f}<extra></extra>'
+    ))
+    fig_zoom.update_layout(
+        template=pitch_template(),
+        title=f"{zoom_player} - {zoom_window} ({len(x_centers)}x{len(y_centers)} cells)",
+        xaxis=dict(range=list(x_range)),
+        yaxis=dict(range=list(y_range), scaleanchor='x', scaleratio=1),
+        height=500
+    )
+    with timed(figure=fig_zoom):
+        st.plotly_chart(fig_zoom, use_container_width=True)
     
     # Enhanced interactive dashboard
     st.markdown('## 📊 Interactive Performance Dashboard')
@@ -384,10 +823,10 @@ def show():
     col1, col2 = st.columns(2)
     
     with col1:
-        # Zone comparison
+        # Zone comparison, computed from the binned grids through the zone index
         zones = ['Penalty Area', 'Final Third', 'Right Wing', 'Central', 'Left Wing']
-        messi_zones = [15, 68, 25, 30, 8]
-        ronaldo_zones = [28, 75, 12, 45, 15]
+        messi_zones = analyzer.zone_shares('messi')[zones].round().astype(int).tolist()
+        ronaldo_zones = analyzer.zone_shares('ronaldo')[zones].round().astype(int).tolist()
         
         fig_zones = go.Figure()
         fig_zones.add_trace(go.Bar(
@@ -406,7 +845,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_zones, use_container_width=True)
+        with timed(figure=fig_zones):
+            st.plotly_chart(fig_zones, use_container_width=True)
     
     with col2:
         # Goal distance analysis
@@ -432,7 +872,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_goals, use_container_width=True)
+        with timed(figure=fig_goals):
+            st.plotly_chart(fig_goals, use_container_width=True)
     
     # Position attributes comparison
     st.markdown('## 📡 Positional Attributes Comparison')
@@ -464,7 +905,8 @@ def show():
             barmode='group',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_comparison, use_container_width=True)
+        with timed(figure=fig_comparison):
+            st.plotly_chart(fig_comparison, use_container_width=True)
     
     with col2:
         st.markdown("""
@@ -489,14 +931,87 @@ def show():
     st.markdown('## 🔄 Overlapping Heat Map Analysis')
     st.markdown('**Blue = Messi Zones | Red = Ronaldo Zones | Purple = Overlap Areas**')
     
-    fig2 = analyzer.plot_overlay_comparison()
-    st.pyplot(fig2, use_container_width=True)
+    if HEATMAP_RENDERER == 'plotly':
+        fig = analyzer.plotly_overlay()
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        image = analyzer.render_image('overlay')
+        with timed(figure=image):
+            st.image(image, use_container_width=True)
+    
+    # Season / competition filtered maps from the per-group grid store
+    with timed('season grid store'):
+        store, simulated = season_grid_store()
+    if simulated:
+        st.markdown('## 🗓️ Season & Competition Heat Maps (Simulated)')
+        st.info(f"ℹ️ No tracking data found in {POSITION_DIR}: these maps are a simulation. Each "
+                f"season/competition is sampled from the player's style model, {POINTS_PER_GOAL} "
+                "positions per goal in the goal log, with the early-career wing fading over time. "
+                "They illustrate the filters and difference maps, not measured positions.")
+    else:
+        st.markdown('## 🗓️ Season & Competition Heat Maps')
+        st.caption(f"Binned from {len(position_files())} positional data files in {POSITION_DIR}.")
+    first_season, last_season = int(store.keys['season'].min()), int(store.keys['season'].max())
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        season_range = st.slider("Seasons (starting year)", first_season, last_season,
+                                 (first_season, last_season), key='grid_seasons')
+    with col2:
+        competitions = st.multiselect("Competitions (all if empty)",
+                                      sorted(store.keys['competition'].unique()), key='grid_competitions')
+    with col3:
+        grid_view = st.selectbox("Map", ['Messi', 'Ronaldo', 'Messi − Ronaldo', 'Era Difference'],
+                                 key='grid_view')
+    
+    filters = dict(season=season_range, competition=competitions or None)
+    zmid = None
+    if grid_view in ('Messi', 'Ronaldo'):
+        player = grid_view.lower()
+        z = store.heatmap(normalize=True, player=player, **filters) * 100
+        colorscale = MESSI_SCALE if player == 'messi' else RONALDO_SCALE
+        subtitle = f"{store.mask(player=player, **filters).sum()} season/competition grids"
+    elif grid_view == 'Messi − Ronaldo':
+        z = store.difference(dict(player='messi', **filters), dict(player='ronaldo', **filters)) * 100
+        colorscale, zmid = _difference_scale((117, 170, 219), (255, 45, 45)), 0
+        subtitle = "blue = more Messi, red = more Ronaldo"
+    else:
+        era_player = st.radio("Era player", ['Messi', 'Ronaldo'], horizontal=True, key='grid_era_player')
+        split = (season_range[0] + season_range[1]) // 2
+        later = dict(player=era_player.lower(), season=(split + 1, season_range[1]), competition=filters['competition'])
+        earlier = dict(player=era_player.lower(), season=(season_range[0], split), competition=filters['competition'])
+        z = store.difference(later, earlier) * 100
+        colorscale, zmid = _difference_scale((255, 215, 0), (160, 160, 160)), 0
+        subtitle = f"gold = more from {split + 1}, grey = more up to {split}"
+    
+    x_centers = (np.arange(store.nx) + 0.5) * store.length / store.nx
+    y_centers = (np.arange(store.ny) + 0.5) * store.width / store.ny
+    fig_grid = go.Figure(go.Heatmap(
+        z=z, x=x_centers, y=y_centers, colorscale=colorscale, zmid=zmid,
+        colorbar=dict(title='% of activity'),
+        hovertemplate='x %{x:.1f} m<br>y %{y:.1f} m<br>%{z:.3f}%<extra></extra>'
+    ))
+    fig_grid.update_layout(
+        template=pitch_template(),
+        title=f"{grid_view}, {season_range[0]}-{season_range[1]} ({subtitle})",
+        height=520
+    )
+    _lock_aspect(fig_grid, 1)
+    with timed(figure=fig_grid):
+        st.plotly_chart(fig_grid, use_container_width=True)
     
     # Statistical analysis using reference code
     st.markdown('## 📊 Advanced Positional Statistics')
     
-    fig3, stats_df = analyzer.create_stats_summary()
-    st.pyplot(fig3, use_container_width=True)
+    if HEATMAP_RENDERER == 'plotly':
+        fig = analyzer.plotly_stats()
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        image = analyzer.render_image('stats')
+        with timed(figure=image):
+            st.image(image, use_container_width=True)
+    stats_df = analyzer.positional_stats()
     
     # Key metrics with custom design
     st.markdown('## 🎯 Key Performance Metrics')
@@ -653,7 +1168,8 @@ def show():
         font=dict(family='Times New Roman')
     )
     
-    st.plotly_chart(fig_evolution, use_container_width=True)
+    with timed(figure=fig_evolution):
+        st.plotly_chart(fig_evolution, use_container_width=True)
     
     # Key insights
     st.markdown('## 🏆 Key Insights')
@@ -1,9 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from utils.figure_cache import cached_figure
+from utils.render_timing import timed
 
 def show():
     """Display visual international career analysis"""
@@ -241,34 +242,38 @@ def show():
         messi_stats = [108, 56, 183, 3]
         ronaldo_stats = [130, 43, 206, 10]
         
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Messi',
-            x=categories,
-            y=messi_stats,
-            marker_color=MESSI_COLOR,
-            text=messi_stats,
-            textposition='auto',
-            textfont=dict(family='Times New Roman')
-        ))
-        fig.add_trace(go.Bar(
-            name='Ronaldo',
-            x=categories,
-            y=ronaldo_stats,
-            marker_color=RONALDO_COLOR,
-            text=ronaldo_stats,
-            textposition='auto',
-            textfont=dict(family='Times New Roman')
-        ))
-        
-        fig.update_layout(
-            title="International Statistics",
-            barmode='group',
-            height=400,
-            template='plotly_white',
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def international_statistics_figure():
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                name='Messi',
+                x=categories,
+                y=messi_stats,
+                marker_color=MESSI_COLOR,
+                text=messi_stats,
+                textposition='auto',
+                textfont=dict(family='Times New Roman')
+            ))
+            fig.add_trace(go.Bar(
+                name='Ronaldo',
+                x=categories,
+                y=ronaldo_stats,
+                marker_color=RONALDO_COLOR,
+                text=ronaldo_stats,
+                textposition='auto',
+                textfont=dict(family='Times New Roman')
+            ))
+            
+            fig.update_layout(
+                title="International Statistics",
+                barmode='group',
+                height=400,
+                template='plotly_white',
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("international.international_statistics", international_statistics_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Performance radar chart
@@ -276,33 +281,37 @@ def show():
         messi_radar = [85, 90, 95, 85, 92]
         ronaldo_radar = [90, 70, 85, 95, 88]
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatterpolar(
-            r=messi_radar,
-            theta=categories,
-            fill='toself',
-            name='Messi',
-            fillcolor=f'rgba(117, 170, 219, 0.3)',
-            line=dict(color=MESSI_COLOR, width=3)
-        ))
-        fig.add_trace(go.Scatterpolar(
-            r=ronaldo_radar,
-            theta=categories,
-            fill='toself',
-            name='Ronaldo',
-            fillcolor=f'rgba(255, 45, 45, 0.3)',
-            line=dict(color=RONALDO_COLOR, width=3)
-        ))
-        
-        fig.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-            showlegend=True,
-            title="Performance Radar",
-            height=400,
-            template='plotly_white',
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def performance_radar_figure():
+            fig = go.Figure()
+            fig.add_trace(go.Scatterpolar(
+                r=messi_radar,
+                theta=categories,
+                fill='toself',
+                name='Messi',
+                fillcolor=f'rgba(117, 170, 219, 0.3)',
+                line=dict(color=MESSI_COLOR, width=3)
+            ))
+            fig.add_trace(go.Scatterpolar(
+                r=ronaldo_radar,
+                theta=categories,
+                fill='toself',
+                name='Ronaldo',
+                fillcolor=f'rgba(255, 45, 45, 0.3)',
+                line=dict(color=RONALDO_COLOR, width=3)
+            ))
+            
+            fig.update_layout(
+                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+                showlegend=True,
+                title="Performance Radar",
+                height=400,
+                template='plotly_white',
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("international.performance_radar", performance_radar_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Tournament performance
     st.markdown('## 🏆 Tournament Performance')
@@ -342,7 +351,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Continental tournaments
@@ -350,39 +360,43 @@ def show():
         goals = [13, 14]
         tournaments = [7, 6]
         
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=['Continental Goals', 'Continental Tournaments']
-        )
-        
-        fig.add_trace(go.Bar(
-            x=continental_stats,
-            y=goals,
-            marker_color=[MESSI_COLOR, RONALDO_COLOR],
-            text=goals,
-            textposition='auto',
-            name='Goals',
-            textfont=dict(family='Times New Roman')
-        ), row=1, col=1)
-        
-        fig.add_trace(go.Bar(
-            x=continental_stats,
-            y=tournaments,
-            marker_color=[MESSI_COLOR, RONALDO_COLOR],
-            text=tournaments,
-            textposition='auto',
-            name='Tournaments',
-            textfont=dict(family='Times New Roman')
-        ), row=2, col=1)
-        
-        fig.update_layout(
-            title="Continental Performance",
-            height=400,
-            template='plotly_white',
-            showlegend=False,
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def continental_performance_figure():
+            fig = make_subplots(
+                rows=2, cols=1,
+                subplot_titles=['Continental Goals', 'Continental Tournaments']
+            )
+            
+            fig.add_trace(go.Bar(
+                x=continental_stats,
+                y=goals,
+                marker_color=[MESSI_COLOR, RONALDO_COLOR],
+                text=goals,
+                textposition='auto',
+                name='Goals',
+                textfont=dict(family='Times New Roman')
+            ), row=1, col=1)
+            
+            fig.add_trace(go.Bar(
+                x=continental_stats,
+                y=tournaments,
+                marker_color=[MESSI_COLOR, RONALDO_COLOR],
+                text=tournaments,
+                textposition='auto',
+                name='Tournaments',
+                textfont=dict(family='Times New Roman')
+            ), row=2, col=1)
+            
+            fig.update_layout(
+                title="Continental Performance",
+                height=400,
+                template='plotly_white',
+                showlegend=False,
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("international.continental_performance", continental_performance_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         # Trophy comparison
@@ -417,7 +431,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Career timeline
     st.markdown('## 📈 International Career Timeline')
@@ -430,38 +445,42 @@ def show():
         messi_goals = [0, 2, 6, 4, 5, 7, 12, 5, 8, 11, 5, 6, 4, 7, 9, 4, 1, 7, 8]
         ronaldo_goals = [2, 7, 8, 6, 5, 7, 8, 11, 5, 9, 7, 4, 3, 8, 2, 5, 14, 8, 1]
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=messi_goals,
-            mode='lines+markers',
-            name='Messi',
-            line=dict(color=MESSI_COLOR, width=3),
-            marker=dict(size=8)
-        ))
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=ronaldo_goals,
-            mode='lines+markers',
-            name='Ronaldo',
-            line=dict(color=RONALDO_COLOR, width=3),
-            marker=dict(size=8)
-        ))
-        
-        # Add trophy annotations
-        fig.add_annotation(x=2022, y=8, text="🏆 WC Win", arrowcolor=MESSI_COLOR, font=dict(family='Times New Roman'))
-        fig.add_annotation(x=2016, y=14, text="🏆 Euro Win", arrowcolor=RONALDO_COLOR, font=dict(family='Times New Roman'))
-        fig.add_annotation(x=2021, y=4, text="🏆 Copa Win", arrowcolor=MESSI_COLOR, font=dict(family='Times New Roman'))
-        
-        fig.update_layout(
-            title="International Goals by Year",
-            xaxis_title="Year",
-            yaxis_title="Goals",
-            height=400,
-            template='plotly_white',
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def international_goals_by_year_figure():
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=years,
+                y=messi_goals,
+                mode='lines+markers',
+                name='Messi',
+                line=dict(color=MESSI_COLOR, width=3),
+                marker=dict(size=8)
+            ))
+            fig.add_trace(go.Scatter(
+                x=years,
+                y=ronaldo_goals,
+                mode='lines+markers',
+                name='Ronaldo',
+                line=dict(color=RONALDO_COLOR, width=3),
+                marker=dict(size=8)
+            ))
+            
+            # Add trophy annotations
+            fig.add_annotation(x=2022, y=8, text="🏆 WC Win", arrowcolor=MESSI_COLOR, font=dict(family='Times New Roman'))
+            fig.add_annotation(x=2016, y=14, text="🏆 Euro Win", arrowcolor=RONALDO_COLOR, font=dict(family='Times New Roman'))
+            fig.add_annotation(x=2021, y=4, text="🏆 Copa Win", arrowcolor=MESSI_COLOR, font=dict(family='Times New Roman'))
+            
+            fig.update_layout(
+                title="International Goals by Year",
+                xaxis_title="Year",
+                yaxis_title="Goals",
+                height=400,
+                template='plotly_white',
+                font=dict(family='Times New Roman')
+            )
+            return fig
+        fig = cached_figure("international.international_goals_by_year", international_goals_by_year_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Cumulative career stats
@@ -496,7 +515,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Efficiency analysis
     st.markdown('## ⚡ Efficiency Analysis')
@@ -540,7 +560,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Age performance
@@ -575,7 +596,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Head-to-head comparison table
     st.markdown('## 📋 Complete International Comparison')
@@ -629,7 +651,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Overall winner pie
@@ -651,7 +674,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Summary metrics with custom design
     st.markdown('## 🎯 International Career Summary')
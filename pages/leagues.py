@@ -1,9 +1,9 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 from utils.data_loader import load_all_data
+from utils.render_timing import timed
 
 def show():
     """Display the leagues and competitions analysis page"""
@@ -116,7 +116,8 @@ def show():
             template='plotly_white',
             xaxis_tickangle=-45
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Goals per game by league
@@ -155,7 +156,8 @@ def show():
             template='plotly_white',
             xaxis_tickangle=-45
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # League statistics detailed table
     st.markdown('<h3 class="section-header">📊 Detailed League Statistics</h3>', unsafe_allow_html=True)
@@ -392,7 +394,8 @@ def show():
     fig.add_trace(go.Bar(x=ronaldo_success_leagues, y=ronaldo_success_values, name='Ronaldo Success Rate', marker_color='#FF6B6B', showlegend=False), row=2, col=2)
     
     fig.update_layout(height=600, title_text="📊 League Performance Analysis")
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # League style adaptation
     st.markdown('<h3 class="section-header">🎭 Playing Style by League</h3>', unsafe_allow_html=True)
@@ -1,9 +1,32 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 from utils.data_loader import load_all_data
+from utils.render_timing import timed
+
+@st.fragment
+def goat_poll():
+    """GOAT vote; reruns on its own when the choice changes"""
+    st.markdown('<h3 class="section-header">🎮 Cast Your Vote</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        goat_choice = st.radio(
+            "Who is the GOAT?",
+            ["🇦🇷 Messi", "🇵🇹 Ronaldo", "🤝 Both"],
+            horizontal=True,
+            key="goat_poll"
+        )
+        
+        if goat_choice:
+            if "Messi" in goat_choice:
+                st.success("🇦🇷 Team Messi! Natural genius and pure artistry!")
+            elif "Ronaldo" in goat_choice:
+                st.success("🇵🇹 Team Ronaldo! Athletic perfection and goal machine!")
+            else:
+                st.info("🤝 Both legends! They've elevated each other to greatness!")
 
 def show():
     """Display the refined overview page for Messi vs Ronaldo with focus on visualizations"""
@@ -110,7 +133,8 @@ def show():
         height=500,
         font=dict(size=14)
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Career timeline with key milestones
     st.markdown('<h2 class="section-header">📈 CAREER GOALS TIMELINE</h2>', unsafe_allow_html=True)
@@ -161,7 +185,8 @@ def show():
         hovermode='x unified',
         showlegend=True
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Multi-dimensional comparison
     st.markdown('<h2 class="section-header">📊 PERFORMANCE BREAKDOWN</h2>', unsafe_allow_html=True)
@@ -202,7 +227,8 @@ def show():
             showlegend=True,
             yaxis=dict(range=[0, 1300])
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Trophy distribution pie charts
@@ -235,7 +261,8 @@ def show():
         ), row=1, col=2)
         
         fig.update_layout(height=400, title_text="🏆 Trophy Distribution")
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Age performance analysis
     st.markdown('<h2 class="section-header">⏰ LONGEVITY ANALYSIS</h2>', unsafe_allow_html=True)
@@ -278,7 +305,8 @@ def show():
             xaxis_title="Age Range",
             yaxis_title="Performance Metric"
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         fig = go.Figure(data=go.Heatmap(
@@ -297,7 +325,8 @@ def show():
             xaxis_title="Age Range",
             yaxis_title="Performance Metric"
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Interactive comparison dashboard
     st.markdown('<h2 class="section-header">🎯 QUICK FACTS DASHBOARD</h2>', unsafe_allow_html=True)
@@ -379,28 +408,11 @@ def show():
         height=600,
         font=dict(size=14)
     )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Interactive GOAT poll
-    st.markdown('<h3 class="section-header">🎮 Cast Your Vote</h3>', unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns([1, 2, 1])
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
-    with col2:
-        goat_choice = st.radio(
-            "Who is the GOAT?",
-            ["🇦🇷 Messi", "🇵🇹 Ronaldo", "🤝 Both"],
-            horizontal=True,
-            key="goat_poll"
-        )
-        
-        if goat_choice:
-            if "Messi" in goat_choice:
-                st.success("🇦🇷 Team Messi! Natural genius and pure artistry!")
-            elif "Ronaldo" in goat_choice:
-                st.success("🇵🇹 Team Ronaldo! Athletic perfection and goal machine!")
-            else:
-                st.info("🤝 Both legends! They've elevated each other to greatness!")
+    # Interactive GOAT poll - a fragment, so voting reruns only the poll
+    goat_poll()
     
     # Navigation prompt
     
@@ -1,9 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from utils.figure_cache import cached_figure
+from utils.render_timing import timed
 
 def show():
     """Display clean physical attributes analysis"""
@@ -116,7 +117,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Key metrics table
@@ -168,7 +170,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Top speed gauges
@@ -219,7 +222,8 @@ def show():
         ), row=1, col=2)
         
         fig.update_layout(height=400, title_text="Top Speed Comparison", font=dict(family='Times New Roman'))
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Strength and power analysis
     st.markdown('## 💪 Strength & Power Analysis')
@@ -255,7 +259,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Jumping ability
@@ -276,7 +281,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col3:
         # Balance comparison
@@ -297,7 +303,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Injury record analysis
     st.markdown('## 🏥 Injury Record & Availability')
@@ -337,7 +344,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Availability by age
@@ -371,53 +379,58 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Physical evolution over career
     st.markdown('## 📈 Physical Evolution Over Career')
     
     career_phases = ['Early Career', 'Peak Years', 'Late Career']
     
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('Speed Evolution', 'Strength Evolution', 'Stamina Evolution', 'Agility Evolution')
-    )
-    
-    # Speed evolution
-    messi_speed = [90, 95, 85]
-    ronaldo_speed = [85, 100, 90]
-    fig.add_trace(go.Scatter(x=career_phases, y=messi_speed, name='Messi Speed', 
-                           line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10)), row=1, col=1)
-    fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_speed, name='Ronaldo Speed', 
-                           line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10)), row=1, col=1)
-    
-    # Strength evolution
-    messi_strength = [70, 80, 85]
-    ronaldo_strength = [80, 95, 100]
-    fig.add_trace(go.Scatter(x=career_phases, y=messi_strength, name='Messi Strength', 
-                           line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10), showlegend=False), row=1, col=2)
-    fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_strength, name='Ronaldo Strength', 
-                           line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10), showlegend=False), row=1, col=2)
-    
-    # Stamina evolution
-    messi_stamina = [75, 85, 95]
-    ronaldo_stamina = [90, 95, 98]
-    fig.add_trace(go.Scatter(x=career_phases, y=messi_stamina, name='Messi Stamina', 
-                           line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=1)
-    fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_stamina, name='Ronaldo Stamina', 
-                           line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=1)
-    
-    # Agility evolution
-    messi_agility = [95, 100, 95]
-    ronaldo_agility = [90, 95, 85]
-    fig.add_trace(go.Scatter(x=career_phases, y=messi_agility, name='Messi Agility', 
-                           line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=2)
-    fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_agility, name='Ronaldo Agility', 
-                           line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=2)
-    
-    fig.update_layout(height=600, title_text="Physical Attributes Through Career Phases", 
-                     template='plotly_white', font=dict(family='Times New Roman'))
-    st.plotly_chart(fig, use_container_width=True)
+    def physical_evolution_figure():
+        fig = make_subplots(
+            rows=2, cols=2,
+            subplot_titles=('Speed Evolution', 'Strength Evolution', 'Stamina Evolution', 'Agility Evolution')
+        )
+        
+        # Speed evolution
+        messi_speed = [90, 95, 85]
+        ronaldo_speed = [85, 100, 90]
+        fig.add_trace(go.Scatter(x=career_phases, y=messi_speed, name='Messi Speed', 
+                               line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10)), row=1, col=1)
+        fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_speed, name='Ronaldo Speed', 
+                               line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10)), row=1, col=1)
+        
+        # Strength evolution
+        messi_strength = [70, 80, 85]
+        ronaldo_strength = [80, 95, 100]
+        fig.add_trace(go.Scatter(x=career_phases, y=messi_strength, name='Messi Strength', 
+                               line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10), showlegend=False), row=1, col=2)
+        fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_strength, name='Ronaldo Strength', 
+                               line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10), showlegend=False), row=1, col=2)
+        
+        # Stamina evolution
+        messi_stamina = [75, 85, 95]
+        ronaldo_stamina = [90, 95, 98]
+        fig.add_trace(go.Scatter(x=career_phases, y=messi_stamina, name='Messi Stamina', 
+                               line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=1)
+        fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_stamina, name='Ronaldo Stamina', 
+                               line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=1)
+        
+        # Agility evolution
+        messi_agility = [95, 100, 95]
+        ronaldo_agility = [90, 95, 85]
+        fig.add_trace(go.Scatter(x=career_phases, y=messi_agility, name='Messi Agility', 
+                               line=dict(color=MESSI_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=2)
+        fig.add_trace(go.Scatter(x=career_phases, y=ronaldo_agility, name='Ronaldo Agility', 
+                               line=dict(color=RONALDO_COLOR, width=4), marker=dict(size=10), showlegend=False), row=2, col=2)
+        
+        fig.update_layout(height=600, title_text="Physical Attributes Through Career Phases", 
+                         template='plotly_white', font=dict(family='Times New Roman'))
+        return fig
+    fig = cached_figure("physical.physical_evolution", physical_evolution_figure)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Physical comparison metrics with custom design
     st.markdown('## 🏆 Physical Metrics Summary')
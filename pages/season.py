@@ -1,9 +1,108 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from utils.match_log_summary import match_log_summary
+from utils.render_timing import timed
+
+@st.fragment
+def season_explorer(seasons_df, MESSI_COLOR, RONALDO_COLOR):
+    """Season selector and dashboard; reruns on its own when the season changes"""
+    st.markdown('## 🎯 Season Explorer')
+    
+    selected_season = st.selectbox(
+        "Select a season for detailed analysis:",
+        seasons_df['Season'].tolist(),
+        index=8  # Default to 2011-12 (Messi's record season)
+    )
+    
+    # Selected Season Dashboard
+    if selected_season:
+        season_row = seasons_df[seasons_df['Season'] == selected_season].iloc[0]
+        
+        st.markdown(f'### 🔍 {selected_season} Season Dashboard')
+        
+        # Season comparison cards
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, {MESSI_COLOR} 0%, #5a9bd4 100%);
+                color: white;
+                padding: 2rem;
+                border-radius: 15px;
+                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+                text-align: center;
+                font-family: 'Times New Roman', serif;
+            ">
+                <h3 style="margin: 0;">🇦🇷 MESSI ({season_row['Messi_Age']} years old)</h3>
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin: 1.5rem 0;">
+                    <div><strong style="font-size: 2rem;">{season_row['Messi_Goals']}</strong><br><small>Goals</small></div>
+                    <div><strong style="font-size: 2rem;">{season_row['Messi_Assists']}</strong><br><small>Assists</small></div>
+                    <div><strong style="font-size: 2rem;">{season_row['Messi_Apps']}</strong><br><small>Games</small></div>
+                    <div><strong style="font-size: 2rem;">{season_row['Messi_Trophies']}</strong><br><small>Trophies</small></div>
+                </div>
+                <p style="margin: 0; opacity: 0.9; font-style: italic;">Club: {season_row['Messi_Club']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            messi_gpg = season_row['Messi_Goals']/season_row['Messi_Apps']
+            ronaldo_gpg = season_row['Ronaldo_Goals']/season_row['Ronaldo_Apps']
+            messi_contrib = season_row['Messi_Goals'] + season_row['Messi_Assists']
+            ronaldo_contrib = season_row['Ronaldo_Goals'] + season_row['Ronaldo_Assists']
+            
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(145deg, rgba(255,255,255,0.1), rgba(255,255,255,0.05));
+                backdrop-filter: blur(20px);
+                border-radius: 20px;
+                padding: 25px;
+                text-align: center;
+                border: 2px solid #FFD700;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+                font-family: 'Times New Roman', serif;
+                margin: 10px 0;
+            ">
+                <h3 style="color: #FFD700; margin: 0 0 20px 0;">⚖️ HEAD-TO-HEAD</h3>
+                <div style="margin: 15px 0;">
+                    <div style="font-size: 1.1rem; margin: 10px 0;"><strong>Goals per Game:</strong></div>
+                    <div style="font-size: 1.5rem; color: #FFD700;">{messi_gpg:.2f} vs {ronaldo_gpg:.2f}</div>
+                </div>
+                <div style="margin: 15px 0;">
+                    <div style="font-size: 1.1rem; margin: 10px 0;"><strong>Total Contributions:</strong></div>
+                    <div style="font-size: 1.5rem; color: #FFD700;">{messi_contrib} vs {ronaldo_contrib}</div>
+                </div>
+                <div style="margin: 15px 0;">
+                    <div style="font-size: 1.1rem; margin: 10px 0;"><strong>Trophies:</strong></div>
+                    <div style="font-size: 1.5rem; color: #FFD700;">{season_row['Messi_Trophies']} vs {season_row['Ronaldo_Trophies']}</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, {RONALDO_COLOR} 0%, #e02525 100%);
+                color: white;
+                padding: 2rem;
+                border-radius: 15px;
+                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+                text-align: center;
+                font-family: 'Times New Roman', serif;
+            ">
+                <h3 style="margin: 0;">🇵🇹 RONALDO ({season_row['Ronaldo_Age']} years old)</h3>
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin: 1.5rem 0;">
+                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Goals']}</strong><br><small>Goals</small></div>
+                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Assists']}</strong><br><small>Assists</small></div>
+                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Apps']}</strong><br><small>Games</small></div>
+                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Trophies']}</strong><br><small>Trophies</small></div>
+                </div>
+                <p style="margin: 0; opacity: 0.9; font-style: italic;">Club: {season_row['Ronaldo_Club']}</p>
+            </div>
+            """, unsafe_allow_html=True)
 
 def show():
     """Display season-by-season performance analysis with clutch design theme"""
@@ -218,101 +317,8 @@ def show():
         </div>
         """, unsafe_allow_html=True)
     
-    # Interactive Season Selector
-    st.markdown('## 🎯 Season Explorer')
-    
-    selected_season = st.selectbox(
-        "Select a season for detailed analysis:",
-        seasons_df['Season'].tolist(),
-        index=8  # Default to 2011-12 (Messi's record season)
-    )
-    
-    # Selected Season Dashboard
-    if selected_season:
-        season_row = seasons_df[seasons_df['Season'] == selected_season].iloc[0]
-        
-        st.markdown(f'### 🔍 {selected_season} Season Dashboard')
-        
-        # Season comparison cards
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, {MESSI_COLOR} 0%, #5a9bd4 100%);
-                color: white;
-                padding: 2rem;
-                border-radius: 15px;
-                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-                text-align: center;
-                font-family: 'Times New Roman', serif;
-            ">
-                <h3 style="margin: 0;">🇦🇷 MESSI ({season_row['Messi_Age']} years old)</h3>
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin: 1.5rem 0;">
-                    <div><strong style="font-size: 2rem;">{season_row['Messi_Goals']}</strong><br><small>Goals</small></div>
-                    <div><strong style="font-size: 2rem;">{season_row['Messi_Assists']}</strong><br><small>Assists</small></div>
-                    <div><strong style="font-size: 2rem;">{season_row['Messi_Apps']}</strong><br><small>Games</small></div>
-                    <div><strong style="font-size: 2rem;">{season_row['Messi_Trophies']}</strong><br><small>Trophies</small></div>
-                </div>
-                <p style="margin: 0; opacity: 0.9; font-style: italic;">Club: {season_row['Messi_Club']}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            messi_gpg = season_row['Messi_Goals']/season_row['Messi_Apps']
-            ronaldo_gpg = season_row['Ronaldo_Goals']/season_row['Ronaldo_Apps']
-            messi_contrib = season_row['Messi_Goals'] + season_row['Messi_Assists']
-            ronaldo_contrib = season_row['Ronaldo_Goals'] + season_row['Ronaldo_Assists']
-            
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(145deg, rgba(255,255,255,0.1), rgba(255,255,255,0.05));
-                backdrop-filter: blur(20px);
-                border-radius: 20px;
-                padding: 25px;
-                text-align: center;
-                border: 2px solid #FFD700;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                font-family: 'Times New Roman', serif;
-                margin: 10px 0;
-            ">
-                <h3 style="color: #FFD700; margin: 0 0 20px 0;">⚖️ HEAD-TO-HEAD</h3>
-                <div style="margin: 15px 0;">
-                    <div style="font-size: 1.1rem; margin: 10px 0;"><strong>Goals per Game:</strong></div>
-                    <div style="font-size: 1.5rem; color: #FFD700;">{messi_gpg:.2f} vs {ronaldo_gpg:.2f}</div>
-                </div>
-                <div style="margin: 15px 0;">
-                    <div style="font-size: 1.1rem; margin: 10px 0;"><strong>Total Contributions:</strong></div>
-                    <div style="font-size: 1.5rem; color: #FFD700;">{messi_contrib} vs {ronaldo_contrib}</div>
-                </div>
-                <div style="margin: 15px 0;">
-                    <div style="font-size: 1.1rem; margin: 10px 0;"><strong>Trophies:</strong></div>
-                    <div style="font-size: 1.5rem; color: #FFD700;">{season_row['Messi_Trophies']} vs {season_row['Ronaldo_Trophies']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, {RONALDO_COLOR} 0%, #e02525 100%);
-                color: white;
-                padding: 2rem;
-                border-radius: 15px;
-                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-                text-align: center;
-                font-family: 'Times New Roman', serif;
-            ">
-                <h3 style="margin: 0;">🇵🇹 RONALDO ({season_row['Ronaldo_Age']} years old)</h3>
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin: 1.5rem 0;">
-                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Goals']}</strong><br><small>Goals</small></div>
-                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Assists']}</strong><br><small>Assists</small></div>
-                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Apps']}</strong><br><small>Games</small></div>
-                    <div><strong style="font-size: 2rem;">{season_row['Ronaldo_Trophies']}</strong><br><small>Trophies</small></div>
-                </div>
-                <p style="margin: 0; opacity: 0.9; font-style: italic;">Club: {season_row['Ronaldo_Club']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+    # Interactive Season Selector - a fragment, so picking a season reruns only this section
+    season_explorer(seasons_df, MESSI_COLOR, RONALDO_COLOR)
     
     # Career Timeline
     st.markdown('## 📈 Complete Career Timeline')
@@ -350,7 +356,8 @@ def show():
             font=dict(family='Times New Roman')
         )
         fig.update_xaxes(tickangle=-45)
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Assists timeline
@@ -381,7 +388,8 @@ def show():
             font=dict(family='Times New Roman')
         )
         fig.update_xaxes(tickangle=-45)
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Peak Seasons Analysis
     st.markdown('## 🔥 Peak Seasons Heatmap')
@@ -412,7 +420,8 @@ def show():
             xaxis_tickangle=-45,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Ronaldo performance matrix
@@ -437,7 +446,8 @@ def show():
             xaxis_tickangle=-45,
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Age Performance Analysis
     st.markdown('## ⏰ Performance by Age')
@@ -487,7 +497,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Career phases performance
@@ -533,7 +544,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Top 5 Seasons Comparison
     st.markdown('## 🏔️ Top 5 Seasons')
@@ -569,7 +581,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         ronaldo_top5 = seasons_df.nlargest(5, 'Ronaldo_Goals')[['Season', 'Ronaldo_Goals', 'Ronaldo_Assists', 'Ronaldo_Age']]
@@ -600,7 +613,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     # Trophy Timeline
     st.markdown('## 🏆 Trophy Timeline')
@@ -633,7 +647,8 @@ def show():
         xaxis_tickangle=-45,
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig, use_container_width=True)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Complete Season Statistics Table
     st.markdown('## 📋 Complete Season-by-Season Statistics')
@@ -661,6 +676,23 @@ def show():
     
     st.dataframe(table_df, use_container_width=True, height=600)
     
+    # Season totals rolled up from the match-by-match logs
+    st.markdown('## 🧾 Match-Log Season Summary')
+    
+    log_seasons = match_log_summary("season")
+    if log_seasons.empty:
+        st.info("No match-by-match logs available yet.")
+    else:
+        log_df = log_seasons[[
+            'player', 'season', 'matches', 'minutes', 'goals', 'assists', 'xG', 'xAG',
+            'goals_per90', 'assists_per90', 'xG_delta'
+        ]]
+        log_df.columns = [
+            'Player', 'Season', 'Matches', 'Minutes', 'Goals', 'Assists', 'xG', 'xAG',
+            'Goals/90', 'Assists/90', 'Goals - xG'
+        ]
+        st.dataframe(log_df, use_container_width=True, hide_index=True)
+    
     # Summary metrics with custom design
     st.markdown('## 🏁 Season Legacy Championship')
     
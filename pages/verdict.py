@@ -1,8 +1,9 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import numpy as np
+from utils.figure_cache import cached_figure
+from utils.render_timing import timed
 
 def show():
     """Display the final verdict with clutch design theme"""
@@ -230,7 +231,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_radar, use_container_width=True)
+        with timed(figure=fig_radar):
+            st.plotly_chart(fig_radar, use_container_width=True)
     
     with col2:
         # Category winners visualization
@@ -261,7 +263,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_winners, use_container_width=True)
+        with timed(figure=fig_winners):
+            st.plotly_chart(fig_winners, use_container_width=True)
     
     # Head-to-head score comparison
     st.markdown('## ⚖️ Head-to-Head Score Comparison')
@@ -295,7 +298,8 @@ def show():
         template='plotly_white',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig_comparison, use_container_width=True)
+    with timed(figure=fig_comparison):
+        st.plotly_chart(fig_comparison, use_container_width=True)
     
     # Performance heatmap
     st.markdown('## 🌡️ Performance Intensity Heatmap')
@@ -324,7 +328,8 @@ def show():
         template='plotly_white',
         font=dict(family='Times New Roman')
     )
-    st.plotly_chart(fig_heatmap, use_container_width=True)
+    with timed(figure=fig_heatmap):
+        st.plotly_chart(fig_heatmap, use_container_width=True)
     
     # Why Messi wins despite fewer categories
     st.markdown('## 🤔 Why Messi Wins Despite Ronaldo Having More Categories?')
@@ -364,7 +369,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_count, use_container_width=True)
+        with timed(figure=fig_count):
+            st.plotly_chart(fig_count, use_container_width=True)
         
         st.markdown(f"""
         <div style="
@@ -397,7 +403,8 @@ def show():
             template='plotly_white',
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_weighted, use_container_width=True)
+        with timed(figure=fig_weighted):
+            st.plotly_chart(fig_weighted, use_container_width=True)
         
         st.markdown(f"""
         <div style="
@@ -421,49 +428,53 @@ def show():
     high_impact_ronaldo = [ronaldo_scores[i] for i in high_impact_indices]
     high_impact_weights = [weights[i] for i in high_impact_indices]
     
-    fig_high_impact = go.Figure()
-    fig_high_impact.add_trace(go.Bar(
-        name='🇦🇷 Messi (High Impact)',
-        x=high_impact_categories,
-        y=high_impact_messi,
-        marker_color=MESSI_COLOR,
-        text=[f"{score:.1f}" for score in high_impact_messi],
-        textposition='auto',
-        textfont=dict(family='Times New Roman')
-    ))
-    fig_high_impact.add_trace(go.Bar(
-        name='🇵🇹 Ronaldo (High Impact)',
-        x=high_impact_categories,
-        y=high_impact_ronaldo,
-        marker_color=RONALDO_COLOR,
-        text=[f"{score:.1f}" for score in high_impact_ronaldo],
-        textposition='auto',
-        textfont=dict(family='Times New Roman')
-    ))
-    
-    # Add weight indicators
-    for i, (cat, weight) in enumerate(zip(high_impact_categories, high_impact_weights)):
-        fig_high_impact.add_annotation(
-            x=i,
-            y=10.5,
-            text=f"Weight: {weight}x",
-            showarrow=False,
-            font=dict(size=10, color='orange', family='Times New Roman'),
-            bgcolor='rgba(255,165,0,0.2)',
-            bordercolor='orange'
+    def high_impact_scores_figure():
+        fig_high_impact = go.Figure()
+        fig_high_impact.add_trace(go.Bar(
+            name='🇦🇷 Messi (High Impact)',
+            x=high_impact_categories,
+            y=high_impact_messi,
+            marker_color=MESSI_COLOR,
+            text=[f"{score:.1f}" for score in high_impact_messi],
+            textposition='auto',
+            textfont=dict(family='Times New Roman')
+        ))
+        fig_high_impact.add_trace(go.Bar(
+            name='🇵🇹 Ronaldo (High Impact)',
+            x=high_impact_categories,
+            y=high_impact_ronaldo,
+            marker_color=RONALDO_COLOR,
+            text=[f"{score:.1f}" for score in high_impact_ronaldo],
+            textposition='auto',
+            textfont=dict(family='Times New Roman')
+        ))
+        
+        # Add weight indicators
+        for i, (cat, weight) in enumerate(zip(high_impact_categories, high_impact_weights)):
+            fig_high_impact.add_annotation(
+                x=i,
+                y=10.5,
+                text=f"Weight: {weight}x",
+                showarrow=False,
+                font=dict(size=10, color='orange', family='Times New Roman'),
+                bgcolor='rgba(255,165,0,0.2)',
+                bordercolor='orange'
+            )
+        
+        fig_high_impact.update_layout(
+            barmode='group',
+            height=400,
+            xaxis_tickangle=-45,
+            yaxis_title="Score (0-10)",
+            yaxis=dict(range=[0, 11]),
+            title="Categories That Matter Most (Weight ≥ 1.2x)",
+            template='plotly_white',
+            font=dict(family='Times New Roman')
         )
-    
-    fig_high_impact.update_layout(
-        barmode='group',
-        height=400,
-        xaxis_tickangle=-45,
-        yaxis_title="Score (0-10)",
-        yaxis=dict(range=[0, 11]),
-        title="Categories That Matter Most (Weight ≥ 1.2x)",
-        template='plotly_white',
-        font=dict(family='Times New Roman')
-    )
-    st.plotly_chart(fig_high_impact, use_container_width=True)
+        return fig_high_impact
+    fig = cached_figure("verdict.high_impact_scores", high_impact_scores_figure)
+    with timed(figure=fig):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Key insight
     messi_high_impact_wins = sum(1 for m, r in zip(high_impact_messi, high_impact_ronaldo) if m > r)
@@ -585,23 +596,27 @@ def show():
         differences = [m - r for m, r in zip(messi_scores, ronaldo_scores)]
         colors = [MESSI_COLOR if diff > 0 else RONALDO_COLOR for diff in differences]
         
-        fig_diff = go.Figure(data=[
-            go.Bar(x=categories, y=differences, marker_color=colors, 
-                   text=[f"{diff:+.1f}" for diff in differences], 
-                   textposition='outside',
-                   textfont=dict(family='Times New Roman'))
-        ])
-        fig_diff.update_layout(
-            height=400,
-            xaxis_tickangle=-45,
-            yaxis_title="Score Difference (Messi - Ronaldo)",
-            showlegend=False,
-            yaxis=dict(zeroline=True, zerolinewidth=2, zerolinecolor='black'),
-            title="Score Differences by Category",
-            template='plotly_white',
-            font=dict(family='Times New Roman')
-        )
-        st.plotly_chart(fig_diff, use_container_width=True)
+        def score_difference_figure():
+            fig_diff = go.Figure(data=[
+                go.Bar(x=categories, y=differences, marker_color=colors, 
+                       text=[f"{diff:+.1f}" for diff in differences], 
+                       textposition='outside',
+                       textfont=dict(family='Times New Roman'))
+            ])
+            fig_diff.update_layout(
+                height=400,
+                xaxis_tickangle=-45,
+                yaxis_title="Score Difference (Messi - Ronaldo)",
+                showlegend=False,
+                yaxis=dict(zeroline=True, zerolinewidth=2, zerolinecolor='black'),
+                title="Score Differences by Category",
+                template='plotly_white',
+                font=dict(family='Times New Roman')
+            )
+            return fig_diff
+        fig = cached_figure("verdict.score_difference", score_difference_figure)
+        with timed(figure=fig):
+            st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Category dominance pie chart
@@ -620,7 +635,8 @@ def show():
                              font=dict(family='Times New Roman'))],
             font=dict(family='Times New Roman')
         )
-        st.plotly_chart(fig_donut, use_container_width=True)
+        with timed(figure=fig_donut):
+            st.plotly_chart(fig_donut, use_container_width=True)
     
     # Interactive voting
     st.markdown('## 🗳️ Cast Your Vote')
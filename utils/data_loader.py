@@ -1,79 +1,297 @@
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
 import pandas as pd
 import streamlit as st
 from pathlib import Path
 
+from utils.dataset_registry import CORE_KEYS, resolve_registry
+from utils.dtype_plan import apply_dtype_plan, infer_dtype_plan, planned
+from utils.render_timing import record
+from utils.shared_datasets import SHARED_DIR, shared_loaders
+from utils.snapshot_cache import read_csv_cached
+
 # ===== Global Arrow-safe Fix =====
 def make_arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Ensure all DataFrame columns are Arrow-compatible:
-    - Converts mixed object columns to numeric if possible (int or float).
-    - If numbers contain decimals, force float64.
-    - Keeps text columns as strings.
+    Ensure all DataFrame columns are Arrow-compatible in one ``astype`` pass:
+    - Fully numeric text columns become int64 / nullable Int64 / float64.
+    - Repetitive text becomes categorical, other text string[pyarrow].
+    CSV-backed datasets go through ``planned`` instead so the plan is only inferred once.
+    """
+    return apply_dtype_plan(df, infer_dtype_plan(df))
+
+
+# ===== Lazy dataset mapping =====
+class LazyDatasets(Mapping):
+    """
+    Read-only ``{key: DataFrame}`` mapping that loads each dataset on first access.
+
+    Pages keep using ``data['fame']``; only the keys a page actually touches are
+    read, coerced and cached. ``stats()`` reports per-key hits/misses/load time
+    and which pages touched which datasets (see ``track``).
+
+    ``paths`` maps keys to their source files so ``reload_changed`` can re-ingest
+    just the datasets whose CSV changed on disk.
+    """
+
+    def __init__(self, loaders, paths=None):
+        self._loaders = dict(loaders)
+        self._paths = dict(paths or {})
+        self._frames = {}
+        self._stamps = {}
+        self._versions = dict.fromkeys(self._loaders, 0)
+        self.last_reload = None
+        self._sources = {}
+        self._hits = dict.fromkeys(self._loaders, 0)
+        self._misses = dict.fromkeys(self._loaders, 0)
+        self._load_ms = dict.fromkeys(self._loaders, 0.0)
+        self._touched = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def __getitem__(self, key):
+        if key not in self._loaders:
+            raise KeyError(key)
+        with self._lock:
+            page = getattr(self._local, "page", None)
+            if page is not None:
+                self._touched.setdefault(page, set()).add(key)
+            if key in self._frames:
+                self._hits[key] += 1
+                return self._frames[key]
+            self._misses[key] += 1
+            # Stamp before reading so a write during the load is picked up next time
+            self._stamps[key] = _file_stamp(self._paths.get(key))
+            t0 = time.perf_counter()
+            df, source = self._loaders[key]()
+            load_ms = (time.perf_counter() - t0) * 1000
+            self._load_ms[key] += load_ms
+            record(key, "data", load_ms)
+            self._frames[key] = df
+            self._sources[key] = source
+            return df
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def is_loaded(self, key) -> bool:
+        return key in self._frames
+
+    def version(self, key) -> int:
+        """Bumped every time ``key`` is reloaded; part of derived-cache keys."""
+        return self._versions[key]
+
+    def reload_changed(self) -> pd.DataFrame:
+        """
+        Re-ingest only the loaded datasets whose source file changed on disk.
+
+        Derived caches registered with ``@derived`` on those keys are cleared; nothing
+        else is touched. Returns (and keeps as ``last_reload``) a per-dataset timing
+        breakdown, empty when nothing changed.
+        """
+        t0 = time.perf_counter()
+        with self._lock:
+            changed = [key for key in list(self._frames)
+                       if key in self._paths and _file_stamp(self._paths[key]) != self._stamps.get(key)]
+        scan_ms = (time.perf_counter() - t0) * 1000
+
+        rows = []
+        for key in changed:
+            with self._lock:
+                self._frames.pop(key, None)
+                self._versions[key] += 1
+            t1 = time.perf_counter()
+            invalidated = _invalidate_derived(key)
+            t2 = time.perf_counter()
+            self[key]
+            t3 = time.perf_counter()
+            rows.append({
+                "dataset": key,
+                "scan_ms": round(scan_ms, 2),
+                "invalidate_ms": round((t2 - t1) * 1000, 2),
+                "derived_cleared": invalidated,
+                "ingest_ms": round((t3 - t2) * 1000, 2),
+            })
+        report = pd.DataFrame(rows, columns=["dataset", "scan_ms", "invalidate_ms",
+                                             "derived_cleared", "ingest_ms"])
+        if rows:
+            self.last_reload = report
+        return report
+
+    @contextmanager
+    def track(self, page: str):
+        """Attribute every dataset access in this thread to ``page`` while the block runs."""
+        previous = getattr(self._local, "page", None)
+        self._local.page = page
+        try:
+            yield self
+        finally:
+            self._local.page = previous
+
+    def stats(self) -> pd.DataFrame:
+        """Per-key cache statistics, one row per dataset."""
+        with self._lock:
+            rows = []
+            for key in self._loaders:
+                pages = sorted(p for p, keys in self._touched.items() if key in keys)
+                rows.append({
+                    "dataset": key,
+                    "loaded": key in self._frames,
+                    "source": self._sources.get(key, ""),
+                    "hits": self._hits[key],
+                    "misses": self._misses[key],
+                    "load_ms": round(self._load_ms[key], 2),
+                    "pages": ", ".join(pages),
+                })
+            return pd.DataFrame(rows)
+
+
+def _file_stamp(path):
+    """(size, mtime_ns) of ``path``, or ``None`` if it has no file / was removed."""
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+# ===== Derived caches =====
+# Tables/figures computed from datasets register here so a hot reload of one CSV
+# only drops the results that depend on it.
+_DERIVED = defaultdict(list)
+
+
+def derived(*keys):
+    """
+    Memoize a function computed from the datasets ``keys``.
+
+    Entries are cleared when any of those datasets is hot-reloaded, and keyed by the
+    dataset versions so a value computed mid-reload is never served stale.
     """
-    for col in df.columns:
-        if df[col].dtype == "object":
-            numeric_df = pd.to_numeric(df[col], errors="coerce")
-            if numeric_df.notna().sum() > 0:  # Found some numeric values
-                if (numeric_df % 1 != 0).any():
-                    df[col] = numeric_df.astype("float64")
-                else:
-                    df[col] = numeric_df.astype("int64")
-            else:
-                df[col] = df[col].astype(str)
-    return df
-
-@st.cache_data
+    def decorator(fn):
+        cache = {}
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            data = load_all_data()
+            token = (args, tuple(sorted(kwargs.items())), tuple(data.version(k) for k in keys))
+            if token not in cache:
+                cache[token] = fn(*args, **kwargs)
+            return cache[token]
+
+        wrapper.cache_clear = cache.clear
+        for key in keys:
+            _DERIVED[key].append(cache)
+        return wrapper
+    return decorator
+
+
+def _invalidate_derived(key) -> int:
+    """Clear every derived cache depending on ``key``; returns the number of entries dropped."""
+    dropped = 0
+    for cache in _DERIVED.get(key, ()):
+        dropped += len(cache)
+        cache.clear()
+    return dropped
+
+
+DATA_DIR = Path("data")
+
+
+def _dataset_loader(spec, path):
+    """Build the zero-arg loader for one key: CSV snapshot first, embedded values otherwise."""
+    def prepare(df):
+        # Persisted dtype plan: inferred on the first parse, then a single astype()
+        return planned(spec.validate(df), spec.key, spec.dtypes)
+
+    def load():
+        if path is not None:
+            try:
+                # Parsed once, then memory-mapped from the Arrow snapshot on later cold starts
+                return read_csv_cached(path, prepare, version=spec.fingerprint()), path.name
+            except Exception as e:
+                if spec.key not in CORE_KEYS:
+                    raise
+                st.sidebar.warning(f"⚠️ CSV load issue for {spec.key}: {e} — using embedded fallback values.")
+        return _embedded_fallback()[spec.key], "embedded"
+    return load
+
+
+def open_datasets(data_dir=DATA_DIR) -> LazyDatasets:
+    """Build the lazy CSV-backed mapping for ``data_dir`` (no Streamlit caching)."""
+    registry = resolve_registry(str(data_dir))
+    available = {key: entry for key, entry in registry.items()
+                 if entry[1] is not None or key in CORE_KEYS}
+    return LazyDatasets(
+        {key: _dataset_loader(spec, path) for key, (spec, path) in available.items()},
+        paths={key: path for key, (_, path) in available.items() if path is not None},
+    )
+
+
+@st.cache_resource
 def load_all_data():
     """
     Load all data for the GOAT analysis.
 
-    Priority:
-      1) Try to read CSVs from ./data
-      2) If any required frame is missing/unreadable, fall back to the in-code DataFrames
+    Returns a lazy ``{key: DataFrame}`` mapping shared by every session; a dataset
+    is only read the first time a page asks for it. Keys come from the manifest in
+    ``utils.dataset_registry`` plus every other CSV in ./data (keyed by file stem).
+
+    Priority per dataset:
+      0) With ``GOAT_SHARED_DATASETS`` set, attach to the buffers published by
+         ``python -m utils.shared_datasets`` (zero-copy, shared by every worker)
+      1) Read the CSV from ./data (through the Arrow snapshot cache)
+      2) If it is missing/unreadable, fall back to the in-code DataFrame
+    """
+    shared = shared_loaders()
+    if shared is not None:
+        loaders, paths = shared
+        st.sidebar.success(f"✅ Attached to {len(loaders)} shared datasets in {SHARED_DIR}")
+        return LazyDatasets(loaders, paths=paths)
+
+    registry = resolve_registry(str(DATA_DIR))
+    missing = [key for key in CORE_KEYS if registry[key][1] is None]
+
+    if missing:
+        st.sidebar.info(f"ℹ️ CSVs not found for {', '.join(missing)} — using embedded fallback values.")
+    else:
+        st.sidebar.success(f"✅ Data catalog ready: {len(registry)} datasets in ./data (loaded on demand)")
+
+    return open_datasets()
+
+
+WATCH_INTERVAL_S = float(os.environ.get("GOAT_WATCH_INTERVAL", "2"))
+_last_watch = [0.0]
+
+
+def watch_data_dir():
     """
-    DATA_DIR = Path("data")
-
-    def find_csv(*needles):
-        if not DATA_DIR.exists():
-            return None
-        for p in DATA_DIR.glob("*.csv"):
-            name = p.name.lower()
-            if any(n.lower() in name for n in needles):
-                return p
+    Hot-reload mode (opt-in with ``GOAT_WATCH_DATA=1``): call once per script run.
+
+    Polls the loaded CSVs at most every ``GOAT_WATCH_INTERVAL`` seconds and re-ingests
+    only the ones that changed. Returns the reload report, or ``None`` if not checked.
+    """
+    now = time.monotonic()
+    if now - _last_watch[0] < WATCH_INTERVAL_S:
         return None
+    _last_watch[0] = now
+    return load_all_data().reload_changed()
 
-    try:
-        csv_candidates = {
-            "achievements":   find_csv("honours", "trophies", "awards", "achiev"),
-            "career_stats":   find_csv("career_stats", "career_summary", "career"),
-            "club_goals":     find_csv("club_goals", "club_performance", "ucl_splits"),
-            "international":  find_csv("international_summary", "international", "intl"),
-            "fame":           find_csv("fame", "google_trends", "followers"),
-            "league_stats":   find_csv("league_stats", "season_by_season_club", "league"),
-            "physical":       find_csv("physical_attributes", "physical"),
-            "tactical":       find_csv("tactical_attributes", "tactical_attributes"),
-            "clutch":         find_csv("clutch_performance", "clutch_contributions", "clutch"),
-            "season_goals":   find_csv("goals_by_season", "season_goals", "season_by_season"),
-        }
-
-        loaded = {}
-        read_ok = True
-        for key, path in csv_candidates.items():
-            if path is None:
-                read_ok = False
-                break
-            df = pd.read_csv(path)
-            loaded[key] = make_arrow_safe(df)
-
-        if read_ok and len(loaded) == len(csv_candidates):
-            st.sidebar.success(f"✅ Data loaded from CSV files in ./data ({len(loaded)} datasets)")
-            return loaded
-
-        st.sidebar.info("ℹ️ Some CSVs not found or incomplete — using embedded fallback values.")
-
-    except Exception as e:
-        st.sidebar.warning(f"⚠️ CSV load issue: {e} — using embedded fallback values.")
 
+@lru_cache(maxsize=None)
+def _embedded_fallback():
+    """In-code copies of every dataset, used when a CSV is missing or unreadable."""
     # === FALLBACK: In-code data ===
     achievements = pd.DataFrame({
         'category': ['Ballon d\'Or', 'Golden Boot', 'Champions League Top Scorer', 'FIFA Best', 'UEFA Player of Year', 'Liga MVP', 'World Cup Golden Ball'],
@@ -185,5 +403,4 @@ def load_all_data():
     for k, df in data_dict.items():
         data_dict[k] = make_arrow_safe(df)
 
-    st.sidebar.success(f"✅ Data loaded from embedded values (fallback). Datasets: {len(data_dict)}")
     return data_dict
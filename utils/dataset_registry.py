@@ -0,0 +1,120 @@
+import hashlib
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+# ===== Dataset manifest =====
+# One entry per CSV the pages rely on: file -> dataset key, expected columns and dtypes.
+# Every other CSV in ./data is still registered (keyed by its file stem) so pages can
+# load e.g. data['ucl_splits'] without another directory scan.
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    key: str
+    file: str
+    columns: tuple = ()
+    dtypes: dict = field(default_factory=dict)
+
+    def fingerprint(self) -> str:
+        """Short stable hash of the schema, used to invalidate stale snapshots."""
+        text = repr((self.columns, sorted(self.dtypes.items())))
+        return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Check the expected columns are present (dtypes are applied by the dtype plan)."""
+        missing = [c for c in self.columns if c not in df.columns]
+        if missing:
+            raise ValueError(f"{self.file} is missing columns: {', '.join(missing)}")
+        return df
+
+
+def _player_columns(label_col, label_dtype="string[pyarrow]", value_dtype="int64"):
+    """Shorthand for the ``<label>, messi, ronaldo`` tables."""
+    cols = (label_col, "messi", "ronaldo")
+    return cols, {label_col: label_dtype, "messi": value_dtype, "ronaldo": value_dtype}
+
+
+MANIFEST = (
+    DatasetSpec("achievements", "achievements.csv", *_player_columns("category")),
+    DatasetSpec(
+        "career_stats", "messi_ronaldo_career_stats.csv",
+        ("player", "goals", "assists", "matches", "trophies", "ballonDors",
+         "goalsPer90", "assistsPer90", "conversionRate", "shotAccuracy",
+         "penaltyConversion", "dribblesCompleted", "keyPasses", "chancesCreated",
+         "teamTrophies", "individualAwards"),
+        {"player": "string[pyarrow]", "goals": "int64", "assists": "int64", "matches": "int64",
+         "trophies": "int64", "ballonDors": "int64", "goalsPer90": "float64",
+         "assistsPer90": "float64", "conversionRate": "float64", "shotAccuracy": "float64",
+         "penaltyConversion": "float64"},
+    ),
+    DatasetSpec("club_goals", "messi_ronaldo_club_goals.csv", *_player_columns("club")),
+    DatasetSpec(
+        "international", "messi_ronaldo_international_performance.csv",
+        ("player", "country", "matches", "goals", "assists", "trophies", "minutesPerGoal"),
+        {"player": "string[pyarrow]", "country": "string[pyarrow]", "matches": "int64", "goals": "int64",
+         "assists": "int64", "trophies": "int64"},
+    ),
+    DatasetSpec(
+        "fame", "messi_ronaldo_fame.csv",
+        ("player", "instagramFollowers", "facebookFollowers", "twitterFollowers",
+         "youtubeSubscribers", "googleSearchVolume", "sponsorshipIncomeUSD",
+         "merchSalesUSD", "globalFanBaseM", "influenceRank"),
+        {"player": "string[pyarrow]", "influenceRank": "float64"},
+    ),
+    DatasetSpec(
+        "league_stats", "messi_ronaldo_league_stats.csv",
+        ("league", "messiGoals", "ronaldoGoals", "messiApps", "ronaldoApps"),
+        {"league": "string[pyarrow]", "messiGoals": "int64", "ronaldoGoals": "int64",
+         "messiApps": "int64", "ronaldoApps": "int64"},
+    ),
+    DatasetSpec(
+        "physical", "messi_ronaldo_physical_attributes.csv",
+        ("player", "topSpeed_kmh", "strength_score", "stamina_score", "agility_score"),
+        {"player": "string[pyarrow]", "topSpeed_kmh": "float64"},
+    ),
+    DatasetSpec("tactical", "tactical_attributes.csv",
+                *_player_columns("attribute", value_dtype="float64")),
+    DatasetSpec("clutch", "clutch_performance.csv", *_player_columns("category")),
+    DatasetSpec(
+        "season_goals", "messi_ronaldo_goals_by_season.csv",
+        ("year", "messiGoals", "ronaldoGoals", "messiAssists", "ronaldoAssists"),
+        {"year": "int64", "messiGoals": "int64", "ronaldoGoals": "int64",
+         "messiAssists": "int64", "ronaldoAssists": "int64"},
+    ),
+    DatasetSpec(
+        "goal_events", "data.csv",
+        ("Player", "Season", "Competition", "Date", "Venue", "Club", "Opponent",
+         "Minute", "At_score", "Type"),
+    ),
+)
+
+# The datasets load_all_data has always provided (and has embedded fallbacks for)
+CORE_KEYS = tuple(spec.key for spec in MANIFEST if spec.key != "goal_events")
+
+
+@lru_cache(maxsize=None)
+def resolve_registry(data_dir="data"):
+    """
+    Resolve ``{key: (DatasetSpec, Path or None)}`` with a single directory listing.
+
+    Declared datasets whose file is absent map to ``None``; undeclared CSVs are
+    registered under their file stem with no schema. Cached per ``data_dir`` -
+    call ``resolve_registry.cache_clear()`` after adding files.
+    """
+    data_dir = Path(data_dir)
+    try:
+        on_disk = {e.name: Path(e.path) for e in os.scandir(data_dir)
+                   if e.is_file() and e.name.lower().endswith(".csv")}
+    except FileNotFoundError:
+        on_disk = {}
+
+    registry = {spec.key: (spec, on_disk.pop(spec.file, None)) for spec in MANIFEST}
+    for name in sorted(on_disk):
+        key = Path(name).stem
+        if key not in registry:
+            registry[key] = (DatasetSpec(key, name), on_disk[name])
+    return registry
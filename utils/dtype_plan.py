@@ -0,0 +1,137 @@
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from utils.snapshot_cache import CACHE_DIR, write_atomic
+
+# ===== Dtype plans =====
+# A plan is a plain ``{column: dtype}`` dict inferred once per dataset, persisted next to
+# its snapshot and applied with a single ``df.astype(plan)``.
+
+STRING_DTYPE = "string[pyarrow]"
+# Text columns with at most this share of distinct values become categoricals
+CATEGORY_RATIO = 0.5
+CATEGORY_MIN_ROWS = 20
+
+
+def infer_dtype_plan(df: pd.DataFrame, declared: dict = None) -> dict:
+    """
+    Infer an Arrow-friendly dtype for every column.
+
+    - Text that is entirely numeric -> int64 / Int64 (nullable, if missing values) / float64
+    - Repetitive text -> category
+    - Other text -> string[pyarrow]
+    - Floats whose values are all whole numbers -> int64 / Int64
+    - Every other dtype (ints, bools, datetimes, categoricals, ...) is kept as is.
+    - ``declared`` dtypes (e.g. from the dataset manifest) win over inference.
+    """
+    plan = {}
+    n_rows = len(df)
+    for col in df.columns:
+        s = df[col]
+        if not (s.dtype == object or isinstance(s.dtype, pd.StringDtype)):
+            # Only text needs a plan; floats are narrowed when every value is whole
+            integral = _integral_dtype(s) if pd.api.types.is_float_dtype(s) else None
+            plan[col] = integral or str(s.dtype)
+            continue
+        try:
+            # errors="raise" bails out on the first non-number instead of scanning it all
+            numeric = pd.to_numeric(s.dropna()) if s.notna().any() else None
+        except (ValueError, TypeError):
+            numeric = None
+        if numeric is not None and pd.api.types.is_integer_dtype(numeric):
+            plan[col] = "Int64" if s.isna().any() else "int64"
+        elif numeric is not None and pd.api.types.is_float_dtype(numeric):
+            plan[col] = _integral_dtype(numeric.reindex(s.index)) or "float64"
+        else:
+            distinct = s.nunique(dropna=True)
+            if n_rows >= CATEGORY_MIN_ROWS and distinct <= CATEGORY_RATIO * n_rows:
+                plan[col] = "category"
+            else:
+                plan[col] = STRING_DTYPE
+    if declared:
+        plan.update({c: t for c, t in declared.items() if c in plan})
+    return plan
+
+
+def _integral_dtype(s: pd.Series):
+    """int64 / Int64 for a float column whose non-null values are all whole numbers, else None."""
+    values = s.dropna()
+    if values.empty or not values.mod(1).eq(0).all():
+        return None
+    return "Int64" if len(values) < len(s) else "int64"
+
+
+def apply_dtype_plan(df: pd.DataFrame, plan: dict) -> pd.DataFrame:
+    """Apply a plan with one ``astype`` call (numeric text is parsed first)."""
+    numeric_text = [c for c, t in plan.items()
+                    if t in ("int64", "Int64", "float64")
+                    and not pd.api.types.is_numeric_dtype(df[c])]
+    if numeric_text:
+        df = df.assign(**{c: pd.to_numeric(df[c]) for c in numeric_text})
+    return df.astype(plan)
+
+
+def plan_fits(df: pd.DataFrame, plan: dict) -> bool:
+    """
+    True when applying ``plan`` to ``df`` loses nothing.
+
+    ``astype`` truncates floats to int64 silently, so every column planned as an integer
+    must hold whole numbers only (numeric text included) for an old plan to be reused.
+    """
+    for col, dtype in plan.items():
+        if dtype not in ("int64", "Int64") or pd.api.types.is_integer_dtype(df[col]):
+            continue
+        try:
+            values = pd.to_numeric(df[col].dropna())
+        except (ValueError, TypeError):
+            return False
+        if not values.mod(1).eq(0).all():
+            return False
+    return True
+
+
+def is_plan_applied(df: pd.DataFrame) -> bool:
+    """True when no column is left as a Python-object column (nothing to coerce)."""
+    return not any(dtype == object for dtype in df.dtypes)
+
+
+def _plan_path(name: str, cache_dir: Path = None) -> Path:
+    return Path(cache_dir or CACHE_DIR) / f"{name}.plan.json"
+
+
+def load_plan(name: str, cache_dir: Path = None) -> dict:
+    """Return the persisted plan for dataset ``name``, or ``None``."""
+    try:
+        return json.loads(_plan_path(name, cache_dir).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def save_plan(name: str, plan: dict, cache_dir: Path = None):
+    path = _plan_path(name, cache_dir)
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        write_atomic(path, lambda p: p.write_text(json.dumps(plan, indent=1)))
+    except OSError:
+        pass  # Read-only deployments just re-infer next time
+
+
+def planned(df: pd.DataFrame, name: str, declared: dict = None, cache_dir: Path = None) -> pd.DataFrame:
+    """
+    Apply the persisted plan for ``name``, inferring (and saving) it the first time.
+
+    A refreshed CSV reuses the existing plan; the plan is only re-inferred when its
+    columns no longer match or the data no longer fits it (see ``plan_fits``).
+    """
+    plan = load_plan(name, cache_dir)
+    if plan is not None and list(plan) == list(df.columns) and plan_fits(df, plan):
+        try:
+            return apply_dtype_plan(df, plan)
+        except (ValueError, TypeError):
+            pass  # Data drifted out of the old plan - infer a new one
+    plan = infer_dtype_plan(df, declared)
+    save_plan(name, plan, cache_dir)
+    return apply_dtype_plan(df, plan)
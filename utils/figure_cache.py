@@ -0,0 +1,170 @@
+import hashlib
+import os
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# ===== Memoized Plotly figures =====
+# Pages build their most expensive static charts through ``cached_figure(chart_id, build)``.
+# The figure is built once per (chart id, data fingerprint, theme) for the whole process
+# and shared by every session:
+#   - the fingerprint hashes the builder's bytecode and constants, the values it
+#     closes over (DataFrames by content) and the data globals it reads, so editing
+#     a literal or reloading a dataset gives a new key instead of a stale chart,
+#   - the theme is plotly's default template at call time,
+#   - the spec dict is computed once and CachedFigure.to_dict() hands it to
+#     st.plotly_chart as is, so a hit skips figure construction, validation and the
+#     deep copy.
+# The serialized JSON is not reused: st.plotly_chart has no public way to accept it
+# (a dict is re-validated, which is slower than building the figure), so Streamlit
+# encodes the plain dict on every render. Only the JSON's size is kept, for the budget.
+# Entries are evicted least-recently-used once their total JSON size exceeds GOAT_FIGURE_CACHE_MB.
+
+FIGURE_CACHE_MB = float(os.environ.get("GOAT_FIGURE_CACHE_MB", "64"))
+
+
+class FigureSpec(dict):
+    """A figure's plain-dict spec plus the size of its serialized JSON (``nbytes``)."""
+    nbytes = 0
+
+
+class CachedFigure(go.Figure):
+    """Shared, read-only figure whose ``to_dict()`` returns the cached spec without copying."""
+
+    def __init__(self, spec: FigureSpec):
+        super().__init__(spec)
+        self._cached_spec = spec
+
+    def to_dict(self):
+        return self._cached_spec
+
+
+def _feed(h, value, depth=0):
+    """Add ``value`` to hash ``h``; containers recurse, DataFrames hash by content."""
+    if depth > 8:
+        h.update(b"<deep>")
+    elif isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        h.update(repr((type(value).__name__, value.shape, list(getattr(value, "columns", [])))).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        h.update(repr((value.shape, value.dtype.str)).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        h.update(f"{type(value).__name__}{len(value)}(".encode())
+        for item in (sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value):
+            _feed(h, item, depth + 1)
+        h.update(b")")
+    elif isinstance(value, dict):
+        h.update(f"dict{len(value)}(".encode())
+        for key, item in value.items():
+            _feed(h, key, depth + 1)
+            _feed(h, item, depth + 1)
+        h.update(b")")
+    elif isinstance(value, types.CodeType):
+        h.update(value.co_code)
+        h.update(repr(value.co_names).encode())
+        for const in value.co_consts:
+            _feed(h, const, depth + 1)
+    elif isinstance(value, types.FunctionType):
+        _feed(h, value.__code__, depth + 1)
+        for cell in value.__closure__ or ():
+            _feed(h, cell.cell_contents, depth + 1)
+        for name in _code_names(value.__code__):
+            if name in value.__globals__ and _is_data(value.__globals__[name]):
+                h.update(name.encode())
+                _feed(h, value.__globals__[name], depth + 1)
+    else:
+        h.update(f"{type(value).__name__}:{value!r}".encode())
+
+
+def _code_names(code):
+    """Global names read by ``code`` and the functions / comprehensions nested in it."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _is_data(value) -> bool:
+    return not isinstance(value, (types.ModuleType, types.FunctionType, types.BuiltinFunctionType, type))
+
+
+def fingerprint(*values) -> str:
+    """Content hash of builders and data, stable across sessions and reruns."""
+    h = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _feed(h, value)
+    return h.hexdigest()
+
+
+class FigureCache:
+    """Thread-safe LRU of CachedFigures bounded by the total size of their JSON."""
+
+    def __init__(self, max_mb=FIGURE_CACHE_MB):
+        self.max_bytes = int(max_mb * 2 ** 20)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            fig = self._entries.get(key)
+            if fig is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return fig
+
+    def put(self, key, fig):
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            self._entries[key] = fig
+            self._bytes += fig.to_dict().nbytes
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, old = self._entries.popitem(last=False)
+                self._bytes -= old.to_dict().nbytes
+                self.evictions += 1
+            return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "mb": round(self._bytes / 2 ** 20, 2),
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+FIGURES = FigureCache()
+
+
+def freeze(fig) -> CachedFigure:
+    """Snapshot ``fig`` into a CachedFigure with its spec (and JSON size) computed once."""
+    spec = FigureSpec(fig.to_dict())
+    spec.nbytes = len(pio.to_json(spec, validate=False))
+    return CachedFigure(spec)
+
+
+def cached_figure(chart_id: str, build, *data, theme: str = None) -> go.Figure:
+    """
+    ``build(*data)`` memoized across sessions by (chart id, fingerprint, theme).
+
+    The returned figure is shared: pass it to st.plotly_chart, don't mutate it.
+    """
+    key = (chart_id, fingerprint(build, *data), theme or pio.templates.default)
+    fig = FIGURES.get(key)
+    if fig is None:
+        fig = FIGURES.put(key, freeze(build(*data)))
+    return fig
+
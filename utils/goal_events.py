@@ -0,0 +1,251 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.data_loader import derived, load_all_data
+
+# ===== Goal-event store =====
+# data/data.csv holds one row per goal (Player, Season, Competition, Date, ...).
+# The store ingests it once, sorts it by (player, date) and answers filters from
+# precomputed indexes instead of boolean masks over the whole frame.
+
+COLUMNS = {
+    "Player": "player", "Season": "season", "Competition": "competition",
+    "Matchday": "matchday", "Date": "date", "Venue": "venue", "Club": "club",
+    "Opponent": "opponent", "Result": "result", "Playing_Position": "position",
+    "Minute": "minute", "At_score": "at_score", "Type": "type", "Goal_assist": "goal_assist",
+}
+# Columns with a posting-list index (row positions per value)
+INDEXED = ("competition", "club", "opponent", "type")
+CATEGORICAL = ("player",) + INDEXED + ("venue", "position", "goal_assist")
+
+_MONTHS = {m: i for i, m in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1)}
+
+
+def _season_label_start(label: str) -> int:
+    """
+    First calendar year of a season label.
+
+    Handles "09/10" as well as the spreadsheet-mangled "11-Dec" (11/12) and "Dec-13" (12/13).
+    """
+    parts = label.strip().replace("-", "/").split("/")
+    if len(parts) != 2:
+        return -1
+    first, second = parts
+    if first in _MONTHS:
+        yy = _MONTHS[first]
+    elif first.isdigit():
+        yy = int(first)
+    elif second in _MONTHS:
+        yy = _MONTHS[second] - 1
+    else:
+        return -1
+    return yy + (1900 if yy > 50 else 2000)
+
+
+def season_start(seasons: pd.Series) -> np.ndarray:
+    """Vectorised ``_season_label_start``: parse each distinct label once, then map by code."""
+    cat = seasons.astype("category")
+    starts = np.array([_season_label_start(str(c)) for c in cat.cat.categories] + [-1], dtype=np.int16)
+    return starts[cat.cat.codes.to_numpy()]  # code -1 (missing) picks the trailing -1
+
+
+# ===== Vectorised minute / scoreline parsing =====
+# "90+5" -> minute 90, stoppage 5; "3:00" (a 3:0 scoreline that a spreadsheet turned
+# into a time) -> 3, 0; "1:2 AET" / "6:5 on pens" keep their leading score.
+# Parsing runs in Arrow's C++ regex kernels (or once per category), never per row in Python.
+MINUTE_PATTERN = r"^\s*(?P<minute>\d+)(?:\s*\+\s*(?P<stoppage>\d+))?"
+SCORE_PATTERN = r"^\s*(?P<home>\d+)\s*[:\-]\s*(?P<away>\d+)"
+MISSING = -1
+
+
+def extract_ints(values: pd.Series, pattern: str) -> dict:
+    """
+    Apply a regex with named integer groups to a string column.
+
+    Returns ``{group: int16 array}``; rows that don't match (or optional groups that
+    didn't participate) get ``MISSING``. Categorical input is parsed once per category.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        parsed = extract_ints(pd.Series(values.cat.categories.astype(str)), pattern)
+        codes = values.cat.codes.to_numpy()
+        # Trailing MISSING slot so code -1 (NaN) maps to MISSING
+        return {k: np.append(v, MISSING).astype(np.int16)[codes] for k, v in parsed.items()}
+
+    arr = pa.array(values.astype("string[pyarrow]"), type=pa.string(), from_pandas=True)
+    matched = pc.extract_regex(arr, pattern)
+    out = {}
+    for i in range(matched.type.num_fields):
+        field = pc.struct_field(matched, [i])
+        field = pc.if_else(pc.equal(field, ""), pa.scalar(None, pa.string()), field)
+        ints = pc.cast(field, pa.int16()).fill_null(MISSING)
+        out[matched.type.field(i).name] = ints.to_numpy(zero_copy_only=False)
+    return out
+
+
+def parse_minutes(minutes: pd.Series):
+    """``"90+5"`` -> (90, 5); plain minutes get stoppage 0."""
+    parsed = extract_ints(minutes, MINUTE_PATTERN)
+    stoppage = parsed["stoppage"]
+    return parsed["minute"], np.where(stoppage == MISSING, 0, stoppage).astype(np.int8)
+
+
+def parse_scorelines(scores: pd.Series):
+    """``"3:00"`` / ``"1:2 AET"`` -> (home goals, away goals)."""
+    parsed = extract_ints(scores, SCORE_PATTERN)
+    return parsed["home"], parsed["away"]
+
+
+def parse_event_columns(df: pd.DataFrame) -> dict:
+    """
+    Integer columns derived from the raw strings, from the player's club's side.
+
+    ``minute``/``stoppage`` come from Minute, ``goals_for``/``goals_against`` from the
+    final Result and ``score_for``/``score_against`` from At_score (score after the
+    goal). Scorelines are written home:away, so away games are flipped via Venue.
+    """
+    minute, stoppage = parse_minutes(df["minute"])
+    home = (df["venue"].astype("string") == "H").fillna(True).to_numpy(dtype=bool)
+    cols = {"minute": minute, "stoppage": stoppage}
+    for prefix, source in (("goals", "result"), ("score", "at_score")):
+        h, a = parse_scorelines(df[source])
+        cols[f"{prefix}_for"] = np.where(home, h, a)
+        cols[f"{prefix}_against"] = np.where(home, a, h)
+    return cols
+
+
+def _postings(codes: np.ndarray, n_values: int) -> list:
+    """Row positions for every category code, each sorted ascending (one stable argsort)."""
+    order = np.argsort(codes, kind="stable").astype(np.int32)
+    order.flags.writeable = False  # Lists are returned to callers as-is
+    counts = np.bincount(codes[codes >= 0], minlength=n_values)
+    skip = int((codes < 0).sum())  # Missing values sort first
+    return np.split(order[skip:], np.cumsum(counts)[:-1])
+
+
+class GoalEventStore:
+    """
+    Columnar, indexed view of the goal-event log.
+
+    - Rows sorted by (player, date): a player filter is a contiguous slice.
+    - ``season_start`` is monotone inside each player slice: season ranges are two
+      ``searchsorted`` calls per player.
+    - Competition / club / opponent / type filters use posting lists that are
+      intersected with the candidate rows.
+    """
+
+    def __init__(self, raw: pd.DataFrame):
+        df = raw.rename(columns=COLUMNS)
+        df["date"] = pd.to_datetime(df["date"].astype(str), errors="coerce")
+        for col in CATEGORICAL:
+            if col in df:
+                df[col] = df[col].astype("string").str.strip().astype("category")
+        df["season_start"] = season_start(df["season"])
+        df = df.assign(**parse_event_columns(df))  # "90+5" survives as minute + stoppage
+        df = df.sort_values(["player", "date"], kind="stable").reset_index(drop=True)
+        self.frame = df
+
+        # Player slices
+        codes = df["player"].cat.codes.to_numpy()
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [len(df)]))
+        cats = df["player"].cat.categories
+        self._player_slices = {cats[codes[a]]: (int(a), int(b)) for a, b in zip(starts, stops) if len(df)}
+        self._season_start = df["season_start"].to_numpy()
+        # Seasons follow dates, so each player block is sorted; searchsorted relies on it
+        self._season_sorted = all(np.all(np.diff(self._season_start[a:b]) >= 0)
+                                  for a, b in self._player_slices.values())
+
+        # Posting lists
+        self._postings = {}
+        for col in INDEXED:
+            cat = df[col].cat
+            lists = _postings(cat.codes.to_numpy(), len(cat.categories))
+            self._postings[col] = dict(zip(cat.categories, lists))
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def players(self) -> list:
+        return list(self._player_slices)
+
+    def values(self, column: str) -> list:
+        """Distinct values of an indexed column (for filter widgets)."""
+        return list(self._postings[column])
+
+    def _as_list(self, value):
+        if value is None:
+            return None
+        return [value] if isinstance(value, str) else list(value)
+
+    def rows(self, player=None, competition=None, seasons=None, opponent=None,
+             goal_type=None, club=None) -> np.ndarray:
+        """
+        Sorted row positions matching every given filter.
+
+        Each filter accepts a single value or a list of values; ``seasons`` is an
+        inclusive ``(first_start_year, last_start_year)`` tuple, e.g. ``(2009, 2012)``.
+        """
+        players = self._as_list(player) or self.players
+        ranges = []
+        if player is None and seasons is None:
+            players = []
+            ranges.append(np.arange(len(self.frame), dtype=np.int32))
+        for name in players:
+            if name not in self._player_slices:
+                continue
+            a, b = self._player_slices[name]
+            if seasons is None:
+                ranges.append(np.arange(a, b, dtype=np.int32))
+                continue
+            lo, hi = seasons
+            block = self._season_start[a:b]
+            if self._season_sorted:
+                ranges.append(np.arange(a + np.searchsorted(block, lo, "left"),
+                                        a + np.searchsorted(block, hi, "right"), dtype=np.int32))
+            else:
+                ranges.append((a + np.flatnonzero((block >= lo) & (block <= hi))).astype(np.int32))
+        result = np.concatenate(ranges) if ranges else np.empty(0, dtype=np.int32)
+        if player is not None and len(players) > 1:
+            result.sort()  # Caller's player order need not match the storage order
+
+        for column, value in (("competition", competition), ("opponent", opponent),
+                              ("type", goal_type), ("club", club)):
+            wanted = self._as_list(value)
+            if wanted is None or not len(result):
+                continue
+            index = self._postings[column]
+            lists = [index[v] for v in wanted if v in index]
+            if not lists:
+                return np.empty(0, dtype=np.int32)
+            posting = lists[0] if len(lists) == 1 else np.unique(np.concatenate(lists))
+            result = self._intersect(result, posting)
+        return result
+
+    def _intersect(self, rows: np.ndarray, posting: np.ndarray) -> np.ndarray:
+        """Intersect two sorted position arrays, picking the cheaper strategy."""
+        n = len(self.frame)
+        if len(rows) == n:
+            return posting  # No narrowing yet: the posting list is the answer
+        if len(rows) + len(posting) < n // 32:
+            return np.intersect1d(rows, posting, assume_unique=True)
+        mark = np.zeros(n, dtype=bool)
+        mark[posting] = True
+        return rows[mark[rows]]
+
+    def query(self, **filters) -> pd.DataFrame:
+        """Matching events as a DataFrame (see ``rows`` for the filters)."""
+        return self.frame.take(self.rows(**filters))
+
+    def count(self, **filters) -> int:
+        return len(self.rows(**filters))
+
+
+@derived("goal_events")
+def goal_event_store() -> GoalEventStore:
+    """Process-wide store, rebuilt only when data/data.csv is hot-reloaded."""
+    return GoalEventStore(load_all_data()["goal_events"])
@@ -0,0 +1,98 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.dataset_registry import resolve_registry
+from utils.snapshot_cache import CACHE_DIR, cached_frame
+
+# ===== Match-log summaries =====
+# match_by_match_logs.csv can hold full careers for many players. It is streamed in
+# chunks into (player, season, competition) totals - memory is bounded by the number
+# of groups, not rows - and only those small tables are cached and read by the pages.
+
+GROUP_KEYS = ["player", "season", "competition"]
+SUM_COLUMNS = ["minutes", "goals", "assists", "pens", "shots", "xG", "xAG", "yellow", "red"]
+CHUNK_ROWS = int(os.environ.get("GOAT_MATCH_LOG_CHUNK", "250000"))
+SUMMARY_DIR = CACHE_DIR.parent / "summaries"
+# Bump when aggregate_match_logs changes; the keys and columns are part of the version too
+TOTALS_SCHEMA = 1
+TOTALS_VERSION = f"v{TOTALS_SCHEMA}:{','.join(GROUP_KEYS)}:{','.join(SUM_COLUMNS)}"
+# Rollup grains the pages can ask for
+LEVELS = {
+    "competition": GROUP_KEYS,
+    "season": ["player", "season"],
+    "player": ["player"],
+}
+
+
+def aggregate_match_logs(path, chunksize: int = CHUNK_ROWS) -> pd.DataFrame:
+    """
+    Single streaming pass over a match log: totals per (player, season, competition).
+
+    Each chunk is reduced with a groupby-sum and folded into the running totals, so at
+    most one chunk plus the (small) totals table is in memory at any time.
+    """
+    dtypes = {col: "float64" for col in SUM_COLUMNS}
+    dtypes.update({key: "string[pyarrow]" for key in GROUP_KEYS})
+    totals = None
+    reader = pd.read_csv(path, usecols=GROUP_KEYS + SUM_COLUMNS, dtype=dtypes, chunksize=chunksize)
+    for chunk in reader:
+        part = chunk.groupby(GROUP_KEYS, sort=False).agg(
+            matches=("minutes", "size"), **{col: (col, "sum") for col in SUM_COLUMNS})
+        totals = part if totals is None else totals.add(part, fill_value=0)
+    if totals is None:
+        return pd.DataFrame(columns=GROUP_KEYS + ["matches"] + SUM_COLUMNS)
+    return totals.reset_index().sort_values(GROUP_KEYS, ignore_index=True)
+
+
+def add_rates(totals: pd.DataFrame) -> pd.DataFrame:
+    """Per-90 rates and finishing deltas (actual minus expected) for any grain of totals."""
+    per90 = 90 / totals["minutes"].where(totals["minutes"] > 0)
+    return totals.assign(
+        goals_per90=(totals["goals"] * per90).round(2),
+        assists_per90=(totals["assists"] * per90).round(2),
+        shots_per90=(totals["shots"] * per90).round(2),
+        xG_per90=(totals["xG"] * per90).round(2),
+        cards_per90=((totals["yellow"] + totals["red"]) * per90).round(2),
+        npg=totals["goals"] - totals["pens"],
+        xG_delta=(totals["goals"] - totals["xG"]).round(2),
+        xAG_delta=(totals["assists"] - totals["xAG"]).round(2),
+    )
+
+
+def _match_log_path() -> Path:
+    return resolve_registry().get("match_by_match_logs", (None, None))[1]
+
+
+def _stamp(path):
+    stat = os.stat(path)
+    return str(path), stat.st_size, stat.st_mtime_ns
+
+
+@lru_cache(maxsize=16)
+def _summary(stamp, level) -> pd.DataFrame:
+    path = Path(stamp[0])
+    totals = cached_frame(path, aggregate_match_logs, name="match_log_totals", cache_dir=SUMMARY_DIR,
+                          version=TOTALS_VERSION)
+    keys = LEVELS[level]
+    if keys != GROUP_KEYS:
+        totals = totals.groupby(keys, as_index=False)[["matches"] + SUM_COLUMNS].sum()
+    return add_rates(totals)
+
+
+def match_log_summary(level: str = "competition") -> pd.DataFrame:
+    """
+    Summary table at ``level`` ("competition", "season" or "player").
+
+    Backed by the on-disk totals snapshot (rebuilt only when the log changes) and an
+    in-process memo keyed by the file's size/mtime. Empty when there is no match log.
+    """
+    if level not in LEVELS:
+        raise ValueError(f"level must be one of {', '.join(LEVELS)}")
+    path = _match_log_path()
+    if path is None:
+        return add_rates(pd.DataFrame(columns=LEVELS[level] + ["matches"] + SUM_COLUMNS, dtype=np.float64))
+    return _summary(_stamp(path), level)
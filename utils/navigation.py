@@ -1,5 +1,36 @@
 import streamlit as st
 
+# ===== Query-parameter routing =====
+# The selected page lives in the URL (?page=<key>), mirrored in
+# st.session_state.current_page. Nav buttons switch pages from an on_click
+# callback, which Streamlit runs *before* the script reruns, so one click is one
+# script run (no st.rerun()) and every page is deep-linkable.
+
+DEFAULT_PAGE = 'overview'
+
+
+def navigate(page):
+    """Button callback: select ``page`` and record it in the URL."""
+    st.session_state.current_page = page
+    st.query_params["page"] = page
+
+
+def current_page(pages):
+    """
+    The page to render this run: ?page= if it names one of ``pages``, else the
+    session's current page, else DEFAULT_PAGE. Keeps the URL and session in sync.
+    """
+    requested = st.query_params.get("page")
+    if requested in pages:
+        st.session_state.current_page = requested
+    elif st.session_state.get('current_page') not in pages:
+        st.session_state.current_page = DEFAULT_PAGE
+    page = st.session_state.current_page
+    if requested != page:
+        st.query_params["page"] = page
+    return page
+
+
 def create_navbar():
     """Create navigation buttons"""
     navbar_items = [
@@ -27,8 +58,6 @@ def handle_navigation():
     
     for i, (label, key) in enumerate(navbar_items):
         with cols[i]:
-            if st.button(label, key=f"nav_{key}", help=f"Go to {label}"):
-                st.session_state.current_page = key
-                st.rerun()
+            st.button(label, key=f"nav_{key}", help=f"Go to {label}", on_click=navigate, args=(key,))
     
-    return st.session_state.current_page
\ No newline at end of file
+    return current_page([key for _, key in navbar_items])
\ No newline at end of file
@@ -0,0 +1,450 @@
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.smoothing import smooth
+from utils.snapshot_cache import SOURCE_EVENT, file_digest, write_atomic
+
+# ===== Streaming pitch binning =====
+# Positional events (x, y in metres, attack left -> right) are binned into integer
+# counts on a regular grid. Chunks are reduced with one np.bincount over flat cell
+# indices, so any file size streams through in bounded memory, and grids from
+# different chunks, files or worker processes simply add up.
+
+FIELD_LENGTH = 120  # meters
+FIELD_WIDTH = 80    # meters
+CHUNK_ROWS = int(os.environ.get("GOAT_POSITION_CHUNK", "1000000"))
+# Tile pyramid: 15x10 (8 m cells) doubling up to 480x320 (0.25 m cells)
+PYRAMID_BASE = (15, 10)
+PYRAMID_LEVELS = 6
+# Upper bound on the cells sent to the browser for any zoom window
+MAX_WINDOW_CELLS = 120 * 80
+
+
+class PitchGrid:
+    """
+    Mergeable ``ny x nx`` count grid over a ``length x width`` pitch.
+
+    ``counts[row, col]`` is indexed (y bin, x bin), the orientation ``imshow`` expects.
+    Bins match ``np.histogram2d`` on ``np.linspace(0, length, nx + 1)`` edges: the last
+    bin is closed on the right and points outside the pitch are dropped.
+    ``sources`` records the digests of ingested files so a file is never counted twice.
+    """
+
+    def __init__(self, nx=49, ny=49, length=FIELD_LENGTH, width=FIELD_WIDTH, counts=None, sources=()):
+        self.nx, self.ny = int(nx), int(ny)
+        self.length, self.width = float(length), float(width)
+        self.counts = np.zeros((self.ny, self.nx), dtype=np.int64) if counts is None else counts
+        self.sources = set(sources)
+
+    @property
+    def shape(self):
+        return self.ny, self.nx
+
+    @property
+    def x_edges(self):
+        return np.linspace(0, self.length, self.nx + 1)
+
+    @property
+    def y_edges(self):
+        return np.linspace(0, self.width, self.ny + 1)
+
+    def empty_like(self):
+        return PitchGrid(self.nx, self.ny, self.length, self.width)
+
+    def cell_index(self, x, y) -> np.ndarray:
+        """Flat cell index (``row * nx + col``) per point; -1 for points off the pitch or NaN."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        with np.errstate(invalid="ignore"):  # NaN casts are masked out below
+            col = np.minimum((x * (self.nx / self.length)).astype(np.int64), self.nx - 1)
+            row = np.minimum((y * (self.ny / self.width)).astype(np.int64), self.ny - 1)
+        inside = (x >= 0) & (x <= self.length) & (y >= 0) & (y <= self.width)  # False for NaN
+        return np.where(inside, row * self.nx + col, -1)
+
+    def add(self, x, y) -> "PitchGrid":
+        """Bin one chunk of coordinates into the grid."""
+        cells = self.cell_index(x, y)
+        cells = cells[cells >= 0]
+        self.counts += np.bincount(cells, minlength=self.nx * self.ny).reshape(self.shape)
+        return self
+
+    def _check_compatible(self, other):
+        if (self.nx, self.ny, self.length, self.width) != (other.nx, other.ny, other.length, other.width):
+            raise ValueError("Grids have different shapes or pitch dimensions")
+
+    def merge(self, other: "PitchGrid") -> "PitchGrid":
+        """Add another grid's counts in place (e.g. a worker's partial grid)."""
+        self._check_compatible(other)
+        overlap = self.sources & other.sources
+        if overlap:
+            raise ValueError(f"{len(overlap)} source file(s) already counted in this grid")
+        self.counts += other.counts
+        self.sources |= other.sources
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def __add__(self, other):
+        return self.copy().merge(other)
+
+    def copy(self) -> "PitchGrid":
+        return PitchGrid(self.nx, self.ny, self.length, self.width, self.counts.copy(), self.sources)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def smoothed(self, sigma=1.5, backend: str = None) -> np.ndarray:
+        """Gaussian-smoothed float grid for display (see utils.smoothing for backends)."""
+        return smooth(self.counts, sigma, backend)
+
+    def add_file(self, path, x="x", y="y", chunksize: int = CHUNK_ROWS, filters=None) -> bool:
+        """
+        Stream a positional CSV/Parquet file into the grid.
+
+        Returns False (and counts nothing) when the file was already ingested, so
+        adding a new match to a saved career grid never re-bins the old ones.
+        """
+        digest = file_digest(path)
+        if digest in self.sources:
+            return False
+        partial = self.empty_like()
+        for chunk in iter_chunks(path, [x, y] + list(filters or {}), chunksize):
+            for column, wanted in (filters or {}).items():
+                chunk = chunk[chunk[column] == wanted]
+            partial.add(chunk[x].to_numpy(), chunk[y].to_numpy())
+        self.counts += partial.counts
+        self.sources.add(digest)
+        return True
+
+    def save(self, path):
+        """Persist counts + metadata (.npz) atomically."""
+        meta = dict(nx=self.nx, ny=self.ny, length=self.length, width=self.width,
+                    sources=sorted(self.sources))
+
+        def write(tmp):
+            with open(tmp, "wb") as fh:
+                np.savez(fh, counts=self.counts, meta=np.array(json.dumps(meta)))
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, write)
+
+    @classmethod
+    def load(cls, path) -> "PitchGrid":
+        with np.load(path) as stored:
+            meta = json.loads(str(stored["meta"]))
+            return cls(meta["nx"], meta["ny"], meta["length"], meta["width"],
+                       stored["counts"], meta["sources"])
+
+
+def coarsen(grid: PitchGrid, factor: int = 2) -> PitchGrid:
+    """Sum ``factor x factor`` blocks of cells; exact, since counts are integers."""
+    if grid.nx % factor or grid.ny % factor:
+        raise ValueError(f"{grid.nx}x{grid.ny} grid is not divisible by {factor}")
+    counts = grid.counts.reshape(grid.ny // factor, factor, grid.nx // factor, factor).sum(axis=(1, 3))
+    return PitchGrid(grid.nx // factor, grid.ny // factor, grid.length, grid.width, counts, grid.sources)
+
+
+class GridPyramid:
+    """
+    Multi-resolution stack of count grids, coarsest first.
+
+    Built once from the finest grid by repeated 2x2 block sums, so every level holds
+    exactly the same events. ``window`` picks the finest level whose cells in the
+    requested viewport stay under a fixed budget, so zooming in raises the resolution
+    without ever growing the payload.
+    """
+
+    def __init__(self, finest: PitchGrid, levels: int = PYRAMID_LEVELS):
+        grids = [finest]
+        for _ in range(levels - 1):
+            grids.append(coarsen(grids[-1]))
+        self.levels = grids[::-1]
+
+    @classmethod
+    def from_points(cls, x, y, base=PYRAMID_BASE, levels: int = PYRAMID_LEVELS,
+                    length=FIELD_LENGTH, width=FIELD_WIDTH) -> "GridPyramid":
+        scale = 2 ** (levels - 1)
+        finest = PitchGrid(base[0] * scale, base[1] * scale, length, width).add(x, y)
+        return cls(finest, levels)
+
+    @property
+    def shapes(self) -> list:
+        return [(grid.nx, grid.ny) for grid in self.levels]
+
+    def _span(self, grid, x_range, y_range):
+        """Column / row index ranges covering the viewport."""
+        cw, ch = grid.length / grid.nx, grid.width / grid.ny
+        c0 = max(int(np.floor(x_range[0] / cw)), 0)
+        c1 = min(int(np.ceil(x_range[1] / cw)), grid.nx)
+        r0 = max(int(np.floor(y_range[0] / ch)), 0)
+        r1 = min(int(np.ceil(y_range[1] / ch)), grid.ny)
+        return c0, c1, r0, r1
+
+    def level_for(self, x_range, y_range, max_cells: int = MAX_WINDOW_CELLS) -> PitchGrid:
+        """Finest level whose cells inside the viewport fit in ``max_cells``."""
+        best = self.levels[0]
+        for grid in self.levels:
+            c0, c1, r0, r1 = self._span(grid, x_range, y_range)
+            if (c1 - c0) * (r1 - r0) <= max_cells:
+                best = grid
+        return best
+
+    def window(self, x_range=(0, FIELD_LENGTH), y_range=(0, FIELD_WIDTH),
+               max_cells: int = MAX_WINDOW_CELLS, sigma_m: float = None, backend: str = None):
+        """
+        Cropped grid for a viewport: ``(z, x_centers, y_centers)``.
+
+        ``sigma_m`` smooths in metres, converted to cells of the chosen level. The crop
+        is padded by 3 sigma before smoothing so the viewport edges see their neighbours.
+        """
+        grid = self.level_for(x_range, y_range, max_cells)
+        cw, ch = grid.length / grid.nx, grid.width / grid.ny
+        c0, c1, r0, r1 = self._span(grid, x_range, y_range)
+        if sigma_m:
+            sigma = (sigma_m / ch, sigma_m / cw)
+            pc, pr = int(np.ceil(3 * sigma[1])), int(np.ceil(3 * sigma[0]))
+            p0c, p0r = max(c0 - pc, 0), max(r0 - pr, 0)
+            padded = grid.counts[p0r:min(r1 + pr, grid.ny), p0c:min(c1 + pc, grid.nx)]
+            z = smooth(padded, sigma, backend)
+            z = z[r0 - p0r:r1 - p0r, c0 - p0c:c1 - p0c]
+        else:
+            z = grid.counts[r0:r1, c0:c1]
+        x_centers = (np.arange(c0, c1) + 0.5) * cw
+        y_centers = (np.arange(r0, r1) + 0.5) * ch
+        return z, x_centers, y_centers
+
+
+# ===== Pitch zones =====
+# Each zone is a predicate on cell centres (x toward the opponent's goal, y across the
+# pitch; "right" is the high-y side, as in the page's player styles). Zones overlap
+# freely: a cell can be in the penalty area, the final third and the centre channel.
+ZONES = {
+    "Penalty Area": lambda x, y, L, W: (x >= L - 16.5) & (np.abs(y - W / 2) <= 22),
+    "Final Third": lambda x, y, L, W: x >= 2 * L / 3,
+    "Right Wing": lambda x, y, L, W: y >= 2 * W / 3,
+    "Central": lambda x, y, L, W: (y >= W / 3) & (y < 2 * W / 3),
+    "Left Wing": lambda x, y, L, W: y < W / 3,
+    # Between the penalty-area and goal-area edges, the length of the pitch
+    "Right Half-Space": lambda x, y, L, W: (y >= W / 2 + 10) & (y <= W / 2 + 22),
+    "Left Half-Space": lambda x, y, L, W: (y >= W / 2 - 22) & (y <= W / 2 - 10),
+}
+
+
+class ZoneIndex:
+    """
+    Cell -> zone labels for one grid shape, computed once.
+
+    Stored as parallel (cell, zone) arrays, so the totals of every zone for any count
+    grid - or a stack of grids - are one weighted ``np.bincount``; the cost depends on
+    the number of cells, never on how many events were binned.
+    """
+
+    def __init__(self, nx, ny, length=FIELD_LENGTH, width=FIELD_WIDTH, zones=None):
+        zones = zones or ZONES
+        self.names = list(zones)
+        self.n_cells = nx * ny
+        x = (np.arange(nx) + 0.5) * (length / nx)
+        y = (np.arange(ny) + 0.5) * (width / ny)
+        xc, yc = (a.ravel() for a in np.meshgrid(x, y))  # Row-major, like PitchGrid.counts
+        cells = [np.flatnonzero(rule(xc, yc, length, width)) for rule in zones.values()]
+        self.cells = np.concatenate(cells)
+        self.zones = np.repeat(np.arange(len(cells)), [len(c) for c in cells])
+
+    def totals(self, counts) -> np.ndarray:
+        """Events per zone: shape (n_zones,) for one grid, (..., n_zones) for a stack."""
+        counts = np.asarray(counts)
+        stack = counts.reshape(-1, self.n_cells)
+        n_zones = len(self.names)
+        ids = (np.arange(len(stack))[:, None] * n_zones + self.zones).ravel()
+        flat = np.bincount(ids, weights=stack[:, self.cells].ravel(), minlength=len(stack) * n_zones)
+        return flat.reshape(counts.shape[:-2] + (n_zones,))
+
+    def shares(self, grid: PitchGrid) -> pd.Series:
+        """Percentage of the grid's events in each zone."""
+        return pd.Series(self.totals(grid.counts) * 100 / max(grid.total, 1), index=self.names)
+
+
+@lru_cache(maxsize=16)
+def zone_index(nx, ny, length=FIELD_LENGTH, width=FIELD_WIDTH) -> ZoneIndex:
+    return ZoneIndex(nx, ny, length, width)
+
+
+def zone_shares(grid: PitchGrid) -> pd.Series:
+    """Zone percentages for a grid, through the cached index for its shape."""
+    return zone_index(grid.nx, grid.ny, grid.length, grid.width).shares(grid)
+
+
+# ===== Per-group grid store =====
+class GridStore:
+    """
+    Count grids per key tuple - e.g. (player, season, competition) - stacked in one
+    ``(groups, ny, nx)`` array next to a DataFrame of the keys.
+
+    Any filter combination is a boolean mask over the (few) key rows and a sum of the
+    selected grids; smoothing is applied once to the sum, and difference maps are a
+    subtraction of two normalised sums. Nothing is re-binned per selection.
+    """
+
+    def __init__(self, keys: pd.DataFrame, counts: np.ndarray, length=FIELD_LENGTH, width=FIELD_WIDTH):
+        self.keys = keys.reset_index(drop=True)
+        self.counts = counts
+        self.length, self.width = float(length), float(width)
+        self.ny, self.nx = counts.shape[1:]
+
+    @classmethod
+    def from_points(cls, keys: pd.DataFrame, codes, x, y, nx=49, ny=49,
+                    length=FIELD_LENGTH, width=FIELD_WIDTH) -> "GridStore":
+        """Bin points tagged with a row of ``keys`` (``codes``) - all groups in one bincount."""
+        template = PitchGrid(nx, ny, length, width)
+        cells = template.cell_index(x, y)
+        keep = cells >= 0
+        n_cells = nx * ny
+        flat = np.asarray(codes)[keep] * n_cells + cells[keep]
+        counts = np.bincount(flat, minlength=len(keys) * n_cells).reshape(len(keys), ny, nx)
+        return cls(keys, counts, length, width)
+
+    @classmethod
+    def from_grids(cls, grids: dict, names) -> "GridStore":
+        """From ``bin_file`` / ``bin_files`` output (``{group tuple: PitchGrid}``)."""
+        groups = list(grids)
+        first = grids[groups[0]]
+        keys = pd.DataFrame(groups, columns=list(names))
+        counts = np.stack([grids[g].counts for g in groups])
+        return cls(keys, counts, first.length, first.width)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def mask(self, **filters) -> np.ndarray:
+        """
+        Key rows matching every filter.
+
+        A filter value may be a scalar, a list of values, or a ``(lo, hi)`` tuple for an
+        inclusive range on a numeric key; None ignores the key.
+        """
+        selected = np.ones(len(self.keys), dtype=bool)
+        for column, wanted in filters.items():
+            if wanted is None:
+                continue
+            values = self.keys[column]
+            if isinstance(wanted, tuple):
+                selected &= values.between(*wanted).to_numpy()
+            elif isinstance(wanted, (list, set, np.ndarray, pd.Index)):
+                selected &= values.isin(list(wanted)).to_numpy()
+            else:
+                selected &= (values == wanted).to_numpy()
+        return selected
+
+    def grid(self, **filters) -> PitchGrid:
+        """Summed counts of every matching group."""
+        counts = self.counts[self.mask(**filters)].sum(axis=0)
+        return PitchGrid(self.nx, self.ny, self.length, self.width, counts)
+
+    def heatmap(self, sigma=1.5, backend: str = None, normalize=False, **filters) -> np.ndarray:
+        """Smoothed map of a selection; ``normalize`` turns counts into shares of the total."""
+        grid = self.grid(**filters)
+        counts = grid.counts / max(grid.total, 1) if normalize else grid.counts
+        return smooth(counts, sigma, backend)
+
+    def difference(self, first: dict, second: dict, sigma=1.5, backend: str = None) -> np.ndarray:
+        """
+        ``first`` minus ``second`` (filter dicts), each normalised to shares first so
+        selections with different volumes compare; smoothed once after subtracting.
+        """
+        a, b = self.grid(**first), self.grid(**second)
+        delta = a.counts / max(a.total, 1) - b.counts / max(b.total, 1)
+        return smooth(delta, sigma, backend)
+
+    def save(self, path):
+        """Persist keys + stacked counts (.npz) atomically."""
+        def write(tmp):
+            with open(tmp, "wb") as fh:
+                np.savez(fh, counts=self.counts, keys=np.array(self.keys.to_json(orient="split")),
+                         pitch=np.array([self.length, self.width]))
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, write)
+
+    @classmethod
+    def load(cls, path) -> "GridStore":
+        with np.load(path) as stored:
+            keys = pd.read_json(io.StringIO(str(stored["keys"])), orient="split")
+            length, width = stored["pitch"]
+            return cls(keys, stored["counts"], length, width)
+
+
+def iter_chunks(path, columns, chunksize: int = CHUNK_ROWS):
+    """Yield DataFrame chunks with only ``columns`` from a CSV or Parquet file."""
+    path = Path(path)
+    columns = list(dict.fromkeys(columns))
+    sys.audit(SOURCE_EVENT, str(path))  # Parquet is opened natively, out of sight of open()
+    if path.suffix in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def bin_file(path, x="x", y="y", by=None, nx=49, ny=49, chunksize: int = CHUNK_ROWS) -> dict:
+    """
+    One streaming pass over a file, producing a grid per group of ``by`` columns.
+
+    Group codes and cell indices are combined into one flat index per chunk, so every
+    group is binned by the same ``np.bincount`` call. Returns ``{group tuple: PitchGrid}``
+    (``{(): grid}`` without ``by``); each grid records the file as its source.
+    """
+    by = [by] if isinstance(by, str) else list(by or [])
+    template = PitchGrid(nx, ny)
+    n_cells = nx * ny
+    grids = {}
+    for chunk in iter_chunks(path, [x, y] + by, chunksize):
+        cells = template.cell_index(chunk[x].to_numpy(), chunk[y].to_numpy())
+        if by:
+            codes, groups = pd.MultiIndex.from_frame(chunk[by]).factorize()
+        else:
+            codes, groups = np.zeros(len(chunk), dtype=np.int64), [()]
+        keep = (cells >= 0) & (codes >= 0)
+        flat = codes[keep] * n_cells + cells[keep]
+        stacked = np.bincount(flat, minlength=len(groups) * n_cells).reshape(len(groups), ny, nx)
+        for group, counts in zip(groups, stacked):
+            grid = grids.setdefault(tuple(group), template.empty_like())
+            grid.counts += counts
+    digest = file_digest(path)
+    for grid in grids.values():
+        grid.sources.add(digest)
+    return grids
+
+
+def merge_grids(parts) -> dict:
+    """Merge ``{group: PitchGrid}`` dicts from several files / workers."""
+    merged = {}
+    for part in parts:
+        for group, grid in part.items():
+            if group in merged:
+                merged[group].merge(grid)
+            else:
+                merged[group] = grid
+    return merged
+
+
+def bin_files(paths, workers: int = None, **kwargs) -> dict:
+    """Bin several files in parallel worker processes and merge the partial grids."""
+    paths = list(paths)
+    if workers == 1 or len(paths) < 2:
+        return merge_grids(bin_file(path, **kwargs) for path in paths)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(bin_file, path, **kwargs) for path in paths]
+        return merge_grids(future.result() for future in futures)
@@ -0,0 +1,183 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+# ===== Render timing =====
+# route_page runs inside ``timed_page``, and every chart block in pages/ is wrapped in
+# ``with timed(figure=fig):`` around its st.* call. Each block becomes one row:
+#   build_ms  time since the previous row ended - data prep and figure construction
+#   emit_ms   the block itself - Plotly JSON serialization / image encoding
+#   bytes     payload of the figure: its Plotly spec JSON, or the image's size
+# ``timed(name)`` adds a row for any other block, and dataset loads (LazyDatasets
+# misses) are recorded as "data" rows. Recording is off unless the URL has
+# ?diagnostics=1 or GOAT_RENDER_TIMING=1; runs are appended to GOAT_RENDER_LOG as JSON lines.
+
+LOG_PATH = Path(os.environ.get("GOAT_RENDER_LOG", ".cache/render_timing.jsonl"))
+HISTORY_SIZE = 20
+CHART_KINDS = ("plotly", "pyplot", "image")
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+class RenderTimer:
+    """Timings and bytes for one page render (one script run)."""
+
+    def __init__(self, page: str):
+        self.page = page
+        self.rows = []
+        self.started = time.perf_counter()
+        self.mark = self.started
+        self.total_ms = None
+
+    def add(self, name, kind, build_ms=0.0, emit_ms=0.0, nbytes=0):
+        self.rows.append({"name": name, "kind": kind, "build_ms": round(build_ms, 2),
+                          "emit_ms": round(emit_ms, 2), "bytes": nbytes})
+        self.mark = time.perf_counter()
+
+    def summary(self) -> dict:
+        charts = [r for r in self.rows if r["kind"] in CHART_KINDS]
+        return {
+            "page": self.page,
+            "ts": round(time.time(), 3),
+            "total_ms": round(self.total_ms or 0.0, 2),
+            "bytes": sum(r["bytes"] for r in self.rows),
+            "chart_bytes": sum(r["bytes"] for r in charts),
+            "charts": len(charts),
+            "data_ms": round(sum(r["emit_ms"] for r in self.rows if r["kind"] == "data"), 2),
+            "rows": self.rows,
+        }
+
+
+def active():
+    """This thread's RenderTimer while a page is being timed, else None."""
+    return getattr(_local, "timer", None)
+
+
+def enabled() -> bool:
+    if os.environ.get("GOAT_RENDER_TIMING") == "1":
+        return True
+    try:
+        return st.query_params.get("diagnostics") == "1"
+    except Exception:  # No script run context (bare python)
+        return False
+
+
+def record(name, kind, ms, nbytes=0):
+    """Add a finished measurement (e.g. a dataset load) to the active timer, if any."""
+    timer = active()
+    if timer is not None:
+        timer.add(name, kind, emit_ms=ms, nbytes=nbytes)
+
+
+def _figure_kind(figure) -> str:
+    if isinstance(figure, (bytes, bytearray)):
+        return "image"
+    if hasattr(figure, "savefig"):
+        return "pyplot"
+    return "plotly"
+
+
+def _figure_label(figure, kind, timer) -> str:
+    """Plotly figure title when there is one, else '<kind> #<n>'."""
+    try:
+        title = figure.layout.title.text
+    except AttributeError:
+        title = None
+    return title or f"{kind} #{sum(r['kind'] == kind for r in timer.rows) + 1}"
+
+
+def _figure_bytes(figure, kind) -> int:
+    """What the chart sends: the Plotly spec JSON or the encoded image (0 for pyplot)."""
+    if kind == "image":
+        return len(figure)
+    if kind == "plotly":
+        import plotly.io as pio
+
+        spec = figure.to_dict()
+        return getattr(spec, "nbytes", 0) or len(pio.to_json(spec, validate=False))
+    return 0  # Rasterized by st.pyplot; not sized without rendering it again
+
+
+@contextmanager
+def timed(name=None, kind="block", figure=None):
+    """
+    Time a block as one row (usable as a decorator too); a no-op when not recording.
+
+    Pass the chart's ``figure`` (Plotly figure, matplotlib figure or image bytes) to
+    record it as a chart: the row is named after its title and sized after the block.
+    """
+    timer = active()
+    if timer is None:
+        yield
+        return
+    if figure is not None:
+        kind = _figure_kind(figure)
+        name = name or _figure_label(figure, kind, timer)
+    build_ms = (time.perf_counter() - timer.mark) * 1000
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit_ms = (time.perf_counter() - t0) * 1000
+        nbytes = _figure_bytes(figure, kind) if figure is not None else 0
+        timer.add(name, kind, build_ms, emit_ms, nbytes)
+
+
+@contextmanager
+def timed_page(page: str):
+    """
+    Record ``page``'s render on this thread when diagnostics are enabled.
+
+    Yields the RenderTimer (or None when off). On exit the run is kept in the
+    session's history for ``show_diagnostics`` and appended to LOG_PATH.
+    """
+    if not enabled() or active() is not None:
+        yield None
+        return
+    timer = RenderTimer(page)
+    _local.timer = timer
+    try:
+        yield timer
+    finally:
+        _local.timer = None
+        timer.total_ms = (time.perf_counter() - timer.started) * 1000
+        summary = timer.summary()
+        history = st.session_state.setdefault("render_timings", [])
+        history.append(summary)
+        del history[:-HISTORY_SIZE]
+        _append_log(summary)
+
+
+def _append_log(summary):
+    try:
+        LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with _log_lock, open(LOG_PATH, "a") as fh:
+            fh.write(json.dumps(summary) + "\n")
+    except OSError:
+        pass  # Read-only deployments still get the in-app panel
+
+
+def show_diagnostics():
+    """Sidebar panel with the last timed render and the session's recent runs."""
+    history = st.session_state.get("render_timings")
+    if not enabled() or not history:
+        return
+
+    last = history[-1]
+    with st.sidebar.expander("⏱️ Render timing", expanded=True):
+        st.caption(f"{last['page']}: {last['total_ms']:.0f} ms, {last['charts']} charts "
+                   f"({last['chart_bytes'] / 1024:.0f} KiB), "
+                   f"data loads {last['data_ms']:.0f} ms")
+        st.dataframe(pd.DataFrame(last["rows"], columns=["name", "kind", "build_ms", "emit_ms", "bytes"]),
+                     hide_index=True, use_container_width=True)
+        st.caption("Recent runs")
+        st.dataframe(pd.DataFrame(history)[["page", "total_ms", "bytes", "charts", "data_ms"]].iloc[::-1],
+                     hide_index=True, use_container_width=True)
+        st.caption(f"Appended to {LOG_PATH}")
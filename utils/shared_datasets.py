@@ -0,0 +1,127 @@
+"""
+Shared-memory dataset cache for multi-process deployments.
+
+One loader process publishes every dataset as an uncompressed Arrow IPC file
+(ideally on tmpfs, e.g. /dev/shm) and keeps them fresh:
+
+    python -m utils.shared_datasets --dir /dev/shm/goat-datasets --watch 5
+
+Each ``streamlit run app.py`` started with ``GOAT_SHARED_DATASETS=/dev/shm/goat-datasets``
+memory-maps those files instead of parsing CSVs. Column buffers are wrapped without
+copying, so the pages are shared through the OS page cache and a new worker only
+pays for mapping the files.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from utils.snapshot_cache import write_atomic
+
+SHARED_DIR = os.environ.get("GOAT_SHARED_DATASETS")
+MANIFEST_NAME = "manifest.json"
+
+
+def shared_file(shared_dir, key) -> Path:
+    return Path(shared_dir) / f"{key}.arrow"
+
+
+def read_shared(path) -> pd.DataFrame:
+    """
+    Memory-map one published dataset as a DataFrame backed by the mapped buffers.
+
+    Columns come back with the dtypes they were published with (the dataset's dtype
+    plan, kept in the file's pandas metadata), so pages see the same frames as in
+    normal mode. split_blocks keeps each null-free numeric column a view of the
+    mapping; string[pyarrow] columns wrap the Arrow arrays and categoricals only
+    materialise their codes.
+    """
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def write_shared(shared_dir, key, df: pd.DataFrame) -> Path:
+    """Publish ``df`` as ``<key>.arrow``; replaced atomically so readers never see a partial file."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    def write(tmp):
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    target = shared_file(shared_dir, key)
+    write_atomic(target, write)
+    return target
+
+
+def _write_manifest(shared_dir, sources):
+    manifest = {"published_at": time.time(), "datasets": sources}
+    path = Path(shared_dir) / MANIFEST_NAME
+    write_atomic(path, lambda p: p.write_text(json.dumps(manifest, indent=1)))
+
+
+def shared_loaders(shared_dir=None):
+    """
+    Return ``(loaders, paths)`` for a ``LazyDatasets`` attached to the published files,
+    or ``None`` when shared mode is off or nothing has been published yet.
+    """
+    shared_dir = shared_dir or SHARED_DIR
+    if not shared_dir:
+        return None
+    try:
+        manifest = json.loads((Path(shared_dir) / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+    def loader(key, source):
+        path = shared_file(shared_dir, key)
+        return lambda: (read_shared(path), f"shared:{source}")
+
+    datasets = manifest["datasets"]
+    loaders = {key: loader(key, source) for key, source in datasets.items()}
+    paths = {key: shared_file(shared_dir, key) for key in datasets}
+    return loaders, paths
+
+
+def publish(shared_dir, data, keys=None) -> dict:
+    """Write ``keys`` (default: all) of a ``LazyDatasets`` and refresh the manifest."""
+    os.makedirs(shared_dir, exist_ok=True)
+    timings = {}
+    for key in keys if keys is not None else list(data):
+        t0 = time.perf_counter()
+        write_shared(shared_dir, key, data[key])
+        timings[key] = (time.perf_counter() - t0) * 1000
+    sources = data.stats().set_index("dataset")["source"]
+    _write_manifest(shared_dir, sources[sources != ""].to_dict())
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Publish datasets for GOAT_SHARED_DATASETS workers.")
+    parser.add_argument("--dir", default=SHARED_DIR or "/dev/shm/goat-datasets")
+    parser.add_argument("--data", default="data", help="CSV directory to publish from")
+    parser.add_argument("--watch", type=float, default=0,
+                        help="keep running and republish changed CSVs every N seconds")
+    args = parser.parse_args(argv)
+
+    from utils.data_loader import open_datasets
+
+    data = open_datasets(args.data)
+    timings = publish(args.dir, data)
+    print(f"published {len(timings)} datasets to {args.dir} in {sum(timings.values()):.1f} ms")
+
+    while args.watch > 0:
+        time.sleep(args.watch)
+        report = data.reload_changed()
+        if len(report):
+            changed = list(report["dataset"])
+            publish(args.dir, data, keys=changed)
+            print(f"republished: {', '.join(changed)}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
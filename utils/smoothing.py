@@ -0,0 +1,147 @@
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+from scipy.ndimage import convolve1d, gaussian_filter, uniform_filter1d
+
+# ===== Heat-map smoothing backends =====
+# Every backend smooths the last two axes of a grid (or a stack of grids) with a
+# Gaussian of standard deviation ``sigma`` cells - a scalar or (sigma_rows, sigma_cols) -
+# using scipy's "reflect" boundary, so results are interchangeable:
+#   gaussian   scipy.ndimage.gaussian_filter (reference)
+#   separable  two cached 1D kernels, convolved along rows then columns
+#   fft        reflect-pad, multiply by a cached kernel spectrum per (shape, sigma), crop
+#   box        three box-filter passes approximating the Gaussian (not exact)
+
+TRUNCATE = 4.0  # Kernel radius in sigmas, as gaussian_filter
+BOX_PASSES = 3
+DEFAULT_BACKEND = os.environ.get("GOAT_SMOOTHING", "separable")
+
+
+def _sigmas(sigma):
+    return (float(sigma), float(sigma)) if np.isscalar(sigma) else tuple(float(s) for s in sigma)
+
+
+def _radius(sigma: float) -> int:
+    return int(TRUNCATE * sigma + 0.5)
+
+
+@lru_cache(maxsize=64)
+def gaussian_kernel(sigma: float) -> np.ndarray:
+    """Normalised 1D Gaussian taps over +-TRUNCATE sigma (read-only, cached)."""
+    radius = _radius(sigma)
+    taps = np.exp(-0.5 * (np.arange(-radius, radius + 1) / sigma) ** 2)
+    taps /= taps.sum()
+    taps.flags.writeable = False
+    return taps
+
+
+def smooth_gaussian(grid, sigma):
+    sy, sx = _sigmas(sigma)
+    return gaussian_filter(grid, sigma=(0,) * (grid.ndim - 2) + (sy, sx), truncate=TRUNCATE)
+
+
+def smooth_separable(grid, sigma):
+    sy, sx = _sigmas(sigma)
+    out = np.asarray(grid, dtype=np.float64)
+    if sy > 0:
+        out = convolve1d(out, gaussian_kernel(sy), axis=-2, mode="reflect")
+    if sx > 0:
+        out = convolve1d(out, gaussian_kernel(sx), axis=-1, mode="reflect")
+    return out
+
+
+@lru_cache(maxsize=64)
+def kernel_spectrum(shape, sigma) -> np.ndarray:
+    """rfft2 of the 2D Gaussian, centred at the origin of a ``shape`` (padded) grid."""
+    sy, sx = sigma
+    kernel = np.zeros(shape)
+    ky, kx = gaussian_kernel(sy), gaussian_kernel(sx)
+    ry, rx = len(ky) // 2, len(kx) // 2
+    rows = np.arange(-ry, ry + 1) % shape[0]
+    cols = np.arange(-rx, rx + 1) % shape[1]
+    kernel[np.ix_(rows, cols)] = np.outer(ky, kx)
+    spectrum = np.fft.rfft2(kernel)
+    spectrum.flags.writeable = False
+    return spectrum
+
+
+def smooth_fft(grid, sigma):
+    sy, sx = _sigmas(sigma)
+    grid = np.asarray(grid, dtype=np.float64)
+    ry, rx = _radius(sy) if sy > 0 else 0, _radius(sx) if sx > 0 else 0
+    # numpy "symmetric" padding is scipy's "reflect"; the pad absorbs the FFT wrap-around
+    pad = [(0, 0)] * (grid.ndim - 2) + [(ry, ry), (rx, rx)]
+    padded = np.pad(grid, pad, mode="symmetric")
+    shape = padded.shape[-2:]
+    spectrum = kernel_spectrum(shape, (max(sy, 1e-9), max(sx, 1e-9)))
+    out = np.fft.irfft2(np.fft.rfft2(padded) * spectrum, s=shape)
+    return out[..., ry:ry + grid.shape[-2], rx:rx + grid.shape[-1]]
+
+
+def _box_width(sigma: float) -> int:
+    """Odd box width whose BOX_PASSES-fold repetition has variance closest to sigma**2."""
+    width = int(round(np.sqrt(12 * sigma ** 2 / BOX_PASSES + 1)))
+    return width if width % 2 else width + 1
+
+
+def smooth_box(grid, sigma):
+    sy, sx = _sigmas(sigma)
+    out = np.asarray(grid, dtype=np.float64)
+    for axis, s in ((-2, sy), (-1, sx)):
+        if s <= 0:
+            continue
+        width = _box_width(s)
+        for _ in range(BOX_PASSES):
+            out = uniform_filter1d(out, width, axis=axis, mode="reflect")
+    return out
+
+
+BACKENDS = {
+    "gaussian": smooth_gaussian,
+    "separable": smooth_separable,
+    "fft": smooth_fft,
+    "box": smooth_box,
+}
+# Backends whose output matches the reference to floating-point precision
+EXACT_BACKENDS = ("gaussian", "separable", "fft")
+
+
+@lru_cache(maxsize=128)
+def pick_backend(shape, sigma, exact: bool = True, repeat: int = 3) -> str:
+    """
+    Time the backends once on a random grid of ``shape`` and return the fastest.
+
+    Cached per (shape, sigma); ``exact=False`` also lets the box approximation win.
+    """
+    grid = np.random.default_rng(0).random(shape)
+    best, best_s = None, float("inf")
+    for name in (EXACT_BACKENDS if exact else BACKENDS):
+        fn = BACKENDS[name]
+        fn(grid, sigma)  # Warm kernel caches
+        elapsed = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(grid, sigma)
+            elapsed = min(elapsed, time.perf_counter() - t0)
+        if elapsed < best_s:
+            best, best_s = name, elapsed
+    return best
+
+
+def smooth(grid, sigma=1.5, backend: str = None) -> np.ndarray:
+    """
+    Gaussian-smooth a grid (or a stack of grids along the leading axes).
+
+    ``backend`` is one of BACKENDS, "auto" (fastest exact backend for this shape, timed
+    once) or None for DEFAULT_BACKEND (env GOAT_SMOOTHING).
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    backend = backend or DEFAULT_BACKEND
+    if backend == "auto":
+        sigma_key = _sigmas(sigma)
+        backend = pick_backend(grid.shape, sigma_key)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown smoothing backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+    return BACKENDS[backend](grid, sigma)
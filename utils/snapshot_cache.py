@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pyarrow.feather as feather
+
+# ===== Columnar snapshot cache =====
+# Parsed + Arrow-safe DataFrames are written once as uncompressed Feather (Arrow IPC)
+# files so later processes can memory-map them instead of re-parsing the CSV.
+CACHE_DIR = Path(os.environ.get("GOAT_SNAPSHOT_DIR", ".cache/snapshots"))
+# sys.audit event raised with the source path on every cached_frame call, hit or miss,
+# and every positional file streamed by utils.pitch_grid, so tools can see which files
+# a render depended on (see utils.static_export)
+SOURCE_EVENT = "goat.snapshot.source"
+
+
+def file_digest(path: Path) -> str:
+    """Return the sha256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def write_atomic(target: Path, write: Callable[[Path], None]):
+    """Write through a temp file + rename so concurrent workers never read half a file."""
+    # pid + thread id: sessions are threads of one process and may miss the same snapshot
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def read_csv_cached(source, prepare: Callable[[pd.DataFrame], pd.DataFrame],
+                    cache_dir: Path = None, version: str = "") -> pd.DataFrame:
+    """
+    Read ``source`` through the snapshot cache.
+
+    - Fast path: size + mtime match the recorded metadata -> memory-map the snapshot.
+    - Touched but unchanged file (same sha256) -> refresh metadata, reuse the snapshot.
+    - Otherwise parse the CSV, run ``prepare`` and write a new snapshot.
+
+    ``version`` identifies the ``prepare`` step; changing it invalidates old snapshots.
+    """
+    return cached_frame(source, lambda p: prepare(pd.read_csv(p)), cache_dir=cache_dir, version=version)
+
+
+def cached_frame(source, build: Callable[[Path], pd.DataFrame], name: str = None,
+                 cache_dir: Path = None, version: str = "") -> pd.DataFrame:
+    """
+    Snapshot the DataFrame ``build(source)`` produces, keyed by the source file.
+
+    Same keying as ``read_csv_cached`` (size + mtime, then sha256), but ``build`` gets the
+    path and may read it however it likes, e.g. in chunks. ``name`` defaults to the
+    source's stem and must be unique per cache directory.
+    """
+    source = Path(source)
+    sys.audit(SOURCE_EVENT, str(source))
+    name = name or source.stem
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    stat = source.stat()
+    meta_file = cache_dir / f"{name}.json"
+
+    meta = None
+    if meta_file.exists():
+        try:
+            meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            meta = None
+
+    if meta is not None:
+        snap = cache_dir / meta["snapshot"]
+        same_stat = meta["size"] == stat.st_size and meta["mtime_ns"] == stat.st_mtime_ns
+        if meta.get("version", "") == version and snap.exists() and (same_stat or meta["sha256"] == file_digest(source)):
+            if not same_stat:
+                meta.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                write_atomic(meta_file, lambda p: p.write_text(json.dumps(meta)))
+            try:
+                return feather.read_table(snap, memory_map=True).to_pandas()
+            except OSError:
+                pass  # Corrupt or concurrently removed snapshot - rebuild below
+
+    df = build(source)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        digest = file_digest(source)
+        snap = cache_dir / f"{name}-{digest[:16]}.arrow"
+        # Uncompressed so the file can be memory-mapped without a decode step
+        write_atomic(snap, lambda p: feather.write_feather(df, p, compression="uncompressed"))
+        stale = cache_dir / meta["snapshot"] if meta else None
+        meta = {
+            "source": str(source),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "snapshot": snap.name,
+            "version": version,
+        }
+        write_atomic(meta_file, lambda p: p.write_text(json.dumps(meta)))
+        if stale is not None and stale != snap and stale.exists():
+            stale.unlink()  # Workers that already mapped it keep their view
+    except OSError:
+        pass  # Read-only deployments still work, just without the cache
+
+    return df
+
+
+def clear_snapshots(cache_dir: Path = None):
+    """Remove every snapshot and metadata file from the cache directory."""
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    if not cache_dir.exists():
+        return
+    for p in cache_dir.iterdir():
+        if p.suffix in (".arrow", ".json"):
+            p.unlink()
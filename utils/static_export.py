@@ -0,0 +1,449 @@
+"""
+Static-site export of the whole dashboard.
+
+    python -m utils.static_export --out site --workers 4
+
+Every page is rendered once through Streamlit's AppTest, and its element tree is
+turned into plain HTML:
+  - markdown / HTML cards, alerts, tables and columns become HTML,
+  - each Plotly chart becomes a content-hashed figures/<sha>.json file, drawn by
+    plotly.js in the browser when it scrolls into view,
+  - navbar buttons become links, and other widgets show their default state.
+CSS, the chart loader and plotly.js are written under assets/ with hashed names, so
+the bundle can be served by any static host or CDN with long-lived caching.
+
+Pages render in a process pool, one page per (fresh) worker. The manifest
+(.export_manifest.json) records, per page, the digests of the shared code, the
+page's module and every data file it read while rendering. A later export only
+re-renders pages whose inputs changed. Run from the repository root, like
+``streamlit run app.py``.
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from utils.snapshot_cache import SOURCE_EVENT, file_digest, write_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST = ".export_manifest.json"
+SITE_TITLE = "GOAT Debate: Messi vs Ronaldo"
+
+# ===== Static assets =====
+SITE_CSS = """
+body { margin: 0; background: #fafafa; color: #262730; font-family: 'Times New Roman', serif; }
+main { max-width: 1400px; margin: 0 auto; padding: 1rem 2rem 4rem; }
+.row { display: flex; gap: 1rem; align-items: flex-start; }
+.col { min-width: 0; }
+.chart { width: 100%; min-height: 300px; margin: 0.5rem 0; }
+.alert { padding: 0.75rem 1rem; border-radius: 0.5rem; margin: 0.5rem 0; }
+.alert.success { background: #dff5e3; color: #176f2c; }
+.alert.info { background: #e0eefc; color: #1a4d80; }
+.alert.warning { background: #fff6d6; color: #7a5b00; }
+.alert.error { background: #fde2e2; color: #8a1c1c; }
+.caption { color: #6b6f76; font-size: 0.875rem; }
+.widget { margin: 0.5rem 0; }
+.widget label, .widget legend { font-weight: bold; }
+.widget .chip { display: inline-block; padding: 0.1rem 0.5rem; margin: 0.1rem; border-radius: 1rem; background: #e8e8ee; }
+a.nav-link { display: block; text-align: center; padding: 0.5rem; margin: 0.25rem 0; border-radius: 0.5rem;
+             border: 1px solid #d0d3da; color: inherit; text-decoration: none; }
+a.nav-link.active { border-color: #75AADB; background: #eef5fb; }
+table.dataframe { border-collapse: collapse; width: 100%; font-size: 0.9rem; }
+table.dataframe th, table.dataframe td { border-bottom: 1px solid #e6e6ea; padding: 0.3rem 0.5rem; text-align: left; }
+"""
+
+CHART_JS = """
+(function () {
+  function draw(el) {
+    fetch(el.dataset.figure).then(function (r) { return r.json(); }).then(function (fig) {
+      Plotly.newPlot(el, fig.data || [], fig.layout || {},
+                     Object.assign({responsive: true, displaylogo: false}, fig.config || {}));
+    });
+  }
+  var charts = document.querySelectorAll('div.chart[data-figure]');
+  if (!('IntersectionObserver' in window)) { charts.forEach(draw); return; }
+  var observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) { observer.unobserve(entry.target); draw(entry.target); }
+    });
+  }, {rootMargin: '400px'});
+  charts.forEach(function (el) { observer.observe(el); });
+})();
+"""
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def write_hashed(out_dir: Path, folder: str, stem: str, suffix: str, data: bytes) -> str:
+    """Write ``data`` as <folder>/<stem>-<hash><suffix> (once) and return the relative path."""
+    name = f"{folder}/{stem}-{content_hash(data)}{suffix}" if stem else f"{folder}/{content_hash(data)}{suffix}"
+    target = out_dir / name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(target, lambda tmp: tmp.write_bytes(data))
+    return name
+
+
+def write_assets(out_dir: Path) -> dict:
+    """Shared CSS / JS bundle with hashed names: {"css": path, "charts": path, "plotly": path}."""
+    from plotly.offline import get_plotlyjs
+
+    return {
+        "css": write_hashed(out_dir, "assets", "site", ".css", SITE_CSS.encode()),
+        "charts": write_hashed(out_dir, "assets", "charts", ".js", CHART_JS.encode()),
+        "plotly": write_hashed(out_dir, "assets", "plotly", ".min.js", get_plotlyjs().encode()),
+    }
+
+
+# ===== Markdown =====
+# Just the subset the pages use: raw HTML blocks, headings, rules, lists, paragraphs
+# and **bold** / *italic* / `code` / [links](...) inline. Page content is trusted
+# (st.markdown is called with unsafe_allow_html=True), so inline HTML passes through.
+_INLINE = [
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])"), r"<em>\1</em>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)"), r'<a href="\2">\1</a>'),
+]
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET = re.compile(r"^\s*[-*+]\s+(.*)$")
+_NUMBERED = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+
+
+def inline(text: str) -> str:
+    for pattern, replacement in _INLINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def markdown_to_html(text: str) -> str:
+    lines = text.replace("\r\n", "\n").split("\n")
+    out, paragraph, i = [], [], 0
+
+    def flush():
+        if paragraph:
+            out.append("<p>" + inline(" ".join(line.strip() for line in paragraph)) + "</p>")
+            paragraph.clear()
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped:
+            flush()
+            i += 1
+        elif stripped.startswith("<"):
+            # HTML block: runs until the next blank line, passed through untouched
+            flush()
+            block = []
+            while i < len(lines) and lines[i].strip():
+                block.append(lines[i])
+                i += 1
+            out.append("\n".join(block))
+        elif _HEADING.match(stripped):
+            flush()
+            level, title = _HEADING.match(stripped).groups()
+            out.append(f"<h{len(level)}>{inline(title)}</h{len(level)}>")
+            i += 1
+        elif _RULE.match(stripped):
+            flush()
+            out.append("<hr>")
+            i += 1
+        elif _BULLET.match(line) or _NUMBERED.match(line):
+            flush()
+            pattern, tag = (_BULLET, "ul") if _BULLET.match(line) else (_NUMBERED, "ol")
+            items = []
+            while i < len(lines) and pattern.match(lines[i]):
+                items.append(f"<li>{inline(pattern.match(lines[i]).group(1))}</li>")
+                i += 1
+            out.append(f"<{tag}>" + "".join(items) + f"</{tag}>")
+        else:
+            paragraph.append(line)
+            i += 1
+    flush()
+    return "\n".join(out)
+
+
+# ===== Element tree -> HTML =====
+class PageRenderer:
+    """Turns one AppTest element tree into HTML, collecting figure specs on the way."""
+
+    def __init__(self, page: str, page_keys):
+        self.page = page
+        self.page_keys = set(page_keys)
+        self.figures = []  # [(figure spec JSON, relative path)], filled by render()
+        self.skipped = {}
+
+    def render(self, node) -> str:
+        from streamlit.testing.v1.element_tree import Block
+
+        if isinstance(node, Block):
+            return self.block(node)
+        handler = getattr(self, f"element_{node.type}", None)
+        if handler is None:
+            self.skipped[node.type] = self.skipped.get(node.type, 0) + 1
+            return f"<!-- {html.escape(node.type)} not exported -->"
+        return handler(node)
+
+    def children(self, node) -> str:
+        return "\n".join(self.render(child) for child in node.children.values())
+
+    def block(self, node) -> str:
+        children = list(node.children.values())
+        if node.type == "column":
+            return f'<div class="col" style="flex: {node.weight:g} 1 0">{self.children(node)}</div>'
+        if node.type == "expander":
+            return f"<details><summary>{inline(html.escape(node.label))}</summary>{self.children(node)}</details>"
+        if children and all(getattr(child, "type", None) == "column" for child in children):
+            return f'<div class="row">{self.children(node)}</div>'
+        return f"<div>{self.children(node)}</div>"
+
+    # --- text ---
+    def element_markdown(self, node):
+        return markdown_to_html(node.proto.body)
+
+    def element_caption(self, node):
+        return f'<div class="caption">{markdown_to_html(node.proto.body)}</div>'
+
+    def element_divider(self, node):
+        return "<hr>"
+
+    def element_heading(self, node):
+        tag = {"h1": "h1", "h2": "h2", "h3": "h3"}.get(node.proto.tag, "h2")
+        return f"<{tag}>{inline(node.proto.body)}</{tag}>"
+
+    element_title = element_header = element_subheader = element_heading
+
+    def _alert(self, node, kind):
+        return f'<div class="alert {kind}">{markdown_to_html(node.proto.body)}</div>'
+
+    def element_success(self, node):
+        return self._alert(node, "success")
+
+    def element_info(self, node):
+        return self._alert(node, "info")
+
+    def element_warning(self, node):
+        return self._alert(node, "warning")
+
+    def element_error(self, node):
+        return self._alert(node, "error")
+
+    # --- data ---
+    def element_plotly_chart(self, node):
+        spec = json.loads(node.proto.spec)
+        config = json.loads(node.proto.config or "{}")
+        if config:
+            spec["config"] = config
+        data = json.dumps(spec, separators=(",", ":")).encode()
+        path = f"figures/{content_hash(data)}.json"
+        self.figures.append((data, path))
+        height = spec.get("layout", {}).get("height") or 450
+        return f'<div class="chart" data-figure="{path}" style="height: {int(height)}px"></div>'
+
+    def element_dataframe(self, node):
+        return node.value.to_html(index=False, border=0, classes="dataframe", na_rep="")
+
+    element_table = element_dataframe
+
+    def element_metric(self, node):
+        delta = f'<div class="caption">{html.escape(node.proto.delta)}</div>' if node.proto.delta else ""
+        return (f'<div class="widget"><div class="caption">{inline(html.escape(node.proto.label))}</div>'
+                f'<div style="font-size: 2rem">{html.escape(node.proto.body)}</div>{delta}</div>')
+
+    # --- widgets: links for navigation, default state for the rest ---
+    def element_button(self, node):
+        target = (node.key or "").removeprefix("nav_")
+        if not (node.key or "").startswith("nav_") or target not in self.page_keys:
+            return ""
+        active = " active" if target == self.page else ""
+        return f'<a class="nav-link{active}" href="{target}.html">{html.escape(node.label)}</a>'
+
+    def element_radio(self, node):
+        options = "".join(
+            f'<div><input type="radio" disabled{" checked" if option == node.value else ""}> '
+            f"{html.escape(str(option))}</div>" for option in node.options)
+        return f'<fieldset class="widget"><legend>{html.escape(node.label)}</legend>{options}</fieldset>'
+
+    def element_selectbox(self, node):
+        return (f'<div class="widget"><label>{html.escape(node.label)}</label> '
+                f'<select disabled><option selected>{html.escape(str(node.value))}</option></select></div>')
+
+    def element_multiselect(self, node):
+        chips = "".join(f'<span class="chip">{html.escape(str(v))}</span>' for v in node.value)
+        return f'<div class="widget"><label>{html.escape(node.label)}</label> {chips}</div>'
+
+    def element_slider(self, node):
+        value = node.value
+        shown = " – ".join(map(str, value)) if isinstance(value, (list, tuple)) else str(value)
+        return f'<div class="widget"><label>{html.escape(node.label)}</label> {html.escape(shown)}</div>'
+
+    element_select_slider = element_slider
+
+
+def page_document(body: str, label: str, assets: dict) -> str:
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(SITE_TITLE)} - {html.escape(label)}</title>
+<link rel="stylesheet" href="{assets['css']}">
+<script src="{assets['plotly']}" defer></script>
+<script src="{assets['charts']}" defer></script>
+</head>
+<body>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+# ===== Per-page export (runs in a worker process) =====
+def export_page(page: str, out_dir: str, assets: dict) -> dict:
+    """
+    Render one page and write <page>.html plus its figures.
+
+    Returns the data files the page read (path -> digest), found with an audit hook
+    on open() and on snapshot-cache lookups (which may skip opening the CSV). The
+    worker is fresh, so in-process caches can't hide a read.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    from app import NAV_ITEMS, PAGE_MODULES
+
+    data_dir = (Path.cwd() / "data").resolve()
+    opened = set()
+
+    def audit(event, args):
+        if event in ("open", SOURCE_EVENT) and isinstance(args[0], (str, bytes, os.PathLike)):
+            path = Path(os.fsdecode(args[0]))
+            if path.suffix and data_dir in path.resolve().parents:
+                opened.add(path.resolve())
+
+    sys.addaudithook(audit)
+    t0 = time.perf_counter()
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    at.query_params["page"] = page
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+
+    renderer = PageRenderer(page, PAGE_MODULES)
+    body = renderer.render(at.main)
+    out = Path(out_dir)
+    for data, path in renderer.figures:
+        target = out / path
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(target, lambda tmp, data=data: tmp.write_bytes(data))
+    document = page_document(body, dict(NAV_ITEMS).get(page, page), assets)
+    write_atomic(out / f"{page}.html", lambda tmp: tmp.write_text(document, encoding="utf-8"))
+    return {
+        "page": page,
+        "data": {str(p.relative_to(data_dir.parent)): file_digest(p) for p in sorted(opened) if p.exists()},
+        "figures": sorted({path for _, path in renderer.figures}),
+        "skipped": renderer.skipped,
+        "ms": round((time.perf_counter() - t0) * 1000, 1),
+    }
+
+
+# ===== Incremental build =====
+def code_digest() -> str:
+    """Digest of the code every page shares: app.py and utils/ (this exporter included)."""
+    h = hashlib.sha256()
+    for path in [ROOT / "app.py", *sorted((ROOT / "utils").glob("*.py"))]:
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def page_digest(module: str) -> str:
+    return file_digest(ROOT / "pages" / f"{module}.py")
+
+
+def stale_pages(manifest: dict, pages, out_dir: Path, code: str, modules: dict) -> list:
+    """Pages whose code, data files or output changed since they were last exported."""
+    stale = []
+    for page in pages:
+        entry = manifest.get("pages", {}).get(page)
+        if (entry is None or entry.get("code") != code
+                or entry["source"] != page_digest(modules[page])
+                or not (out_dir / f"{page}.html").exists()
+                or any(not (out_dir / path).exists() for path in entry["figures"])
+                or any(not Path(path).exists() or file_digest(Path(path)) != digest
+                       for path, digest in entry["data"].items())):
+            stale.append(page)
+    return stale
+
+
+def export_site(out_dir="site", workers=None, pages=None, force=False) -> dict:
+    """Export (or incrementally update) the static bundle; returns the new manifest."""
+    from app import PAGE_MODULES
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    pages = list(pages or PAGE_MODULES)
+    manifest_path = out / MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    assets = write_assets(out)
+    code = code_digest() + json.dumps(assets, sort_keys=True)
+    todo = list(pages) if force else stale_pages(manifest, pages, out, code, PAGE_MODULES)
+    # Pages outside this run keep their entries (stale ones stay marked by their code
+    # digest): their HTML is still on disk and references their figures.
+    entries = dict(manifest.get("pages", {}))
+
+    if todo:
+        # Spawned, single-use workers: a clean interpreter per page (one page per worker)
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(todo)),
+                                 mp_context=get_context("spawn"), max_tasks_per_child=1) as pool:
+            results = pool.map(export_page, todo, [str(out)] * len(todo), [assets] * len(todo))
+            for result in results:
+                page = result.pop("page")
+                entries[page] = {"code": code, "source": page_digest(PAGE_MODULES[page]), **result}
+                print(f"  {page:14s} {result['ms']:8.0f} ms  {len(result['figures']):3d} figures  "
+                      f"{len(result['data'])} data files")
+
+    index = out / "overview.html"
+    if not index.exists():
+        index = out / f"{pages[0]}.html"
+    write_atomic(out / "index.html", lambda tmp: tmp.write_bytes(index.read_bytes()))
+
+    # Figures no exported page references any more (old content hashes)
+    referenced = {path for entry in entries.values() for path in entry["figures"]}
+    for path in (out / "figures").glob("*.json"):
+        if f"figures/{path.name}" not in referenced:
+            path.unlink()
+
+    manifest = {"assets": assets, "pages": entries}
+    write_atomic(manifest_path, lambda tmp: tmp.write_text(json.dumps(manifest, indent=2)))
+    print(f"exported {len(todo)} page(s), {len(pages) - len(todo)} unchanged -> {out}/")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the dashboard as a static site.")
+    parser.add_argument("--out", default="site", help="output directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--pages", nargs="+", help="page keys to export (default: all)")
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and rebuild every page")
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    export_site(args.out, args.workers, args.pages, args.force)
+    print(f"done in {time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,17 @@ import pandas as pd
 import streamlit as st
 from pathlib import Path
 
+from utils.dtype_plan import apply_dtype_plan, infer_dtype_plan, is_plan_applied
+
 def safe_dataframe(df: pd.DataFrame, **kwargs):
-    """Ensure DataFrame is Arrow-safe before displaying."""
-    for col in df.columns:
-        if df[col].dtype == "object":
-            try:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-            except:
-                df[col] = df[col].astype(str)
+    """
+    Ensure DataFrame is Arrow-safe before displaying.
+
+    Frames that already follow a dtype plan (everything from ``load_all_data``) are
+    passed through untouched; anything else is converted on a copy, never in place.
+    """
+    if not is_plan_applied(df):
+        df = apply_dtype_plan(df, infer_dtype_plan(df))
     st.dataframe(df, **kwargs)
 
 def safe_image(path_or_data, **kwargs):